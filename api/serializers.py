@@ -16,6 +16,7 @@ from django.db import transaction
 from rest_framework import serializers
 
 from championship.models import Event, EventOrganizer, Player, Result
+from championship.score.generic import invalidate_event_scores
 from championship.tournament_valid import StandingsValidationError, validate_standings
 
 
@@ -26,13 +27,25 @@ class PlayerField(serializers.Field):
         return player.get_name_display()
 
     def to_internal_value(self, name: str):
-        player, _ = Player.objects.get_or_create_by_name(name)
-        return player
+        # Names are resolved to players by ResultListSerializer, all at once.
+        return name
+
+
+class ResultListSerializer(serializers.ListSerializer):
+    """Resolves the players of all the results with a few queries."""
+
+    def to_internal_value(self, data):
+        results = super().to_internal_value(data)
+        players = Player.objects.get_or_create_by_names([r["player"] for r in results])
+        for result, player in zip(results, players):
+            result["player"] = player
+        return results
 
 
 class ResultSerializer(serializers.ModelSerializer):
     class Meta:
         model = Result
+        list_serializer_class = ResultListSerializer
         fields = [
             "player",
             "single_elimination_result",
@@ -116,17 +129,24 @@ class EventInformationSerializer(serializers.ModelSerializer):
 
         results.sort(key=lambda r: 3 * r["win_count"] + r["draw_count"], reverse=True)
 
-        for i, result in enumerate(results):
-            Result.objects.create(
-                points=3 * result["win_count"] + result["draw_count"],
-                player=result["player"],
-                event=instance,
-                ranking=i + 1,
-                win_count=result["win_count"],
-                loss_count=result["loss_count"],
-                draw_count=result["draw_count"],
-                playoff_result=result["playoff_result"],
-            )
+        Result.objects.bulk_create(
+            [
+                Result(
+                    points=3 * result["win_count"] + result["draw_count"],
+                    player=result["player"],
+                    event=instance,
+                    ranking=i + 1,
+                    win_count=result["win_count"],
+                    loss_count=result["loss_count"],
+                    draw_count=result["draw_count"],
+                    playoff_result=result["playoff_result"],
+                )
+                for i, result in enumerate(results)
+            ]
+        )
+        # bulk_create sends no signals, this updates the aggregates of the
+        # event and invalidates its scores once for all the results.
+        invalidate_event_scores(instance)
 
         return res
 
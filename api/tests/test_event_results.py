@@ -83,6 +83,27 @@ class TestEventResultsAPI(APITestCase):
             Result.PlayoffResult.WINNER,
         )
 
+    def test_send_results_updates_event_aggregates(self):
+        self.client.login(**self.credentials)
+        data = {
+            "results": [
+                {
+                    "player": f"Player {i}",
+                    "win_count": 3 - i,
+                    "draw_count": 0,
+                    "loss_count": i,
+                    "single_elimination_result": 1 if i == 0 else None,
+                }
+                for i in range(3)
+            ],
+        }
+        self.client.patch(self.url, data=data, format="json")
+
+        self.event.refresh_from_db()
+        self.assertEqual(
+            (3, 3, 1), (self.event.size, self.event.rounds, self.event.top_count)
+        )
+
     def test_send_results_player_alias(self):
         player = PlayerFactory()
         PlayerAlias.objects.create(name="Darth Vader", true_player=player)
@@ -18,8 +18,8 @@ from django.utils.safestring import mark_safe
 
 from articles.parser import CardTag, DecklistTag, ImageTag, extract_tags
 from decklists.models import Decklist
-from decklists.views import get_decklist_table_context
-from oracle.models import Card, get_card_by_name
+from decklists.views import get_cards_for_decklists, get_decklist_table_context
+from oracle.models import get_cards_by_names
 
 register = template.Library()
 
@@ -30,24 +30,36 @@ def process_article_args(text: str):
     card_template = get_template("decklists/card_modal_instance.html")
     decklist_section_template = get_template("articles/decklist_card.html")
 
-    for chunk in extract_tags(text):
+    # All the cards and decklists of the article are loaded at once.
+    chunks = list(extract_tags(text))
+    decklists = Decklist.objects.select_related("player", "collection__event").in_bulk(
+        [chunk.uid for chunk in chunks if isinstance(chunk, DecklistTag)]
+    )
+    cards_by_name = get_cards_for_decklists(decklists.values())
+    cards_by_name.update(
+        get_cards_by_names(
+            chunk.card_name
+            for chunk in chunks
+            if isinstance(chunk, CardTag) and chunk.card_name not in cards_by_name
+        )
+    )
+
+    for chunk in chunks:
         if isinstance(chunk, str):
             result.append(chunk)
         elif isinstance(chunk, CardTag):
-            try:
-                card = get_card_by_name(chunk.card_name)
+            if card := cards_by_name.get(chunk.card_name):
                 rendered = card_template.render(context={"card": card})
                 result.append(mark_safe(rendered))
-            except Card.DoesNotExist:
+            else:
                 result.append(f"[[{chunk.card_name}]]")
         elif isinstance(chunk, DecklistTag):
-            try:
-                decklist = Decklist.objects.select_related(
-                    "player", "collection__event"
-                ).get(id=chunk.uid)
-                context = get_decklist_table_context(decklist)
+            if decklist := decklists.get(Decklist._meta.pk.to_python(chunk.uid)):
+                context = get_decklist_table_context(
+                    decklist, cards_by_name=cards_by_name
+                )
                 result.append(decklist_section_template.render(context=context))
-            except Decklist.DoesNotExist:
+            else:
                 result.append(f"Unknown decklist {chunk.uid}")
         elif isinstance(chunk, ImageTag):
             result.append(
@@ -20,7 +20,7 @@ from django.conf import settings
 from django.contrib import admin, messages
 from django.contrib.sites.models import Site
 from django.db import transaction
-from django.db.models import Count, Q
+from django.db.models import Q
 from django.http import HttpResponseRedirect
 from django.shortcuts import redirect, render
 from django.urls import path, reverse
@@ -28,7 +28,7 @@ from django.urls import path, reverse
 import openpyxl
 from django_countries.fields import CountryField
 
-from championship.score import get_leaderboard
+from championship.score import get_top_n
 from championship.seasons.helpers import (
     find_season_by_slug,
     get_default_season,
@@ -211,9 +211,9 @@ class PlayerAdmin(admin.ModelAdmin):
             num_of_players = form.cleaned_data["num_of_players"]
             season = find_season_by_slug(form.cleaned_data["season"])
             if country := form.cleaned_data.get("country"):
-                top_players = get_leaderboard(season, country)[:num_of_players]
+                top_players = get_top_n(season, country, n=num_of_players)
             else:
-                top_players = get_leaderboard(season)[:num_of_players]
+                top_players = get_top_n(season, n=num_of_players)
             entries = [
                 {
                     "rank": i + 1,
@@ -473,10 +473,7 @@ class EventOrganizerAdmin(admin.ModelAdmin):
     @admin.display(description="Last event with published results")
     def last_event_with_results(self, instance):
         event = (
-            Event.objects.filter(organizer=instance)
-            .annotate(result_cnt=Count("result"))
-            .exclude(result_cnt=0)
-            .order_by("-date")
+            Event.objects.filter(organizer=instance).exclude(size=0).order_by("-date")
         )
 
         if event.count() > 0:
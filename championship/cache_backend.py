@@ -0,0 +1,153 @@
+# Copyright 2026 Leonin League
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.filebased import FileBasedCache
+
+# Entries are stored along with their version, so they do not have the format
+# of a plain file based cache. Keys are prefixed with this, so that the files
+# that one wrote in the same directory are never read.
+ENTRY_FORMAT = "two-tier"
+
+
+def _version_key(key):
+    return f"{key}:version"
+
+
+class TwoTierCache(FileBasedCache):
+    """File based cache with an in-memory LRU cache in front of it.
+
+    Values read from or written to the files are also kept in the memory of
+    the process, so that hot keys are served without reading and unpickling
+    their file. Values returned from memory are shared between callers and
+    must not be modified.
+
+    To stay coherent between processes, each write stores a random version
+    along with the value, and in a small separate entry. A value kept in
+    memory is only returned while that entry still holds its version, so that
+    writes and deletes from other processes are seen right away, and only
+    the keys that changed are read again. As files are replaced on each
+    write, the version entry is only read again when its file changed, hence
+    a value served from memory only costs a stat() of that file.
+
+    Supported OPTIONS, on top of the ones of the file based cache:
+    - LOCAL_MAX_ENTRIES: number of values kept in memory (default 128).
+    """
+
+    def __init__(self, dir, params):
+        super().__init__(dir, params)
+        self.key_prefix = f"{ENTRY_FORMAT}:{self.key_prefix}"
+        options = params.get("OPTIONS", {})
+        self._local_max_entries = int(options.get("LOCAL_MAX_ENTRIES", 128))
+        self._local: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _version_stat(self, key, version):
+        try:
+            stat = os.stat(self._key_to_file(_version_key(key), version))
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _local_get(self, key, version):
+        local_key = self.make_and_validate_key(key, version)
+        with self._lock:
+            entry = self._local.get(local_key)
+        if entry is None:
+            return None, False
+
+        expiry, value_version, value, checked_stat = entry
+        # The file is looked at before it is read, so that a version written
+        # in between is read again on next access.
+        stat = self._version_stat(key, version)
+        if (
+            (expiry is not None and expiry <= time.time())
+            or stat is None
+            or (
+                stat != checked_stat
+                and value_version != super().get(_version_key(key), version=version)
+            )
+        ):
+            self._local_delete(key, version)
+            return None, False
+
+        with self._lock:
+            if local_key in self._local:
+                self._local[local_key] = (expiry, value_version, value, stat)
+                self._local.move_to_end(local_key)
+        return value, True
+
+    def _local_set(self, key, version, entry):
+        local_key = self.make_and_validate_key(key, version)
+        with self._lock:
+            # The version entry is read on first access
+            self._local[local_key] = (*entry, None)
+            self._local.move_to_end(local_key)
+            while len(self._local) > self._local_max_entries:
+                self._local.popitem(last=False)
+
+    def _local_delete(self, key, version):
+        with self._lock:
+            self._local.pop(self.make_and_validate_key(key, version), None)
+
+    def _entry(self, value, timeout):
+        return (self.get_backend_timeout(timeout), uuid.uuid4().hex, value)
+
+    def get(self, key, default=None, version=None):
+        value, found = self._local_get(key, version)
+        if found:
+            return value
+
+        entry = super().get(key, version=version)
+        if entry is None:
+            return default
+        self._local_set(key, version, entry)
+        return entry[2]
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        entry = self._entry(value, timeout)
+        # The value is written before its version, so that other processes
+        # never validate an older value against the new version.
+        super().set(key, entry, timeout, version)
+        super().set(_version_key(key), entry[1], timeout, version)
+        self._local_set(key, version, entry)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        # Locks are taken with add, hence it always looks at the files.
+        if super().has_key(key, version):
+            return False
+        self.set(key, value, timeout, version)
+        return True
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        # Values in memory keep their previous expiry, they are read again
+        # from the files once it passes.
+        super().touch(_version_key(key), timeout, version)
+        return super().touch(key, timeout, version)
+
+    def delete(self, key, version=None):
+        self._local_delete(key, version)
+        super().delete(_version_key(key), version)
+        return super().delete(key, version)
+
+    def clear(self):
+        with self._lock:
+            self._local.clear()
+        super().clear()
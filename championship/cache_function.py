@@ -12,24 +12,180 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+import math
+import random
+import time
+
 from django.core.cache import cache
 
+from prometheus_client import Counter, Summary
+
+# How long a value can be computed before another caller takes over.
+REFRESH_LOCK_TTL = 5 * 60
+
+# How long callers wait for a value computed by somebody else in single-flight
+# mode, before computing it themselves.
+SINGLE_FLIGHT_WAIT = 10
+SINGLE_FLIGHT_POLL_INTERVAL = 0.1
+
+cache_function_calls = Counter(
+    "cache_function_calls",
+    "Calls to cached functions, by where the value came from.",
+    ["function", "result"],
+)
+cache_function_compute_seconds = Summary(
+    "cache_function_compute_seconds",
+    "Time spent computing the values of cached functions.",
+    ["function"],
+)
+
+
+def _fresh_key(key):
+    return f"{key}:fresh"
+
+
+def _refresh_lock_key(key):
+    return f"{key}:refreshing"
+
+
+def _expiry_key(key):
+    return f"{key}:expiry"
+
+
+def cache_function(
+    cache_key,
+    cache_ttl=60,
+    stale_ttl=None,
+    single_flight=False,
+    early_expiration=0,
+):
+    """Caches the return value of the decorated function for cache_ttl seconds.
+
+    The following options control how values get computed again:
+    - stale_ttl: the value is kept stale_ttl more seconds once it expires or
+      is invalidated. During that time, callers get the stale value while a
+      single one of them computes the new value (stale-while-revalidate).
+    - single_flight: when there is no value at all, only one caller computes
+      it while the others wait for it, instead of all computing it at once.
+    - early_expiration: a value may be computed again shortly before it
+      expires, with a probability growing as expiry gets closer and as the
+      computation gets longer (see "Optimal Probabilistic Cache Stampede
+      Prevention", Vattani et al.). 1 is a good default, higher values
+      recompute earlier.
+
+    Calls are counted in the cache_function_calls metric, labelled with the
+    name of the function and where the value came from.
+
+    The decorated function also gets the following attributes:
+    - refresh(*args, **kwargs) computes and caches the value, even if the
+      cached one is still fresh.
+    - invalidate(keys) makes the cached values of the given keys expire.
+    - __wrapped__ is the original function, which does not use the cache.
+    """
 
-def cache_function(cache_key, cache_ttl=60):
     def wrap(f):
-        def wrapped(*args, **kwargs):
+        name = f"{f.__module__}.{f.__qualname__}"
+
+        def key(*args, **kwargs):
             if callable(cache_key):
-                k = cache_key(*args, **kwargs)
+                return cache_key(*args, **kwargs)
             else:
-                k = cache_key
-
-            if (cached := cache.get(k)) is not None:
-                return cached
+                return cache_key
 
+        def compute(k, *args, **kwargs):
+            start = time.monotonic()
             res = f(*args, **kwargs)
-            cache.set(k, res, cache_ttl)
+            duration = time.monotonic() - start
+            cache_function_compute_seconds.labels(name).observe(duration)
+
+            if stale_ttl is None:
+                cache.set(k, res, cache_ttl)
+            else:
+                # The value is written before marking it fresh, so readers
+                # never see a fresh marker next to an older value.
+                cache.set(k, res, cache_ttl + stale_ttl)
+                cache.set(_fresh_key(k), True, cache_ttl)
+            if early_expiration:
+                cache.set(
+                    _expiry_key(k), (time.time() + cache_ttl, duration), cache_ttl
+                )
             return res
 
+        def compute_locked(k, *args, **kwargs):
+            try:
+                return compute(k, *args, **kwargs)
+            finally:
+                cache.delete(_refresh_lock_key(k))
+
+        def get_entries(k):
+            keys = [k]
+            if stale_ttl is not None:
+                keys.append(_fresh_key(k))
+            if early_expiration:
+                keys.append(_expiry_key(k))
+
+            if len(keys) == 1:
+                cached = cache.get(k)
+                return {} if cached is None else {k: cached}
+            return cache.get_many(keys)
+
+        def is_stale(k, entries):
+            if stale_ttl is not None and _fresh_key(k) not in entries:
+                return True
+            if early_expiration and (expiry := entries.get(_expiry_key(k))):
+                expires_at, duration = expiry
+                # 1 - random() is in (0, 1], whose log is negative or zero.
+                jitter = -duration * early_expiration * math.log(1 - random.random())
+                return time.time() + jitter >= expires_at
+            return False
+
+        def wait_for_value(k):
+            deadline = time.monotonic() + SINGLE_FLIGHT_WAIT
+            while time.monotonic() < deadline:
+                time.sleep(SINGLE_FLIGHT_POLL_INTERVAL)
+                if (cached := cache.get(k)) is not None:
+                    return cached
+            return None
+
+        def refresh(*args, **kwargs):
+            k = key(*args, **kwargs)
+            cache.set(_refresh_lock_key(k), True, REFRESH_LOCK_TTL)
+            return compute_locked(k, *args, **kwargs)
+
+        @functools.wraps(f)
+        def wrapped(*args, **kwargs):
+            k = key(*args, **kwargs)
+
+            entries = get_entries(k)
+            if (cached := entries.get(k)) is None:
+                cache_function_calls.labels(name, "miss").inc()
+                if not single_flight:
+                    return compute(k, *args, **kwargs)
+                if cache.add(_refresh_lock_key(k), True, REFRESH_LOCK_TTL):
+                    return compute_locked(k, *args, **kwargs)
+                if (cached := wait_for_value(k)) is not None:
+                    return cached
+                return compute(k, *args, **kwargs)
+
+            if not is_stale(k, entries):
+                cache_function_calls.labels(name, "hit").inc()
+                return cached
+
+            cache_function_calls.labels(name, "stale").inc()
+            if cache.add(_refresh_lock_key(k), True, REFRESH_LOCK_TTL):
+                return compute_locked(k, *args, **kwargs)
+            # Somebody else is already computing the new value.
+            return cached
+
+        def invalidate(keys):
+            if stale_ttl is None:
+                cache.delete_many(keys)
+            else:
+                cache.delete_many([_fresh_key(k) for k in keys])
+
+        wrapped.refresh = refresh
+        wrapped.invalidate = invalidate
         return wrapped
 
     return wrap
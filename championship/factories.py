@@ -42,8 +42,8 @@ from .seasons.definitions import SEASON_2023, SEASON_2024, SEASON_2025
 
 class MagicProvider(BaseProvider):
     def mtg_event_name(self):
-        f = random.choice(["Modern", "Legacy", "Standard"])
-        t = random.choice(["1k", "2k", "Open", "RCQ"])
+        f = self.random_element(["Modern", "Legacy", "Standard"])
+        t = self.random_element(["1k", "2k", "Open", "RCQ"])
         return f"{f} {t}"
 
 
@@ -351,8 +351,7 @@ class AddTop8ResultsForm(forms.Form, SubmitButtonMixin):
 
         # Make playing the whole top8 mandatory for event above 16 players.
         # Source: MTR Appendix E
-        event_size = event.result_set.count()
-        if event_size > 16:
+        if event.size > 16:
             for key, field in self.fields.items():
                 if key.startswith("quarter"):
                     field.required = True
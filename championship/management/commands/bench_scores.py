@@ -0,0 +1,267 @@
+# Copyright 2026 Leonin League
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import json
+import math
+import random
+import statistics
+import time
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from championship.factories import EventFactory, EventOrganizerFactory, PlayerFactory
+from championship.models import (
+    Event,
+    Player,
+    PlayerSeasonData,
+    Result,
+    ResultScore,
+    SpecialReward,
+)
+from championship.score.generic import (
+    SCOREMETHOD_PER_SEASON,
+    compute_scores,
+    get_results_with_qps,
+    get_season_scores,
+)
+from championship.seasons.definitions import Season
+from championship.seasons.helpers import get_seasons_with_scores
+from multisite.constants import SWISS_DOMAIN
+
+CATEGORY_WEIGHTS = {
+    Event.Category.REGULAR: 85,
+    Event.Category.REGIONAL: 12,
+    Event.Category.PREMIER: 3,
+}
+
+
+def create_synthetic_season(
+    season: Season,
+    results_count: int,
+    event_size: int,
+    rng: random.Random,
+    rewards_count: int = 0,
+):
+    """Creates about results_count results in events spread over the season.
+
+    Each player plays about 8 events. Events other than regular ones get a top
+    8 and players are given a record consistent with their ranking. Up to
+    rewards_count random results get a special reward with a bye.
+
+    Returns the number of results and of special rewards created.
+    """
+    organizer = EventOrganizerFactory()
+    players = Player.objects.bulk_create(
+        PlayerFactory.build_batch(max(results_count // 8, event_size))
+    )
+    if Site.objects.get_current().domain != SWISS_DOMAIN:
+        PlayerSeasonData.objects.bulk_create(
+            [
+                PlayerSeasonData(
+                    player=player,
+                    season_slug=season.slug,
+                    country=settings.DEFAULT_COUNTRY,
+                )
+                for player in players
+            ]
+        )
+
+    days = (season.end_date - season.start_date).days
+    events = Event.objects.bulk_create(
+        [
+            EventFactory.build(
+                organizer=organizer,
+                date=season.start_date + datetime.timedelta(days=rng.randint(0, days)),
+                category=rng.choices(
+                    list(CATEGORY_WEIGHTS), weights=CATEGORY_WEIGHTS.values()
+                )[0],
+            )
+            for _ in range(max(results_count // event_size, 1))
+        ]
+    )
+
+    rounds = math.ceil(math.log2(event_size))
+    results = []
+    for event in events:
+        for i, player in enumerate(rng.sample(players, event_size)):
+            win_count = round(rounds * (1 - i / event_size))
+            playoff_result = None
+            if event.category != Event.Category.REGULAR and i < 8:
+                playoff_result = [1, 2, 4, 4, 8, 8, 8, 8][i]
+            results.append(
+                Result(
+                    event=event,
+                    player=player,
+                    ranking=i + 1,
+                    points=3 * win_count,
+                    win_count=win_count,
+                    loss_count=rounds - win_count,
+                    draw_count=0,
+                    playoff_result=playoff_result,
+                )
+            )
+    Result.objects.bulk_create(results, batch_size=5000)
+    Event.objects.filter(
+        pk__in=[event.pk for event in events]
+    ).update_result_aggregates()
+    rewards = SpecialReward.objects.bulk_create(
+        [
+            SpecialReward(result=result, byes=1)
+            for result in rng.sample(results, min(rewards_count, len(results)))
+        ]
+    )
+    return len(results), len(rewards)
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmarks the score methods on synthetic seasons. The data is "
+        "created in a transaction that is rolled back at the end, on top of the "
+        "data already in the database: use an empty database for numbers that "
+        "can be compared between commits."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--results",
+            type=int,
+            action="append",
+            help="Number of results in each synthetic season (can be repeated, default 1000 and 10000).",
+        )
+        parser.add_argument(
+            "--season",
+            "-s",
+            action="append",
+            dest="seasons",
+            help="Only benchmark this season (can be repeated).",
+        )
+        parser.add_argument(
+            "--event-size",
+            type=int,
+            default=32,
+            help="Number of players in each event (default 32).",
+        )
+        parser.add_argument(
+            "--rewards-per-thousand",
+            type=int,
+            default=10,
+            help="Number of special rewards with a bye per 1000 results (default 10).",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Number of times each step is timed (default 3).",
+        )
+        parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+        parser.add_argument(
+            "--label", default="", help="Label of this run, for example a commit."
+        )
+        parser.add_argument(
+            "--output", help="Write the results as JSON to this file instead."
+        )
+
+    def handle(self, *args, **options):
+        seasons = [
+            season
+            for season in get_seasons_with_scores()
+            if season.main_season
+            and (not options["seasons"] or season.slug in options["seasons"])
+        ]
+        rows = []
+        for results_count in options["results"] or [1000, 10000]:
+            for season in seasons:
+                rows += self.bench_season(season, results_count, options)
+
+        output = json.dumps(rows, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                f.write(output)
+        else:
+            self.stdout.write(output)
+
+    def bench_season(self, season: Season, results_count: int, options) -> list[dict]:
+        rng = random.Random(options["seed"])
+        method = SCOREMETHOD_PER_SEASON[season]
+
+        def reset_result_scores():
+            ResultScore.objects.filter(season_slug=season.slug).delete()
+
+        steps = [
+            (
+                "compute_scores_cold",
+                reset_result_scores,
+                lambda: compute_scores.__wrapped__(season),
+            ),
+            ("compute_scores_warm", None, lambda: compute_scores.__wrapped__(season)),
+            (
+                "get_results_with_qps",
+                None,
+                lambda: list(get_results_with_qps(Result.objects.in_season(season))),
+            ),
+        ]
+
+        rows = []
+        with transaction.atomic():
+            created, rewards = create_synthetic_season(
+                season,
+                results_count,
+                options["event_size"],
+                rng,
+                rewards_count=results_count * options["rewards_per_thousand"] // 1000,
+            )
+            scores_by_player, _ = get_season_scores(season)
+            steps.append(
+                (
+                    "finalize_scores",
+                    None,
+                    lambda: method.finalize_scores(
+                        scores_by_player, settings.DEFAULT_COUNTRY
+                    ),
+                )
+            )
+
+            for step, setup, run in steps:
+                timings = []
+                for _ in range(options["repeat"]):
+                    if setup:
+                        setup()
+                    with CaptureQueriesContext(connection) as queries:
+                        start = time.perf_counter()
+                        run()
+                        timings.append(time.perf_counter() - start)
+                rows.append(
+                    {
+                        "label": options["label"],
+                        "season": season.slug,
+                        "score_method": method.__name__,
+                        "results": created,
+                        "rewards": rewards,
+                        "step": step,
+                        "seconds_min": min(timings),
+                        "seconds_median": statistics.median(timings),
+                        "queries": len(queries),
+                    }
+                )
+                self.stderr.write(
+                    f"{season.slug} {created} results, {rewards} rewards {step}: "
+                    f"{min(timings):.3f}s, {len(queries)} queries"
+                )
+            transaction.set_rollback(True)
+        return rows
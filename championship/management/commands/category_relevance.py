@@ -18,7 +18,7 @@ from django.core.management.base import BaseCommand
 from prettytable import PrettyTable
 
 from championship.models import Event, Result
-from championship.score.generic import get_leaderboard, get_results_with_qps
+from championship.score.generic import get_results_with_qps, get_top_n
 from championship.seasons.helpers import (
     find_season_by_slug,
     get_all_seasons,
@@ -55,7 +55,7 @@ class Command(BaseCommand):
         )
         table.align["Name"] = "l"
 
-        leaderboard = get_leaderboard(season)[:top]
+        leaderboard = get_top_n(season, n=top)
         points_per_player_per_category = {
             p: {
                 Event.Category.REGULAR: 0,
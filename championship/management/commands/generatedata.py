@@ -14,15 +14,218 @@
 
 import datetime
 import logging
+import math
 import random
+import time
 
-from django.core.management.base import BaseCommand
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.contrib.gis.geos import Point
+from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
+from django.utils import timezone
 
 import factory
+from faker import Faker
 
-from championship.factories import EventFactory, EventOrganizerFactory, PlayerFactory
-from championship.models import Event, EventOrganizer, Player, Result
+from championship.factories import EventFactory, EventOrganizerFactory
+from championship.factories import MagicProvider as EventNameProvider
+from championship.factories import PlayerFactory
+from championship.models import Address, Event, EventOrganizer, Player, Result
+from championship.seasons.helpers import get_main_seasons
+from decklists.factories import MagicProvider as ArchetypeProvider
+from decklists.models import Collection, Decklist
+
+BATCH_SIZE = 5000
+
+# Number of players of the events of each category, in the bulk mode.
+EVENT_SIZES = {
+    Event.Category.REGULAR: (8, 32),
+    Event.Category.REGIONAL: (24, 64),
+    Event.Category.PREMIER: (48, 128),
+}
+CATEGORY_WEIGHTS = {
+    Event.Category.REGULAR: 85,
+    Event.Category.REGIONAL: 12,
+    Event.Category.PREMIER: 3,
+}
+# Share of the Regional and Premier events that collect decklists.
+DECKLISTS_RATIO = 0.5
+DECKLIST_CONTENT = """4 Lightning Bolt
+4 Monastery Swiftspear
+4 Goblin Guide
+4 Lava Spike
+4 Rift Bolt
+20 Mountain
+
+Sideboard
+4 Smash to Smithereens
+"""
+
+
+class BulkDataGenerator:
+    """Generates a large dataset with bulk_create, without sending signals.
+
+    Everything is generated from the seed, hence two runs with the same seed
+    and the same database create the same objects.
+    """
+
+    def __init__(self, seed: int):
+        self.rng = random.Random(seed)
+        self.fake = Faker("fr_CH")
+        self.fake.seed_instance(seed)
+        self.fake.add_provider(EventNameProvider)
+        self.fake.add_provider(ArchetypeProvider)
+
+    def create_organizers(self, count: int) -> list[EventOrganizer]:
+        password = make_password(None)
+        users = User.objects.bulk_create(
+            [
+                User(username=f"organizer{i}@example.com", password=password)
+                for i in range(count)
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        organizers = EventOrganizer.objects.bulk_create(
+            [
+                EventOrganizer(
+                    name=self.fake.company(),
+                    contact=user.username,
+                    description=self.fake.text(),
+                    user=user,
+                )
+                for user in users
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        # Addresses are placed in Switzerland instead of being geocoded.
+        addresses = Address.objects.bulk_create(
+            [
+                Address(
+                    location_name=organizer.name,
+                    street_address=self.fake.street_address(),
+                    city=self.fake.city(),
+                    postal_code=self.fake.postcode(),
+                    region=self.rng.choice(Address.Region.values),
+                    country="CH",
+                    organizer=organizer,
+                    position=Point(
+                        self.rng.uniform(6.0, 10.4), self.rng.uniform(45.9, 47.7)
+                    ),
+                )
+                for organizer in organizers
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        for organizer, address in zip(organizers, addresses):
+            organizer.default_address = address
+        EventOrganizer.objects.bulk_update(
+            organizers, ["default_address"], batch_size=BATCH_SIZE
+        )
+        return organizers
+
+    def create_players(self, count: int) -> list[Player]:
+        return Player.objects.bulk_create(
+            [Player(name=self.fake.name()) for _ in range(count)],
+            batch_size=BATCH_SIZE,
+        )
+
+    def create_events(self, organizers, seasons, count_per_season) -> list[Event]:
+        events = []
+        for season in seasons:
+            days = (season.end_date - season.start_date).days
+            for _ in range(count_per_season):
+                organizer = self.rng.choice(organizers)
+                events.append(
+                    Event(
+                        name=self.fake.mtg_event_name(),
+                        organizer=organizer,
+                        address_id=organizer.default_address_id,
+                        date=season.start_date
+                        + datetime.timedelta(days=self.rng.randint(0, days)),
+                        format=self.rng.choice(Event.Format.values),
+                        category=self.rng.choices(
+                            list(CATEGORY_WEIGHTS), weights=CATEGORY_WEIGHTS.values()
+                        )[0],
+                    )
+                )
+        return Event.objects.bulk_create(events, batch_size=BATCH_SIZE)
+
+    def event_results(self, event: Event, players: list[int]) -> list[Result]:
+        size = min(self.rng.randint(*EVENT_SIZES[event.category]), len(players))
+        rounds = math.ceil(math.log2(size))
+        with_top8 = event.category != Event.Category.REGULAR
+        results = []
+        for i, player_id in enumerate(self.rng.sample(players, size)):
+            # Better ranked players win more, give or take a match.
+            expected_wins = rounds * (1 - i / size)
+            win_count = min(
+                rounds, max(0, round(expected_wins + self.rng.uniform(-1, 1)))
+            )
+            draw_count = min(rounds - win_count, self.rng.choice([0, 0, 0, 1]))
+            results.append(
+                Result(
+                    event_id=event.pk,
+                    player_id=player_id,
+                    ranking=i + 1,
+                    points=3 * win_count + draw_count,
+                    win_count=win_count,
+                    draw_count=draw_count,
+                    loss_count=rounds - win_count - draw_count,
+                    playoff_result=(
+                        [1, 2, 4, 4, 8, 8, 8, 8][i] if with_top8 and i < 8 else None
+                    ),
+                )
+            )
+        return results
+
+    def create_results(self, events, players) -> list[Result]:
+        # Setting ids is much faster than setting related objects.
+        player_ids = [player.pk for player in players]
+        results = []
+        for event in events:
+            results += self.event_results(event, player_ids)
+        results = Result.objects.bulk_create(results, batch_size=BATCH_SIZE)
+        # Only the generated events exist, see handle_bulk.
+        Event.objects.update_result_aggregates()
+        return results
+
+    def create_decklists(self, events, results) -> list[Decklist]:
+        results_by_event: dict[int, list[Result]] = {}
+        for result in results:
+            results_by_event.setdefault(result.event_id, []).append(result)
+
+        collections = []
+        for event in events:
+            if event.category == Event.Category.REGULAR:
+                continue
+            if self.rng.random() >= DECKLISTS_RATIO:
+                continue
+            deadline = timezone.make_aware(
+                datetime.datetime.combine(event.date, datetime.time(10))
+            )
+            collections.append(
+                Collection(
+                    event_id=event.pk,
+                    submission_deadline=deadline,
+                    publication_time=deadline + datetime.timedelta(hours=1),
+                )
+            )
+        collections = Collection.objects.bulk_create(collections, batch_size=BATCH_SIZE)
+
+        return Decklist.objects.bulk_create(
+            [
+                Decklist(
+                    collection=collection,
+                    player_id=result.player_id,
+                    archetype=self.fake.deck_archetype(),
+                    content=DECKLIST_CONTENT,
+                )
+                for collection in collections
+                for result in results_by_event[collection.event_id]
+            ],
+            batch_size=BATCH_SIZE,
+        )
 
 
 class Command(BaseCommand):
@@ -47,9 +250,74 @@ class Command(BaseCommand):
             default=50,
             help="Number of players to generate (default 50)",
         )
+        parser.add_argument(
+            "--bulk",
+            action="store_true",
+            help="Generate a large dataset quickly, with events_count events in each season. Needs an empty database.",
+        )
+        parser.add_argument(
+            "--seasons_count",
+            type=int,
+            default=5,
+            help="Number of past seasons to fill in bulk mode (default 5)",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Random seed of the bulk mode (default 0)",
+        )
+
+    def handle(self, bulk, *args, **kwargs):
+        if bulk:
+            self.handle_bulk(*args, **kwargs)
+        else:
+            self.handle_factories(*args, **kwargs)
+
+    @transaction.atomic
+    def handle_bulk(
+        self,
+        players_count,
+        organizers_count,
+        events_count,
+        seasons_count,
+        seed,
+        *args,
+        **kwargs,
+    ):
+        # Deleting existing data one object at a time would take longer than
+        # generating the new one.
+        if Player.objects.exists() or Event.objects.exists():
+            raise CommandError(
+                "The bulk mode needs an empty database, run ./manage.py flush first."
+            )
+
+        today = datetime.date.today()
+        seasons = sorted(s for s in get_main_seasons() if s.start_date <= today)
+        seasons = seasons[-seasons_count:]
+
+        generator = BulkDataGenerator(seed)
+        start = time.monotonic()
+
+        def log_created(objects, name):
+            elapsed = time.monotonic() - start
+            self.stderr.write(f"{len(objects)} {name} created ({elapsed:.1f}s)")
+
+        organizers = generator.create_organizers(organizers_count)
+        log_created(organizers, "organizers")
+        players = generator.create_players(players_count)
+        log_created(players, "players")
+        events = generator.create_events(organizers, seasons, events_count)
+        log_created(events, "events")
+        results = generator.create_results(events, players)
+        log_created(results, "results")
+        decklists = generator.create_decklists(events, results)
+        log_created(decklists, "decklists")
 
     @transaction.atomic
-    def handle(self, players_count, organizers_count, events_count, *args, **kwargs):
+    def handle_factories(
+        self, players_count, organizers_count, events_count, *args, **kwargs
+    ):
         logging.info("Deleting old data...")
         models = [Result, Player, Event, EventOrganizer]
         for m in models:
@@ -14,7 +14,6 @@
 
 
 from django.core.management.base import BaseCommand
-from django.db.models import Count
 
 from prettytable import PrettyTable
 
@@ -50,9 +49,8 @@ class Command(BaseCommand):
 
         for e in (
             Event.objects.exclude(category=Event.Category.REGULAR)
-            .annotate(results_count=Count("result"))
             .filter(
-                results_count__gt=0,
+                size__gt=0,
                 date__lte=season.end_date,
                 date__gte=season.start_date,
                 include_in_invoices=True,
@@ -0,0 +1,84 @@
+# Copyright 2026 Leonin League
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.management.base import BaseCommand
+
+from prometheus_client import CollectorRegistry, Gauge, push_to_gateway
+
+from championship.models import PlayerSeasonData
+from championship.score.generic import compute_scores
+from championship.seasons.definitions import Season
+from championship.seasons.helpers import get_seasons_with_scores
+from multisite.constants import SWISS_DOMAIN
+
+metrics_registry = CollectorRegistry()
+leaderboards_warmed = Gauge(
+    "leaderboards_warmed_count",
+    "Number of leaderboards computed by the last script run.",
+    registry=metrics_registry,
+)
+last_success = Gauge(
+    "job_last_success_unixtime",
+    "Last time a job finished succesfully",
+    registry=metrics_registry,
+)
+
+
+def countries_for_season(season: Season) -> list[str]:
+    """Returns the countries that have a leaderboard in the given season."""
+    if Site.objects.get_current().domain == SWISS_DOMAIN:
+        return [settings.DEFAULT_COUNTRY]
+
+    countries = set(
+        PlayerSeasonData.objects.filter(season_slug=season.slug).values_list(
+            "country", flat=True
+        )
+    )
+    countries.add(settings.DEFAULT_COUNTRY)
+    return sorted(countries)
+
+
+class Command(BaseCommand):
+    help = "Computes the leaderboards of all seasons ahead of their expiry, so that visitors do not have to wait for them."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--season",
+            "-s",
+            action="append",
+            dest="seasons",
+            help="Only warm the leaderboards of this season (can be repeated).",
+        )
+        parser.add_argument(
+            "--pushgateway", help="Address to the Prometheus pushgateway"
+        )
+
+    def handle(self, seasons, pushgateway, *args, **kwargs):
+        count = 0
+        for season in get_seasons_with_scores():
+            if seasons and season.slug not in seasons:
+                continue
+            for country in countries_for_season(season):
+                compute_scores.refresh(season, country)
+                count += 1
+                self.stdout.write(f"Computed leaderboard {season.slug} {country}")
+
+        leaderboards_warmed.set(count)
+        last_success.set_to_current_time()
+        if pushgateway:
+            push_to_gateway(
+                pushgateway, job="league-warm-leaderboards", registry=metrics_registry
+            )
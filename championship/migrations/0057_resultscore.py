@@ -0,0 +1,85 @@
+# Copyright 2026 Leonin League
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Generated by Django 5.0.14 on 2026-10-17 09:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("championship", "0056_address_position"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ResultScore",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("season_slug", models.CharField(max_length=50)),
+                (
+                    "category",
+                    models.CharField(
+                        choices=[
+                            ("REGULAR", "Regular"),
+                            ("REGIONAL", "Regional"),
+                            ("PREMIER", "Premier"),
+                            ("NATIONAL", "National"),
+                            ("QUALIFIER", "Qualifier"),
+                            ("GRAND_PRIX", "Grand Prix"),
+                            ("OTHER", "Other"),
+                        ],
+                        help_text="Category of the event when the result was scored.",
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "qps",
+                    models.IntegerField(
+                        help_text="Points awarded for the result, or None if it does not score in this season.",
+                        null=True,
+                    ),
+                ),
+                ("byes", models.PositiveIntegerField(default=0)),
+                (
+                    "result",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="championship.result",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["season_slug"], name="resultscore_season_idx")
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="resultscore",
+            constraint=models.UniqueConstraint(
+                fields=("result", "season_slug"), name="unique_result_season"
+            ),
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Copyright 2026 Leonin League
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Generated by Django 5.0.14 on 2026-10-17 10:31
+
+from django.db import migrations, models
+from django.db.models import Count, F, Max, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def compute_result_aggregates(apps, schema_editor):
+    Event = apps.get_model("championship", "Event")
+    Result = apps.get_model("championship", "Result")
+    results = Result.objects.filter(event=OuterRef("pk")).order_by().values("event")
+
+    def aggregate(expression):
+        return Coalesce(
+            Subquery(results.annotate(value=expression).values("value")), Value(0)
+        )
+
+    Event.objects.update(
+        size=aggregate(Count("id")),
+        rounds=aggregate(Max(F("win_count") + F("draw_count") + F("loss_count"))),
+        top_count=aggregate(Count("playoff_result")),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("championship", "0057_resultscore"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="rounds",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Number of Swiss rounds, the most matches played by a player.",
+            ),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="size",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, help_text="Number of results of the event."
+            ),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="top_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Number of players in the playoffs, 0 if there were none.",
+            ),
+        ),
+        migrations.RunPython(compute_result_aggregates, migrations.RunPython.noop),
+    ]
@@ -24,7 +24,10 @@ from django.contrib.sites.models import Site
 from django.core.exceptions import ValidationError
 from django.core.validators import validate_image_file_extension
 from django.db import models
-from django.db.models import Count, QuerySet
+from django.db.models import Count, F, Max, OuterRef, QuerySet, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.urls import reverse
 
 from dateutil.relativedelta import relativedelta
@@ -222,8 +225,7 @@ class EventQueryset(models.QuerySet):
             self.filter(organizer__user=user, date__lte=end_date)
             .exclude(date__lt=start_date, edit_deadline_override__isnull=True)
             .exclude(category=Event.Category.OTHER)
-            .annotate(result_cnt=Count("result"))
-            .filter(result_cnt=0)
+            .filter(size=0)
         )
 
         valid_event_ids = [event.id for event in initial_qs if event.can_be_edited()]
@@ -246,6 +248,24 @@ class EventQueryset(models.QuerySet):
     def on_site(self):
         return self.filter(organizer__site=settings.SITE_ID)
 
+    def update_result_aggregates(self):
+        """Computes the aggregates of the results of the events again.
+
+        All the events are updated with a single query, see Event.size.
+        """
+        results = Result.objects.filter(event=OuterRef("pk")).order_by().values("event")
+
+        def aggregate(expression):
+            return Coalesce(
+                Subquery(results.annotate(value=expression).values("value")), Value(0)
+            )
+
+        return self.update(
+            size=aggregate(Count("id")),
+            rounds=aggregate(Max(F("win_count") + F("draw_count") + F("loss_count"))),
+            top_count=aggregate(Count("playoff_result")),
+        )
+
 
 def tomorrow():
     return datetime.date.today() + datetime.timedelta(days=1)
@@ -367,6 +387,10 @@ def event_image_validator(image):
         raise ValidationError("Image file too large ( > 1.5MB )")
 
 
+# Fields of Event maintained from its results
+RESULT_AGGREGATES = ["size", "rounds", "top_count"]
+
+
 class Event(models.Model):
     """
     A single tournament in the tournament.
@@ -487,6 +511,24 @@ class Event(models.Model):
         help_text="Whether this event will be in invoices.", default=True
     )
 
+    # Aggregates over the results of the event, read when scoring and
+    # invoicing instead of being computed again by every query. They are kept
+    # up to date when results are saved or deleted, and by
+    # update_result_aggregates after results are written in bulk.
+    size = models.PositiveIntegerField(
+        default=0, editable=False, help_text="Number of results of the event."
+    )
+    rounds = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of Swiss rounds, the most matches played by a player.",
+    )
+    top_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of players in the playoffs, 0 if there were none.",
+    )
+
     def save(self, *args, **kwargs):
         if (
             self.category == Event.Category.PREMIER
@@ -562,14 +604,28 @@ class Event(models.Model):
     def season(self) -> Season | None:
         return find_main_season_by_date(self.date)
 
+    @property
+    def has_top8(self) -> bool:
+        return self.top_count > 0
+
+    def update_result_aggregates(self):
+        """Computes the aggregates of the results of the event again.
+
+        Results written without sending signals (bulk_create, bulk_update,
+        QuerySet.update) require calling this, usually through
+        invalidate_event_scores.
+        """
+        Event.objects.filter(pk=self.pk).update_result_aggregates()
+        self.refresh_from_db(fields=RESULT_AGGREGATES)
+
     def can_be_deleted(self) -> bool:
         """Events can be deleted if they can still be edited or have no results."""
         return self.can_be_edited() or not self.result_set.exists()
 
     def copy_values_from(self, other: "Event", excluded_fields=None) -> "Event":
         """Copy values from another event into this one, retaining the excluded fields.
-        Admin-related fields (results_validation_enabled, edit_deadline_override, include_in_invoices)
-        and primary key (pk) are excluded by default.
+        Admin-related fields (results_validation_enabled, edit_deadline_override, include_in_invoices),
+        the aggregates of the results and primary key (pk) are excluded by default.
         """
         default_excluded_fields = [
             "results_validation_enabled",
@@ -577,6 +633,7 @@ class Event(models.Model):
             "include_in_invoices",
             "id",
             "pk",
+            *RESULT_AGGREGATES,
         ]
 
         for field in self._meta.fields:
@@ -662,6 +719,34 @@ class PlayerManager(models.Manager):
         except PlayerAlias.DoesNotExist:
             return self.get_or_create(name=name)
 
+    def get_or_create_by_names(self, names: list[str]) -> list["Player"]:
+        """Bulk version of get_or_create_by_name.
+
+        Returns the players for the given names, in the same order. Names are
+        resolved with one query for aliases and one for players, and the
+        missing players are created in a single batch.
+        """
+        names = [clean_name(name) for name in names]
+
+        players_by_name = {
+            alias.name: alias.true_player
+            for alias in PlayerAlias.objects.filter(name__in=set(names)).select_related(
+                "true_player"
+            )
+        }
+        for player in self.filter(
+            name__in=set(names) - players_by_name.keys()
+        ).order_by("pk"):
+            players_by_name.setdefault(player.name, player)
+
+        missing_names = [
+            name for name in dict.fromkeys(names) if name not in players_by_name
+        ]
+        for player in self.bulk_create([Player(name=name) for name in missing_names]):
+            players_by_name[player.name] = player
+
+        return [players_by_name[name] for name in names]
+
     def get_by_name(self, name):
         name = clean_name(name)
         try:
@@ -992,6 +1077,52 @@ class Result(models.Model):
         return reverse("single_result_delete", args=[self.pk])
 
 
+@receiver(post_delete, sender=Result)
+@receiver(post_save, sender=Result)
+def update_event_result_aggregates(sender, instance, **kwargs):
+    # Updated within the transaction, so that scores computed once it commits
+    # never see the aggregates from before the results changed.
+    Event.objects.filter(pk=instance.event_id).update_result_aggregates()
+    if Result.event.is_cached(instance):
+        instance.event.refresh_from_db(fields=RESULT_AGGREGATES)
+
+
+class ResultScore(models.Model):
+    """
+    The score a single Result contributes to the leaderboard of a season.
+
+    Those rows are a materialized view over the results, maintained by
+    championship.score.generic: as the score of a result depends on the rest
+    of its event (size, playoffs, number of rounds), rows are always computed
+    for a whole event at once, and dropped for the whole event whenever one of
+    its results changes.
+    """
+
+    result = models.ForeignKey(Result, on_delete=models.CASCADE)
+    season_slug = models.CharField(max_length=50)
+    category = models.CharField(
+        max_length=10,
+        choices=Event.Category.choices,
+        help_text="Category of the event when the result was scored.",
+    )
+    qps = models.IntegerField(
+        null=True,
+        help_text="Points awarded for the result, or None if it does not score in this season.",
+    )
+    byes = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        indexes = [models.Index(fields=["season_slug"], name="resultscore_season_idx")]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["result", "season_slug"], name="unique_result_season"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.result} ({self.season_slug}: {self.qps})"
+
+
 class SpecialReward(models.Model):
     result = models.ForeignKey(Result, on_delete=models.CASCADE)
     byes = models.PositiveIntegerField(
@@ -1013,6 +1144,26 @@ if "auditlog" in settings.INSTALLED_APPS:
     auditlog.register(Result)
 
 
+class OrganizerLeagueQuerySet(models.QuerySet):
+    def covering(self, event: Event):
+        """Returns the leagues whose leaderboard may include the results of the event.
+
+        Whether the event has playoffs is not taken into account, as it
+        changes along with the results of the event.
+        """
+        categories = OrganizerLeague.CATEGORIES
+        if event.category not in categories:
+            return self.none()
+
+        return self.filter(
+            organizer_id=event.organizer_id,
+            start_date__lte=event.date,
+            end_date__gte=event.date,
+            category__in=categories[categories.index(event.category) :],
+            format__in=[event.format, OrganizerLeague.Format.All_FORMATS],
+        )
+
+
 class OrganizerLeague(models.Model):
     """Represents a league of events that is run by an organizer during a given time frame.
     It stores the information of which types of events count towards the league and based
@@ -1064,15 +1215,19 @@ class OrganizerLeague(models.Model):
         strip_tags=True,
     )
 
+    objects = OrganizerLeagueQuerySet.as_manager()
+
+    # Categories that can be included in a league, from lowest to highest.
+    CATEGORIES = [
+        Event.Category.REGULAR,
+        Event.Category.REGIONAL,
+        Event.Category.PREMIER,
+    ]
+
     def category_and_lower(self):
         """We select all events of the chosen category and lower categories for the leaderboard."""
-        categories = [
-            Event.Category.REGULAR,
-            Event.Category.REGIONAL,
-            Event.Category.PREMIER,
-        ]
-        index = categories.index(self.category)
-        return categories[: index + 1]
+        index = self.CATEGORIES.index(self.category)
+        return self.CATEGORIES[: index + 1]
 
     def get_category_and_lower_display(self):
         categories = self.category_and_lower()
@@ -1092,8 +1247,6 @@ class OrganizerLeague(models.Model):
             q = q.filter(event__format=self.format)
 
         if not self.playoffs:
-            q = q.annotate(
-                top_count=Count("event__result__playoff_result"),
-            ).exclude(top_count__gt=0)
+            q = q.filter(event__top_count=0)
 
         return q
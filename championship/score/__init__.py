@@ -12,5 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .generic import compute_scores, get_leaderboard, get_results_with_qps  # noqa
-from .types import LeaderboardScore  # noqa
+from .generic import (  # noqa
+    compute_scores,
+    get_leaderboard,
+    get_leaderboard_page,
+    get_results_with_qps,
+    get_top_n,
+    paginate_leaderboard,
+)
+from .types import Leaderboard, LeaderboardScore  # noqa
@@ -16,8 +16,6 @@ import datetime
 import math
 from dataclasses import dataclass
 
-from django.db.models import Count
-
 from championship.models import Event, NationalLeaderboard, Result
 from championship.score.types import LeaderboardScore, QualificationType
 from championship.seasons.definitions import EU_SEASON_2025
@@ -139,7 +137,6 @@ class ScoreMethodEu2025:
             )
             .prefetch_related("result_set")
             .order_by("date")
-            .annotate(top_count=Count("result__playoff_result"))
             .filter(top_count__gt=0)
         )
         national_leaderboard = NationalLeaderboard.objects.filter(
@@ -17,29 +17,49 @@
 The code in this file is mostly season-independent.
 """
 
-from typing import Any, Iterable
+import itertools
+import threading
+from typing import Any, Iterable, Sequence
 
 from django.conf import settings
 from django.contrib.sites.models import Site
-from django.core.cache import cache
-from django.db import models
-from django.db.models import Count, F, Max
-from django.db.models.signals import post_delete, pre_save
+from django.core.paginator import Page, Paginator
+from django.db import models, transaction
+from django.db.models import Count, Exists, F, Min, OuterRef, Sum
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
 from prometheus_client import Gauge, Summary
 
 from championship.cache_function import cache_function
-from championship.models import Event, OrganizerLeague, Player, PlayerSeasonData, Result
+from championship.models import (
+    Event,
+    EventOrganizer,
+    OrganizerLeague,
+    Player,
+    PlayerSeasonData,
+    Result,
+    ResultScore,
+    SpecialReward,
+)
 from championship.score.eu_season_2025 import ScoreMethodEu2025
 from championship.score.invitational_spring_2025 import (
     ScoreMethodInvitationalSpring2025,
 )
+from championship.score.player_stats import (
+    _player_season_stats_cache_key,
+    compute_player_season_stats,
+)
+from championship.score.qualifications import (
+    direct_qualifications_cache_keys,
+    resolve_direct_qualifications,
+)
 from championship.score.season_2023 import ScoreMethod2023
 from championship.score.season_2024 import ScoreMethod2024
 from championship.score.season_2025 import ScoreMethod2025
 from championship.score.season_all import ScoreMethodAll
-from championship.score.types import LeaderboardScore
+from championship.score.types import Leaderboard, LeaderboardScore, SeasonScore
+from championship.score.vectorized import VectorizedScoreMethod
 from championship.seasons.definitions import (
     EU_SEASON_2024_MOCKUP,
     EU_SEASON_2025,
@@ -62,6 +82,8 @@ scores_computation_results_count = Gauge(
     ["season_id", "season_name"],
 )
 
+# Score methods from championship.score.vectorized score the whole season at
+# once with NumPy, instead of materializing the score of each result.
 SCOREMETHOD_PER_SEASON = {
     SEASON_2023: ScoreMethod2023,
     SEASON_2024: ScoreMethod2024,
@@ -81,31 +103,24 @@ def get_results_with_qps(
     - has_top8: True if the event has a top8
     - qps: the number of QPs the player got in this event
     - event_size: the number of players in the event
+    - top_count: the number of players in the playoffs of the event
     - event: the event
     - byes: Number of byes awarded for this result.
-    """
-    results = event_player_results.select_related("event").annotate(
-        event_size=Count("event__result"),
-        top_count=Count("event__result__playoff_result"),
-    )
 
-    # Calculate the number of rounds by taking the sum of win/draw/loss. We
-    # take the Max to account for players dropping early.
-    rounds_per_event = {
-        row["event"]: row["rounds"]
-        for row in Result.objects.values("event").annotate(
-            rounds=Max(F("win_count") + F("draw_count") + F("loss_count"))
-        )
-    }
-
-    for result in results:
-        method = SCOREMETHOD_PER_SEASON[result.event.season]
-        result.has_top8 = result.top_count > 0
+    The size, playoffs and number of rounds of the event are read from the
+    aggregates stored on Event.
+    """
+    for result in event_player_results.select_related("event"):
+        event = result.event
+        method = SCOREMETHOD_PER_SEASON[event.season]
+        result.event_size = event.size
+        result.top_count = event.top_count
+        result.has_top8 = event.has_top8
         score = method.score_for_result(  # type: ignore
             result,
             event_size=result.event_size,
             has_top8=result.has_top8,
-            total_rounds=rounds_per_event[result.event_id],
+            total_rounds=event.rounds,
         )
         yield result, score
 
@@ -117,73 +132,232 @@ def _score_cache_key(season, country_code=settings.DEFAULT_COUNTRY):
         return f"compute_scoresS{season.slug}"
 
 
-@cache_function(cache_key=_score_cache_key, cache_ttl=15 * 60)
+def refresh_result_scores(season: Season):
+    """Materializes the ResultScore rows of the given season that are missing.
+
+    Every result of an event that counts towards the season has a ResultScore
+    row. Rows are dropped for a whole event when it changes (see
+    invalidate_result_scores), hence only the events that were touched since
+    the last computation get their results scored again.
+    """
+    missing_scores = (
+        Result.objects.in_season(season)
+        .exclude(event__category=Event.Category.OTHER)
+        .exclude(
+            Exists(
+                ResultScore.objects.filter(
+                    result=OuterRef("pk"), season_slug=season.slug
+                )
+            )
+        )
+    )
+    # Events can be updated in bulk without sending signals, in which case we
+    # notice that they changed category since their results were scored.
+    recategorized_scores = ResultScore.objects.filter(season_slug=season.slug).exclude(
+        category=F("result__event__category")
+    )
+
+    stale_events = set(missing_scores.values_list("event_id", flat=True))
+    stale_events |= set(recategorized_scores.values_list("result__event_id", flat=True))
+    if not stale_events:
+        return
+
+    with transaction.atomic():
+        ResultScore.objects.filter(
+            result__event_id__in=stale_events, season_slug=season.slug
+        ).delete()
+        ResultScore.objects.bulk_create(
+            [
+                ResultScore(
+                    result=result,
+                    season_slug=season.slug,
+                    category=result.event.category,
+                    qps=score.qps if score else None,
+                    byes=getattr(score, "byes", 0),
+                )
+                for result, score in get_results_with_qps(
+                    Result.objects.filter(event_id__in=stale_events)
+                )
+            ],
+            ignore_conflicts=True,
+        )
+
+
+def _previous_event_id(result: Result) -> int | None:
+    if result._state.adding:
+        return None
+    return (
+        Result.objects.filter(pk=result.pk).values_list("event_id", flat=True).first()
+    )
+
+
+@receiver(post_delete, sender=Result)
+@receiver(pre_save, sender=Result)
+def invalidate_result_scores(sender, instance, **kwargs):
+    event_ids = {instance.event_id}
+    if kwargs["signal"] is pre_save:
+        # The result may be moved from another event, which scores also change
+        previous_event_id = _previous_event_id(instance)
+        if previous_event_id is not None and previous_event_id != instance.event_id:
+            event_ids.add(previous_event_id)
+            score_cache_invalidator.add(
+                Event.objects.get(pk=previous_event_id), [instance.player_id]
+            )
+    score_cache_invalidator.add_result_scores(event_ids)
+
+
+@receiver(post_save, sender=Event)
+def invalidate_event_result_scores(sender, instance, **kwargs):
+    ResultScore.objects.filter(result__event=instance).delete()
+
+
+def _leaderboard_lookups(season: Season, country_code: str) -> dict[str, Any]:
+    """Returns the lookups selecting the results that count for a leaderboard."""
+    lookups: dict[str, Any] = {
+        "event__date__gte": season.start_date,
+        "event__date__lte": season.end_date,
+        "player__hidden_from_leaderboard": False,
+    }
+    if Site.objects.get_current().domain == SWISS_DOMAIN:
+        lookups["event__organizer__site"] = Site.objects.get_current()
+    else:
+        lookups["player__playerseasondata__country"] = country_code
+        lookups["player__playerseasondata__season_slug"] = season.slug
+    return lookups
+
+
+# Leaderboards are kept for a day after they expire, and served while a single
+# request (or the warm_leaderboards command) computes them again.
+@cache_function(
+    cache_key=_score_cache_key,
+    cache_ttl=15 * 60,
+    stale_ttl=24 * 60 * 60,
+    single_flight=True,
+    early_expiration=1,
+)
 @scores_computation_time_seconds.time()
 def compute_scores(
     season: Season, country_code: str = settings.DEFAULT_COUNTRY
-) -> dict[int, LeaderboardScore]:
-    scores_by_player: dict[int, Any] = {}
-    results = Result.objects.filter(
-        event__date__gte=season.start_date,
-        event__date__lte=season.end_date,
-        player__in=Player.leaderboard_objects.all(),
-    ).exclude(event__category=Event.Category.OTHER)
+) -> Leaderboard:
+    scores_by_player, count = get_season_scores(season, country_code)
+    scores_computation_results_count.labels(season.slug, season.name).set(count)
 
-    if Site.objects.get_current().domain == SWISS_DOMAIN:
-        results = results.on_site()
-    else:
-        results = results.filter(
-            player__playerseasondata__country=country_code,
-            player__playerseasondata__season_slug=season.slug,
+    return Leaderboard.from_scores(
+        SCOREMETHOD_PER_SEASON[season].finalize_scores(  # type: ignore
+            scores_by_player,
+            country_code,
         )
+    )
 
-    count = 0
-    for result, score in get_results_with_qps(results):
-        if score:
-            count += 1
-            try:
-                scores_by_player[result.player_id] += score
-            except KeyError:
-                scores_by_player[result.player_id] = score
 
-    scores_computation_results_count.labels(season.slug, season.name).set(count)
+def get_season_scores(
+    season: Season, country_code: str = settings.DEFAULT_COUNTRY
+) -> tuple[dict[int, SeasonScore], int]:
+    """Returns the total score of each player of a leaderboard, before ranking.
+
+    The number of results that were counted is also returned.
+    """
+    method = SCOREMETHOD_PER_SEASON[season]
+    lookups = _leaderboard_lookups(season, country_code)
+    if issubclass(method, VectorizedScoreMethod):
+        return method.season_scores(season, Result.objects.filter(**lookups))
+    return _aggregate_result_scores(season, lookups)
 
-    return SCOREMETHOD_PER_SEASON[season].finalize_scores(  # type: ignore
-        scores_by_player,
-        country_code,
+
+def _aggregate_result_scores(
+    season: Season, lookups: dict[str, Any]
+) -> tuple[dict[int, SeasonScore], int]:
+    """Returns the score of each player from the ResultScore rows of the season.
+
+    Only the results matching the given lookups are counted. The number of
+    results that were counted is also returned.
+    """
+    refresh_result_scores(season)
+
+    result_scores = ResultScore.objects.filter(
+        season_slug=season.slug,
+        qps__isnull=False,
+        **{f"result__{lookup}": value for lookup, value in lookups.items()},
     )
 
+    scores_by_player: dict[int, SeasonScore] = {}
+    count = 0
+    # Players are ordered by their first result, so that ties are broken the
+    # same way as when scores were accumulated result by result.
+    for row in (
+        result_scores.values("result__player_id")
+        .annotate(
+            qps=Sum("qps"),
+            byes=Sum("byes"),
+            count=Count("id"),
+            first_result=Min("result_id"),
+        )
+        .order_by("first_result")
+    ):
+        scores_by_player[row["result__player_id"]] = SeasonScore(
+            qps=row["qps"], byes=row["byes"]
+        )
+        count += row["count"]
+    return scores_by_player, count
 
-@receiver(post_delete, sender=Result)
-@receiver(pre_save, sender=Result)
-def invalidate_score_cache(sender, instance, **kwargs):
+
+def _score_cache_keys(event: Event, player_ids) -> set[str]:
+    """Returns the keys of the leaderboards the given players of the event appear in."""
+    keys = set()
     for season in get_seasons_with_scores():
-        if season.start_date <= instance.event.date <= season.end_date:
+        if season.start_date <= event.date <= season.end_date:
             if Site.objects.get_current().domain == SWISS_DOMAIN:
-                cache.delete(_score_cache_key(season))
+                keys.add(_score_cache_key(season))
             else:
-                player_season_data = PlayerSeasonData.objects.filter(
-                    player_id=instance.player_id, season_slug=season.slug
-                ).first()
-                if player_season_data:
-                    cache.delete(_score_cache_key(season, player_season_data.country))
+                countries = (
+                    PlayerSeasonData.objects.filter(
+                        player_id__in=player_ids, season_slug=season.slug
+                    )
+                    .values_list("country", flat=True)
+                    .distinct()
+                )
+                keys.update(_score_cache_key(season, country) for country in countries)
+    return keys
+
+
+def _players_with_score(scores_by_player: Leaderboard, rows: Iterable[int]):
+    """Returns the players of the given rows of the leaderboard, with their score.
+
+    Players that are now hidden from the leaderboard are skipped.
+    """
+    rows = list(rows)
+    players = Player.leaderboard_objects.in_bulk(
+        [scores_by_player.player_ids[row] for row in rows]
+    )
+    players_with_score = []
+    for row in rows:
+        if player := players.get(scores_by_player.player_ids[row]):
+            player.score = scores_by_player.score_at(row)
+            players_with_score.append(player)
+    return players_with_score
 
 
 def combine_scores_with_players(
-    scores_by_player: dict[int, LeaderboardScore]
+    scores_by_player: Leaderboard, top: int | None = None
 ) -> list[Player]:
-    """Returns a list of Player with their score.
+    """Returns a list of Player with their score, ordered by rank.
 
     This function returns a list of Players with an additional score property
     (of type Score), containing all informations required to render a
-    leaderboard.
+    leaderboard. Only the players of the leaderboard are loaded, and if top is
+    given, only the first top of them.
     """
-    players_with_score = []
-    for player in Player.leaderboard_objects.all():
-        if score := scores_by_player.get(player.id):
-            player.score = score
-            players_with_score.append(player)
-    players_with_score.sort(key=lambda l: l.score.rank)
+    if top is None:
+        return _players_with_score(scores_by_player, range(len(scores_by_player)))
+
+    players_with_score: list[Player] = []
+    rows = iter(range(len(scores_by_player)))
+    # Players may have been hidden since the leaderboard was computed, hence
+    # more of them are loaded until there are enough.
+    while len(players_with_score) < top and (
+        batch := list(itertools.islice(rows, top - len(players_with_score)))
+    ):
+        players_with_score += _players_with_score(scores_by_player, batch)
     return players_with_score
 
 
@@ -200,12 +374,61 @@ def get_leaderboard(
     return combine_scores_with_players(scores_by_player)
 
 
+def get_top_n(
+    season: Season, country_code: str = settings.DEFAULT_COUNTRY, n: int = 10
+) -> list[Player]:
+    """Returns the first n players of the leaderboard, with their score."""
+    scores_by_player = compute_scores(season, country_code)
+    return combine_scores_with_players(scores_by_player, top=n)
+
+
+def paginate_leaderboard(
+    scores_by_player: Leaderboard,
+    number: int | str | None = 1,
+    per_page: int = 100,
+    search: str = "",
+) -> Page:
+    """Returns the given page of the leaderboard, listing players with their score.
+
+    If search is given, only the players whose name contains it are listed.
+    Only the players of the page are loaded, so the cost of rendering a page
+    does not grow with the number of players in the season.
+    """
+    rows: Sequence[int] = range(len(scores_by_player))
+    if search:
+        player_ids = set(
+            Player.leaderboard_objects.filter(name__icontains=search).values_list(
+                "pk", flat=True
+            )
+        )
+        rows = [
+            row
+            for row, player_id in enumerate(scores_by_player.player_ids)
+            if player_id in player_ids
+        ]
+    page = Paginator(rows, per_page).get_page(number)
+    page.object_list = _players_with_score(scores_by_player, page.object_list)
+    return page
+
+
+def get_leaderboard_page(
+    season: Season,
+    country_code: str = settings.DEFAULT_COUNTRY,
+    number: int | str | None = 1,
+    per_page: int = 100,
+    search: str = "",
+) -> Page:
+    """Returns the given page of the leaderboard, see paginate_leaderboard."""
+    scores_by_player = compute_scores(season, country_code)
+    return paginate_leaderboard(scores_by_player, number, per_page, search)
+
+
 def _organizer_score_cache_key(l: OrganizerLeague):
     return f"compute_organizer_scores_o{l.organizer_id}s{l.start_date}e{l.end_date}f{l.format}c{l.category}p{l.playoffs}"
 
 
-@cache_function(cache_key=_organizer_score_cache_key, cache_ttl=60 * 60)
-def compute_organizer_scores(league: OrganizerLeague) -> dict[int, LeaderboardScore]:
+@cache_function(cache_key=_organizer_score_cache_key, cache_ttl=24 * 60 * 60)
+def compute_organizer_scores(league: OrganizerLeague) -> Leaderboard:
     qps_by_player: dict[int, int] = {}
     for result, score in get_results_with_qps(league.get_results()):
         if score:
@@ -219,18 +442,234 @@ def compute_organizer_scores(league: OrganizerLeague) -> dict[int, LeaderboardSc
         player_id: LeaderboardScore(total_score=score, rank=i + 1)
         for i, (player_id, score) in enumerate(sorted_qps)
     }
-    return scores
+    return Leaderboard.from_scores(scores)
+
+
+def _organizer_score_cache_keys(event: Event) -> set[str]:
+    return {
+        _organizer_score_cache_key(league)
+        for league in OrganizerLeague.objects.covering(event)
+    }
+
+
+def _direct_qualifications_cache_keys(event: Event) -> set[str]:
+    return {
+        key
+        for season in get_seasons_with_scores()
+        if season.start_date <= event.date <= season.end_date
+        for key in direct_qualifications_cache_keys(season)
+    }
+
+
+def _player_season_stats_cache_keys(event: Event, player_ids) -> set[str]:
+    return {
+        _player_season_stats_cache_key(player_id, season)
+        for season in get_seasons_with_scores()
+        if season.start_date <= event.date <= season.end_date
+        for player_id in player_ids
+    }
+
+
+class ScoreCacheInvalidator(threading.local):
+    """Collects the score caches made stale by a transaction.
+
+    Results are usually saved many at once (for example when uploading the
+    results of an event), hence instead of dropping the caches for every
+    result, the affected events are recorded and each cache key is deleted
+    once, after the transaction commits. This also avoids a concurrent request
+    caching scores computed from data that is not committed yet.
+    """
+
+    def __init__(self):
+        self.result_score_event_ids: set[int] = set()
+        self.player_ids_by_event: dict[int, tuple[Event, set[int]]] = {}
+        self.score_keys: set[str] = set()
+        self.organizer_keys: set[str] = set()
+        self.direct_qualification_keys: set[str] = set()
+        self.player_stats_events: list[Event] = []
+        self.player_stats_organizer_ids: set[int] = set()
+
+    def add(self, event: Event, player_ids: Iterable[int]):
+        _, pending_player_ids = self.player_ids_by_event.setdefault(
+            event.pk, (event, set())
+        )
+        pending_player_ids.update(player_ids)
+        # Only the first callback of a transaction has something to flush.
+        # Scheduling one per call keeps working after a rollback discarded the
+        # previous callbacks.
+        transaction.on_commit(self.flush)
+
+    def add_result_scores(self, event_ids: Iterable[int]):
+        """Records the events whose ResultScore rows must be computed again."""
+        self.result_score_event_ids.update(event_ids)
+        transaction.on_commit(self.flush)
+
+    def add_leaderboards(self, event: Event):
+        """Records the leaderboards the event counts for, as it is now.
+
+        Used before an event is modified, as its date and category decide
+        which leaderboards its results count for.
+        """
+        self.score_keys |= _score_cache_keys(
+            event,
+            Result.objects.filter(event_id=event.pk).values_list(
+                "player_id", flat=True
+            ),
+        )
+        transaction.on_commit(self.flush)
+
+    def add_organizer_leagues(self, event: Event):
+        """Records the organizer leagues covering the event as it is now.
+
+        Used before an event is modified, so that the leagues it leaves are
+        also refreshed.
+        """
+        self.organizer_keys |= _organizer_score_cache_keys(event)
+        transaction.on_commit(self.flush)
+
+    def add_direct_qualifications(self, event: Event):
+        """Records the direct qualifications of the seasons of the event."""
+        self.direct_qualification_keys |= _direct_qualifications_cache_keys(event)
+        transaction.on_commit(self.flush)
+
+    def add_player_stats(self, event: Event):
+        """Records the statistics of all the players of the event as it is now.
+
+        Used before an event is modified, as its category, format or organizer
+        appear in the statistics of its players.
+        """
+        self.player_stats_events.append(event)
+        transaction.on_commit(self.flush)
+
+    def add_organizer_player_stats(self, organizer_id: int):
+        """Records the statistics of all the players who played at the organizer.
+
+        Used when the organizer is renamed, as its name appears in the
+        statistics of its players.
+        """
+        self.player_stats_organizer_ids.add(organizer_id)
+        transaction.on_commit(self.flush)
+
+    def flush(self):
+        result_score_event_ids, self.result_score_event_ids = (
+            self.result_score_event_ids,
+            set(),
+        )
+        player_ids_by_event, self.player_ids_by_event = self.player_ids_by_event, {}
+        score_keys, self.score_keys = self.score_keys, set()
+        player_stats_events, self.player_stats_events = self.player_stats_events, []
+        player_stats_organizer_ids, self.player_stats_organizer_ids = (
+            self.player_stats_organizer_ids,
+            set(),
+        )
+        organizer_keys, self.organizer_keys = self.organizer_keys, set()
+        direct_qualification_keys, self.direct_qualification_keys = (
+            self.direct_qualification_keys,
+            set(),
+        )
+        player_stats_keys = set()
+        for event in player_stats_events:
+            player_stats_keys |= _player_season_stats_cache_keys(
+                event,
+                Result.objects.filter(event_id=event.pk).values_list(
+                    "player_id", flat=True
+                ),
+            )
+        if player_stats_organizer_ids:
+            seasons = get_seasons_with_scores()
+            for player_id, date in (
+                Result.objects.filter(
+                    event__organizer_id__in=player_stats_organizer_ids
+                )
+                .values_list("player_id", "event__date")
+                .distinct()
+            ):
+                player_stats_keys |= {
+                    _player_season_stats_cache_key(player_id, season)
+                    for season in seasons
+                    if season.start_date <= date <= season.end_date
+                }
+        for event, player_ids in player_ids_by_event.values():
+            score_keys |= _score_cache_keys(event, player_ids)
+            player_stats_keys |= _player_season_stats_cache_keys(event, player_ids)
+            organizer_keys |= _organizer_score_cache_keys(event)
+            if event.category == Event.Category.PREMIER:
+                direct_qualification_keys |= _direct_qualifications_cache_keys(event)
+        # The rows are dropped before the caches, as leaderboards are computed
+        # from them.
+        if result_score_event_ids:
+            ResultScore.objects.filter(
+                result__event_id__in=result_score_event_ids
+            ).delete()
+        # Qualifications are dropped first, as leaderboards are computed from
+        # them.
+        if direct_qualification_keys:
+            resolve_direct_qualifications.invalidate(direct_qualification_keys)
+        if score_keys:
+            compute_scores.invalidate(score_keys)
+        if organizer_keys:
+            compute_organizer_scores.invalidate(organizer_keys)
+        if player_stats_keys:
+            compute_player_season_stats.invalidate(player_stats_keys)
+
+
+score_cache_invalidator = ScoreCacheInvalidator()
 
 
 @receiver(post_delete, sender=Result)
 @receiver(pre_save, sender=Result)
-def invalidate_organizer_score_cache(sender, instance, **kwargs):
-    for league in OrganizerLeague.objects.filter(
-        organizer=instance.event.organizer,
-        start_date__gte=instance.event.date,
-        end_date__lte=instance.event.date,
-    ):
-        cache.delete(_organizer_score_cache_key(league))
+def invalidate_score_cache(sender, instance, **kwargs):
+    score_cache_invalidator.add(instance.event, [instance.player_id])
+
+
+@receiver(pre_save, sender=Event)
+def invalidate_event_score_cache(sender, instance, **kwargs):
+    # A new event has no results yet.
+    if instance.pk is None:
+        return
+    previous = Event.objects.filter(pk=instance.pk).first()
+    for event in filter(None, [previous, instance]):
+        score_cache_invalidator.add_leaderboards(event)
+        score_cache_invalidator.add_organizer_leagues(event)
+        score_cache_invalidator.add_player_stats(event)
+        if event.category == Event.Category.PREMIER:
+            score_cache_invalidator.add_direct_qualifications(event)
+
+
+@receiver(pre_save, sender=EventOrganizer)
+def invalidate_organizer_player_stats(sender, instance, **kwargs):
+    if instance.pk is None:
+        return
+    previous_name = (
+        EventOrganizer.objects.filter(pk=instance.pk)
+        .values_list("name", flat=True)
+        .first()
+    )
+    if previous_name != instance.name:
+        score_cache_invalidator.add_organizer_player_stats(instance.pk)
+
+
+@receiver(post_delete, sender=SpecialReward)
+@receiver(post_save, sender=SpecialReward)
+def invalidate_special_reward_score_cache(sender, instance, **kwargs):
+    result = instance.result
+    score_cache_invalidator.add(result.event, [result.player_id])
+    score_cache_invalidator.add_direct_qualifications(result.event)
+
+
+def invalidate_event_scores(event: Event):
+    """Invalidates all the scores computed from the results of the event.
+
+    The aggregates of the results stored on the event are also updated. Use
+    this after creating or updating the results of an event in bulk (for
+    example with bulk_create or bulk_update), as it does not send the signals
+    that invalidate the scores of each result.
+    """
+    event.update_result_aggregates()
+    ResultScore.objects.filter(result__event=event).delete()
+    score_cache_invalidator.add(
+        event, event.result_set.values_list("player_id", flat=True)
+    )
 
 
 def get_organizer_leaderboard(league: OrganizerLeague) -> list[Player]:
@@ -0,0 +1,223 @@
+# Copyright 2026 Leonin League
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Results and statistics of a player over a season, shown on their details page."""
+
+import dataclasses
+from collections import Counter, defaultdict
+from typing import Any, Iterable
+
+from championship.cache_function import cache_function
+from championship.models import Event, Result
+from championship.seasons.definitions import Season
+
+TBODY = "tbody"
+THEAD = "thead"
+TABLE = "table"
+QPS = "League Points"
+EVENTS = "Events"
+
+CATEGORY_ORDER = [
+    Event.Category.GRAND_PRIX,
+    Event.Category.QUALIFIER,
+    Event.Category.PREMIER,
+    Event.Category.REGIONAL,
+    Event.Category.NATIONAL,
+    Event.Category.REGULAR,
+    Event.Category.OTHER,
+]
+
+
+@dataclasses.dataclass
+class Performance:
+    win: int = 0
+    loss: int = 0
+    draw: int = 0
+
+    @property
+    def win_ratio(self) -> float:
+        try:
+            return self.win / (self.win + self.loss + self.draw)
+        except ZeroDivisionError:
+            return 0.0
+
+    @property
+    def win_ratio_without_draws(self) -> float:
+        try:
+            return self.win / (self.win + self.loss)
+        except ZeroDivisionError:
+            return 0.0
+
+    def __str__(self):
+        return f"{self.win} - {self.loss} - {self.draw}"
+
+    def __add__(self, other):
+        return Performance(
+            win=self.win + other.win,
+            loss=self.loss + other.loss,
+            draw=self.draw + other.draw,
+        )
+
+
+def _qp_table(results) -> dict[str, list]:
+    qps_by_category = defaultdict(int)
+    num_events_by_category = defaultdict(int)
+
+    for result, score in sorted(
+        results,
+        key=lambda r: CATEGORY_ORDER.index(r[0].event.category),
+    ):
+        if score and score.qps:
+            qps_by_category[result.event.get_category_display()] += score.qps
+            num_events_by_category[result.event.get_category_display()] += 1
+
+    categories = [c.label for c in CATEGORY_ORDER if c.label in qps_by_category]
+    event_counts = [num_events_by_category[category] for category in categories]
+    return {
+        THEAD: [""] + categories + ["Total"],
+        TBODY: [
+            [QPS] + list(qps_by_category.values()) + [sum(qps_by_category.values())],
+            [EVENTS] + event_counts + [sum(event_counts)],
+        ],
+    }
+
+
+def _top_finish_table(results) -> dict[str, Any]:
+    playoff_count_by_category_ranking = defaultdict(lambda: defaultdict(int))
+    for result, _ in results:
+        if result.playoff_result:
+            playoff_count_by_category_ranking[result.event.get_category_display()][
+                result.get_ranking_display()
+            ] += 1
+    rankings = sorted(
+        set(r[0].get_ranking_display() for r in results if r[0].playoff_result)
+    )
+    categories = [
+        c.label for c in CATEGORY_ORDER if c.label in playoff_count_by_category_ranking
+    ]
+    with_top_8_table = {
+        THEAD: [""] + categories,
+        TBODY: [
+            [ranking]
+            + [
+                playoff_count_by_category_ranking[category].get(ranking, 0)
+                for category in categories
+            ]
+            for ranking in rankings
+        ],
+    }
+
+    return {
+        "title": "Top 8 Finishes",
+        TABLE: with_top_8_table,
+    }
+
+
+def _performance_per_format(results) -> dict[str, Performance]:
+    """Returns the peformance per format, with the display name of the format as key."""
+
+    def extra_wins_for_top(result):
+        if result.playoff_result is None:
+            return 0
+
+        points = {
+            Result.PlayoffResult.WINNER: 3,
+            Result.PlayoffResult.FINALIST: 2,
+            Result.PlayoffResult.SEMI_FINALIST: 1,
+            Result.PlayoffResult.QUARTER_FINALIST: 0,
+        }[result.playoff_result]
+
+        # If we are in top4, it means we had one less match to win to get
+        # to any rank. We can ignore QUARTER_FINALIST being 0, as they
+        # would not be present in a top4 only match.
+        if result.top_count == 4:
+            points -= 1
+
+        return points
+
+    def extra_losses_for_top(result):
+        playoff_result = result.playoff_result
+        if playoff_result in (None, Result.PlayoffResult.WINNER):
+            return 0
+        return 1
+
+    perf_per_format: dict[str, Performance] = {}
+    for result, _ in results:
+        format = result.event.get_format_display()
+        try:
+            performance = perf_per_format[format]
+        except KeyError:
+            performance = Performance()
+        performance.win += result.win_count + extra_wins_for_top(result)
+        performance.loss += result.loss_count + extra_losses_for_top(result)
+        performance.draw += result.draw_count
+        perf_per_format[format] = performance
+
+    perf_per_format["Overall"] = sum(perf_per_format.values(), start=Performance())
+
+    return perf_per_format
+
+
+@dataclasses.dataclass
+class PlayerSeasonStats:
+    # The results of the player with their score, from the most recent
+    results: list[tuple[Result, Any]]
+    qp_table: dict[str, list]
+    top_finish_table: dict[str, Any]
+    performance_per_format: dict[str, Performance]
+    local_organizer_name: str | None
+
+    @classmethod
+    def from_results(cls, results: Iterable[tuple[Result, Any]]):
+        """Computes the statistics from results annotated by get_results_with_qps.
+
+        Results are expected to be ordered from the most recent, ties between
+        organizers being won by the most recent one.
+        """
+        results = list(results)
+        organizer_counts = Counter(result.event.organizer.name for result, _ in results)
+        most_common_organizer = organizer_counts.most_common(1)
+        return cls(
+            results=results,
+            qp_table=_qp_table(results),
+            top_finish_table=_top_finish_table(results),
+            performance_per_format=_performance_per_format(results),
+            local_organizer_name=(
+                most_common_organizer[0][0] if most_common_organizer else None
+            ),
+        )
+
+
+def _player_season_stats_cache_key(player_id: int, season: Season):
+    return f"player_season_statsP{player_id}S{season.slug}"
+
+
+@cache_function(cache_key=_player_season_stats_cache_key, cache_ttl=24 * 60 * 60)
+def compute_player_season_stats(player_id: int, season: Season) -> PlayerSeasonStats:
+    """Returns the results and statistics of the player over the season.
+
+    They only change along with the results of the player, hence are cached
+    until one of them changes (see ScoreCacheInvalidator).
+    """
+    # Avoids a circular import, as the score module invalidates these statistics.
+    from championship.score.generic import get_results_with_qps
+
+    return PlayerSeasonStats.from_results(
+        get_results_with_qps(
+            Result.objects.filter(player_id=player_id)
+            .in_season(season)
+            .select_related("event__organizer")
+            .order_by("-event__date")
+        )
+    )
@@ -0,0 +1,141 @@
+# Copyright 2026 Leonin League
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Direct qualifications awarded by the Premier events of a season."""
+
+from dataclasses import dataclass
+
+from django.db.models import F, Value
+from django.db.models.expressions import Window
+from django.db.models.functions import Coalesce, DenseRank, RowNumber
+
+from championship.cache_function import cache_function
+from championship.models import Event, Result, SpecialReward
+from championship.seasons.definitions import Season
+
+# Results without playoffs come after the quarter finalists, see Result.__lt__.
+NO_PLAYOFF_RESULT = 32
+
+
+@dataclass(frozen=True)
+class DirectQualification:
+    ranking: str
+    event_name: str
+
+    @classmethod
+    def for_result(cls, result: Result) -> "DirectQualification":
+        return cls(ranking=result.get_ranking_display(), event_name=result.event.name)
+
+
+# The (min_players, rewards_first) arguments the score methods resolve direct
+# qualifications with. The qualifications cached for each of them are dropped
+# together, see direct_qualifications_cache_keys.
+DIRECT_QUALIFICATION_VARIANTS = [
+    (0, True),  # Season 2025
+    (40, False),  # Season 2024, see ScoreMethod2024
+]
+
+
+def _direct_qualifications_cache_key(
+    season: Season, min_players: int = 0, rewards_first: bool = True
+):
+    return f"direct_qualificationsS{season.slug}M{min_players}R{int(rewards_first)}"
+
+
+def direct_qualifications_cache_keys(season: Season) -> set[str]:
+    return {
+        _direct_qualifications_cache_key(season, min_players, rewards_first)
+        for min_players, rewards_first in DIRECT_QUALIFICATION_VARIANTS
+    }
+
+
+def _premier_candidates(season: Season, already_qualified: int, min_players: int):
+    """Returns the best results of each Premier event of the season.
+
+    Results are ordered by event date, then by standing in the event. The n-th
+    event of the season can pass its invite down to at most its
+    (n + already_qualified)-th player, hence the results below that are not
+    loaded at all.
+    """
+    events = Event.objects.filter(
+        category=Event.Category.PREMIER,
+        date__gte=season.start_date,
+        date__lte=season.end_date,
+    )
+    if min_players:
+        events = events.filter(size__gte=min_players)
+
+    return (
+        Result.objects.filter(event__in=events)
+        .select_related("event")
+        .only("player_id", "ranking", "playoff_result", "event__name", "event__date")
+        .annotate(
+            event_position=Window(
+                DenseRank(), order_by=[F("event__date").asc(), F("event_id").asc()]
+            ),
+            standing=Window(
+                RowNumber(),
+                partition_by=F("event_id"),
+                order_by=[
+                    Coalesce("playoff_result", Value(NO_PLAYOFF_RESULT)).asc(),
+                    F("ranking").asc(),
+                    F("pk").asc(),
+                ],
+            ),
+        )
+        .filter(standing__lte=F("event_position") + already_qualified)
+        .order_by("event__date", "event_id", "standing")
+    )
+
+
+@cache_function(cache_key=_direct_qualifications_cache_key, cache_ttl=24 * 60 * 60)
+def resolve_direct_qualifications(
+    season: Season, min_players: int = 0, rewards_first: bool = True
+) -> dict[int, DirectQualification]:
+    """Returns the direct qualifications of the season, by player id.
+
+    Each Premier event with at least min_players players, in date order,
+    invites its best player that is not qualified yet. Special rewards with a
+    direct invite also qualify their player. With rewards_first, they are
+    handed out before the Premier events (which then pass their invite down to
+    the next player). Otherwise they are handed out after, and Premier events
+    do not pass their invite down to make room for them.
+
+    Qualifications only change along with the results of Premier events and
+    special rewards, hence they are cached independently from the
+    leaderboard (see ScoreCacheInvalidator).
+    """
+    reward_qualifications = {
+        reward.result.player_id: DirectQualification.for_result(reward.result)
+        for reward in SpecialReward.objects.filter(
+            direct_invite=True,
+            result__event__date__gte=season.start_date,
+            result__event__date__lte=season.end_date,
+        )
+        .select_related("result__event")
+        .order_by("pk")
+    }
+
+    qualifications = dict(reward_qualifications) if rewards_first else {}
+    qualified_event_id = None
+    for result in _premier_candidates(season, len(qualifications), min_players):
+        if result.event_id == qualified_event_id:
+            continue
+        if result.player_id not in qualifications:
+            qualifications[result.player_id] = DirectQualification.for_result(result)
+            qualified_event_id = result.event_id
+
+    if not rewards_first:
+        qualifications.update(reward_qualifications)
+    return qualifications
@@ -13,9 +13,11 @@
 # limitations under the License.
 
 import datetime
+from collections import defaultdict
 from dataclasses import dataclass
 
 from championship.models import Event, Result, SpecialReward
+from championship.score.qualifications import resolve_direct_qualifications
 from championship.score.types import LeaderboardScore, QualificationType
 from championship.seasons.definitions import SEASON_2025
 
@@ -94,10 +96,11 @@ class ScoreMethod2025:
         points = points * cls.MULT[category]
         if result.playoff_result:
             points += cls.POINTS_FOR_TOP[category][result.playoff_result]
-        elif has_top_8:
+        elif has_top_8 and total_rounds:
             # If the event has a top 8, but the player didn't make it, they can
             # still get extra points if their match point rate (mpr) is higher than the
-            # threshold of 70% or 65%.
+            # threshold of 70% or 65%. Without any match recorded, there is no
+            # match point rate.
             maximum_match_points = 3.0 * total_rounds
             for mpr_threshold, points_for_mpr in cls.POINTS_FOR_MATCHPOINT_RATE:
                 players_mpr = result.points / maximum_match_points
@@ -128,38 +131,22 @@ class ScoreMethod2025:
         Returns a dictionary of player_id to LeaderboardScore.
 
         """
-        premier_events = (
-            Event.objects.filter(
-                category=Event.Category.PREMIER,
-                date__gte=SEASON_2025.start_date,
-                date__lte=SEASON_2025.end_date,
+        direct_qualification_reasons_by_player = {
+            player_id: cls.DIRECT_QUALIFICATION_REASON.format(
+                ranking=qualification.ranking,
+                event_name=qualification.event_name,
             )
-            .prefetch_related("result_set")
-            .order_by("date")
-        )
-        direct_qualification_reasons_by_player = {}
-        rewards = SpecialReward.objects.filter(
+            for player_id, qualification in resolve_direct_qualifications(
+                SEASON_2025
+            ).items()
+        }
+        reward_byes_by_player = defaultdict(int)
+        for player_id, byes in SpecialReward.objects.filter(
+            byes__gt=0,
             result__event__date__gte=SEASON_2025.start_date,
             result__event__date__lte=SEASON_2025.end_date,
-        ).all()
-        for reward in rewards:
-            if reward.direct_invite:
-                direct_qualification_reasons_by_player[reward.result.player_id] = (
-                    cls.DIRECT_QUALIFICATION_REASON.format(
-                        ranking=reward.result.get_ranking_display(),
-                        event_name=reward.result.event.name,
-                    )
-                )
-        for premier_event in premier_events:
-            for result in sorted(premier_event.result_set.all()):
-                if result.player_id not in direct_qualification_reasons_by_player:
-                    direct_qualification_reasons_by_player[result.player_id] = (
-                        cls.DIRECT_QUALIFICATION_REASON.format(
-                            ranking=result.get_ranking_display(),
-                            event_name=premier_event.name,
-                        )
-                    )
-                    break
+        ).values_list("result__player_id", "byes"):
+            reward_byes_by_player[player_id] += byes
 
         if SEASON_2025.can_enter_results(datetime.date.today()):
             leaderboard_reason = "This place qualifies for the SUL Championship tournament at the end of the Season"
@@ -173,9 +160,7 @@ class ScoreMethod2025:
         for i, (player_id, score) in enumerate(sorted_scores):
             rank = i + 1
             byes = (
-                cls._byes_for_rank(rank)
-                + score.byes
-                + sum([r.byes for r in rewards if r.result.player_id == player_id])
+                cls._byes_for_rank(rank) + score.byes + reward_byes_by_player[player_id]
             )
             byes = min(byes, cls.MAX_BYES)
 
@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import struct
+from array import array
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
 from enum import Enum
 
@@ -23,9 +26,160 @@ class QualificationType(Enum):
 
 
 @dataclass
+class SeasonScore:
+    """Sum of the scores of all the results of a player in a season."""
+
+    qps: int
+    byes: int = 0
+
+
+@dataclass(slots=True)
 class LeaderboardScore:
     total_score: int
     rank: int
     byes: int = 0
     qualification_type: QualificationType = QualificationType.NONE
     qualification_reason: str = ""
+
+
+_QUALIFICATION_TYPES = list(QualificationType)
+
+
+class Leaderboard(Mapping[int, LeaderboardScore]):
+    """Compact, read-only mapping of player id to LeaderboardScore.
+
+    Scores are stored in columns (one array per field of LeaderboardScore),
+    ordered by rank, and qualification reasons are only stored once. The
+    LeaderboardScore objects are created when accessed, hence modifying them
+    does not modify the leaderboard.
+
+    Leaderboards are cached, so they pickle to the compact format of
+    to_bytes(), which is also fast to load.
+    """
+
+    # Number of rows and number of reasons.
+    _HEADER = struct.Struct("<II")
+    _REASON_SEPARATOR = "\0"
+
+    def __init__(
+        self,
+        player_ids: array,
+        total_scores: array,
+        ranks: array,
+        byes: array,
+        qualification_types: array,
+        reason_ids: array,
+        reasons: list[str],
+    ):
+        self.player_ids = player_ids
+        self.total_scores = total_scores
+        self.ranks = ranks
+        self.byes = byes
+        self.qualification_types = qualification_types
+        self.reason_ids = reason_ids
+        self.reasons = reasons
+        self._row_by_player: dict[int, int] | None = None
+
+    @classmethod
+    def from_scores(cls, scores: dict[int, LeaderboardScore]) -> "Leaderboard":
+        rows = sorted(scores.items(), key=lambda item: item[1].rank)
+        reason_ids: dict[str, int] = {}
+        return cls(
+            player_ids=array("q", (player_id for player_id, _ in rows)),
+            total_scores=array("q", (score.total_score for _, score in rows)),
+            ranks=array("q", (score.rank for _, score in rows)),
+            byes=array("q", (score.byes for _, score in rows)),
+            qualification_types=array(
+                "b",
+                (_QUALIFICATION_TYPES.index(s.qualification_type) for _, s in rows),
+            ),
+            reason_ids=array(
+                "q",
+                (
+                    reason_ids.setdefault(s.qualification_reason, len(reason_ids))
+                    for _, s in rows
+                ),
+            ),
+            reasons=list(reason_ids),
+        )
+
+    def to_bytes(self) -> bytes:
+        reasons = self._REASON_SEPARATOR.join(self.reasons).encode()
+        return b"".join(
+            [
+                self._HEADER.pack(len(self.player_ids), len(self.reasons)),
+                self.player_ids.tobytes(),
+                self.total_scores.tobytes(),
+                self.ranks.tobytes(),
+                self.byes.tobytes(),
+                self.qualification_types.tobytes(),
+                self.reason_ids.tobytes(),
+                reasons,
+            ]
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Leaderboard":
+        count, reason_count = cls._HEADER.unpack_from(data)
+        offset = cls._HEADER.size
+
+        def read(typecode):
+            nonlocal offset
+            column = array(typecode)
+            end = offset + count * column.itemsize
+            column.frombytes(data[offset:end])
+            offset = end
+            return column
+
+        return cls(
+            player_ids=read("q"),
+            total_scores=read("q"),
+            ranks=read("q"),
+            byes=read("q"),
+            qualification_types=read("b"),
+            reason_ids=read("q"),
+            reasons=(
+                data[offset:].decode().split(cls._REASON_SEPARATOR)
+                if reason_count
+                else []
+            ),
+        )
+
+    def __reduce__(self):
+        return (Leaderboard.from_bytes, (self.to_bytes(),))
+
+    def _row(self, player_id: int) -> int:
+        if self._row_by_player is None:
+            self._row_by_player = {pid: row for row, pid in enumerate(self.player_ids)}
+        return self._row_by_player[player_id]
+
+    def score_at(self, row: int) -> LeaderboardScore:
+        return LeaderboardScore(
+            total_score=self.total_scores[row],
+            rank=self.ranks[row],
+            byes=self.byes[row],
+            qualification_type=_QUALIFICATION_TYPES[self.qualification_types[row]],
+            qualification_reason=self.reasons[self.reason_ids[row]],
+        )
+
+    def has_qualification_type(self, qualification_type: QualificationType) -> bool:
+        return (
+            _QUALIFICATION_TYPES.index(qualification_type) in self.qualification_types
+        )
+
+    def __getitem__(self, player_id: int) -> LeaderboardScore:
+        return self.score_at(self._row(player_id))
+
+    def __contains__(self, player_id) -> bool:
+        try:
+            self._row(player_id)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterates over the ids of the players, by rank."""
+        return iter(self.player_ids)
+
+    def __len__(self) -> int:
+        return len(self.player_ids)
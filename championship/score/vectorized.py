@@ -0,0 +1,179 @@
+# Copyright 2026 Leonin League
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Scores all the results of a season at once with NumPy.
+
+The score methods score results one by one with score_for_result. The
+vectorized variants defined here compute the same scores with array operations
+over all the results of the season, without materializing ResultScore rows. A
+season uses them when its score method in SCOREMETHOD_PER_SEASON is one of
+them.
+"""
+
+from django.db import models
+from django.db.models import Value
+from django.db.models.functions import Coalesce
+
+import numpy as np
+
+from championship.models import Result
+from championship.score.invitational_spring_2025 import (
+    ScoreMethodInvitationalSpring2025,
+)
+from championship.score.season_2024 import ScoreMethod2024
+from championship.score.season_2025 import ScoreMethod2025
+from championship.score.types import SeasonScore
+from championship.seasons.definitions import Season
+
+# Playoff results are used as indexes in the lookup tables, 0 meaning that the
+# player did not make it to the playoffs.
+PLAYOFF_CODES = max(Result.PlayoffResult) + 1
+
+
+class VectorizedScoreMethod:
+    """Batch scoring for the score methods of the 2024 and 2025 seasons.
+
+    In these seasons, the QPs of a result are its swiss points times a
+    multiplier of the category, plus points for the playoffs or, for players
+    that missed the playoffs of an event that had some, for their match point
+    rate.
+    """
+
+    @classmethod
+    def _lookup_tables(cls, categories):
+        """Returns the scoring tables, indexed by category code."""
+        multipliers = np.array([cls.MULT[c] for c in categories], dtype=np.int64)
+        has_bonus = np.array([c in cls.POINTS_FOR_TOP for c in categories])
+        points_for_top = np.zeros((len(categories), PLAYOFF_CODES), dtype=np.int64)
+        for code, category in enumerate(categories):
+            for playoff_result, points in cls.POINTS_FOR_TOP.get(category, {}).items():
+                points_for_top[code, playoff_result] = points
+        points_for_mpr = [
+            (threshold, np.array([points[c] for c in categories], dtype=np.int64))
+            for threshold, points in cls.POINTS_FOR_MATCHPOINT_RATE
+        ]
+        return multipliers, has_bonus, points_for_top, points_for_mpr
+
+    @classmethod
+    def score_arrays(
+        cls,
+        points: np.ndarray,
+        category_codes: np.ndarray,
+        categories: list[str],
+        playoff_results: np.ndarray,
+        rounds: np.ndarray,
+        has_top8: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the QPs and byes of each result.
+
+        Categories are given as codes, indexing the categories list. Playoff
+        results are 0 for players that did not make it to the playoffs.
+        """
+        multipliers, has_bonus, points_for_top, points_for_mpr = cls._lookup_tables(
+            categories
+        )
+        qps = (points + cls.PARTICIPATION_POINTS) * multipliers[category_codes]
+
+        # Thresholds are checked from the highest to the lowest, the first one
+        # reached gives its points.
+        # Events without any match recorded have no match point rate, and
+        # give no points for it.
+        mpr = np.divide(
+            points,
+            3.0 * rounds,
+            out=np.zeros(len(points), dtype=np.float64),
+            where=rounds > 0,
+        )
+        mpr_points = np.zeros_like(qps)
+        for threshold, points_for_category in reversed(points_for_mpr):
+            mpr_points = np.where(
+                mpr >= threshold, points_for_category[category_codes], mpr_points
+            )
+
+        bonus = np.where(
+            playoff_results > 0,
+            points_for_top[category_codes, playoff_results],
+            np.where(has_top8, mpr_points, 0),
+        )
+        qps += np.where(has_bonus[category_codes], bonus, 0)
+        return qps, np.zeros_like(qps)
+
+    @classmethod
+    def season_scores(
+        cls, season: Season, results: models.QuerySet[Result]
+    ) -> tuple[dict[int, SeasonScore], int]:
+        """Returns the score of each player of the given results of the season.
+
+        Players are ordered by their first result, like when scores are
+        aggregated from ResultScore rows. The number of results that were
+        scored is also returned.
+        """
+        categories = list(cls.MULT)
+        rows = list(
+            results.filter(event__category__in=categories)
+            .annotate(playoff_code=Coalesce("playoff_result", Value(0)))
+            .order_by("pk")
+            .values_list(
+                "player_id",
+                "points",
+                "event__category",
+                "playoff_code",
+                "event__rounds",
+                "event__top_count",
+            )
+        )
+        if not rows:
+            return {}, 0
+        player_ids, points, row_categories, playoff_results, rounds, top_counts = (
+            np.array(column) for column in zip(*rows)
+        )
+
+        present_categories, category_codes = np.unique(
+            row_categories, return_inverse=True
+        )
+        qps, byes = cls.score_arrays(
+            points=points,
+            category_codes=category_codes,
+            categories=list(present_categories),
+            playoff_results=playoff_results,
+            rounds=rounds,
+            has_top8=top_counts > 0,
+        )
+
+        players, first_rows, player_codes = np.unique(
+            player_ids, return_index=True, return_inverse=True
+        )
+        qps_by_player = np.bincount(player_codes, weights=qps).astype(np.int64)
+        byes_by_player = np.bincount(player_codes, weights=byes).astype(np.int64)
+        scores_by_player = {
+            int(players[code]): SeasonScore(
+                qps=int(qps_by_player[code]), byes=int(byes_by_player[code])
+            )
+            for code in np.argsort(first_rows)
+        }
+        return scores_by_player, len(rows)
+
+
+class VectorizedScoreMethod2024(VectorizedScoreMethod, ScoreMethod2024):
+    pass
+
+
+class VectorizedScoreMethod2025(VectorizedScoreMethod, ScoreMethod2025):
+    pass
+
+
+class VectorizedScoreMethodInvitationalSpring2025(
+    VectorizedScoreMethod, ScoreMethodInvitationalSpring2025
+):
+    pass
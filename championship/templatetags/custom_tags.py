@@ -30,6 +30,20 @@ def verbose_name(model):
     return model._meta.verbose_name
 
 
+@register.filter
+def elided_page_range(page):
+    """Returns the page numbers to link to around the given page of a Paginator."""
+    return page.paginator.get_elided_page_range(page.number)
+
+
+@register.simple_tag(takes_context=True)
+def page_url(context, number):
+    """Returns the query string of the given page, keeping the other parameters."""
+    params = context["request"].GET.copy()
+    params["page"] = number
+    return f"?{params.urlencode()}"
+
+
 @register.filter
 def weekday_date(value):
     if isinstance(value, datetime.date):
@@ -20,8 +20,8 @@ from django.test import TestCase
 from freezegun import freeze_time
 from parameterized import parameterized
 
-from championship.factories import EventFactory
-from championship.models import Event
+from championship.factories import EventFactory, ResultFactory
+from championship.models import Event, Result
 from championship.seasons.definitions import SEASON_2023
 from multisite.factories import SiteFactory
 
@@ -131,3 +131,74 @@ class QuerysetTestCase(TestCase):
         e1 = EventFactory(category=Event.Category.REGULAR)
         EventFactory(organizer__site=SiteFactory(), category=Event.Category.REGULAR)
         self.assertQuerysetEqual(Event.objects.on_site(), [e1])
+
+
+class ResultAggregatesTestCase(TestCase):
+    def setUp(self):
+        self.event = EventFactory()
+
+    def assertAggregates(self, size, rounds, top_count):
+        self.event.refresh_from_db()
+        self.assertEqual(
+            (size, rounds, top_count),
+            (self.event.size, self.event.rounds, self.event.top_count),
+        )
+
+    def test_new_event_has_no_results(self):
+        self.assertAggregates(size=0, rounds=0, top_count=0)
+        self.assertFalse(self.event.has_top8)
+
+    def test_saving_results_updates_aggregates(self):
+        ResultFactory(event=self.event, win_count=3, loss_count=1, draw_count=0)
+        ResultFactory(
+            event=self.event,
+            win_count=2,
+            loss_count=2,
+            draw_count=1,
+            playoff_result=Result.PlayoffResult.WINNER,
+        )
+
+        self.assertAggregates(size=2, rounds=5, top_count=1)
+        self.assertTrue(self.event.has_top8)
+
+    def test_deleting_results_updates_aggregates(self):
+        ResultFactory(
+            event=self.event,
+            win_count=3,
+            loss_count=0,
+            draw_count=0,
+            playoff_result=Result.PlayoffResult.WINNER,
+        )
+        result = ResultFactory(
+            event=self.event, win_count=1, loss_count=2, draw_count=1
+        )
+
+        result.delete()
+        self.assertAggregates(size=1, rounds=3, top_count=1)
+
+        self.event.result_set.all().delete()
+        self.assertAggregates(size=0, rounds=0, top_count=0)
+
+    def test_bulk_writes_require_an_update(self):
+        ResultFactory(event=self.event, win_count=3, loss_count=0, draw_count=0)
+        self.event.result_set.update(playoff_result=Result.PlayoffResult.WINNER)
+        self.assertAggregates(size=1, rounds=3, top_count=0)
+
+        self.event.update_result_aggregates()
+
+        self.assertEqual(1, self.event.top_count)
+        self.assertAggregates(size=1, rounds=3, top_count=1)
+
+    def test_queryset_update(self):
+        other = EventFactory()
+        ResultFactory(event=self.event)
+        ResultFactory(event=other)
+        ResultFactory(event=other)
+        Event.objects.update(size=0)
+
+        Event.objects.update_result_aggregates()
+
+        self.assertEqual(
+            {self.event.pk: 1, other.pk: 2},
+            dict(Event.objects.values_list("pk", "size")),
+        )
@@ -19,6 +19,7 @@ from django.test import TestCase
 from parameterized import parameterized
 
 from championship.factories import (
+    EventOrganizerFactory,
     OldCategoryRankedEventFactory,
     OrganizerLeagueFactory,
     ResultFactory,
@@ -150,3 +151,56 @@ class OrganizerLeagueTest(TestCase):
 
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0], result_without_playoffs)
+
+
+class OrganizerLeagueCoveringTest(TestCase):
+    def setUp(self):
+        self.league = OrganizerLeagueFactory(
+            start_date=datetime.date(2024, 7, 1),
+            end_date=datetime.date(2024, 7, 31),
+            format=Event.Format.MODERN,
+            category=Event.Category.REGIONAL,
+        )
+
+    def covering(self, **kwargs):
+        kwargs = {
+            "organizer": self.league.organizer,
+            "date": datetime.date(2024, 7, 15),
+            "format": Event.Format.MODERN,
+            "category": Event.Category.REGULAR,
+            **kwargs,
+        }
+        return list(OrganizerLeague.objects.covering(Event(**kwargs)))
+
+    def test_covers_events_counting_towards_the_league(self):
+        self.assertEqual(self.covering(), [self.league])
+        self.assertEqual(self.covering(category=Event.Category.REGIONAL), [self.league])
+
+    @parameterized.expand(
+        [
+            ("before", datetime.date(2024, 6, 30)),
+            ("first_day", datetime.date(2024, 7, 1)),
+            ("last_day", datetime.date(2024, 7, 31)),
+            ("after", datetime.date(2024, 8, 1)),
+        ]
+    )
+    def test_date_range(self, _, date):
+        want = (
+            [self.league]
+            if self.league.start_date <= date <= self.league.end_date
+            else []
+        )
+        self.assertEqual(self.covering(date=date), want)
+
+    def test_excludes_other_formats_and_higher_categories(self):
+        self.assertEqual(self.covering(format=Event.Format.STANDARD), [])
+        self.assertEqual(self.covering(category=Event.Category.PREMIER), [])
+        self.assertEqual(self.covering(category=Event.Category.OTHER), [])
+
+    def test_all_formats_league_covers_any_format(self):
+        self.league.format = OrganizerLeague.Format.All_FORMATS
+        self.league.save()
+        self.assertEqual(self.covering(format=Event.Format.STANDARD), [self.league])
+
+    def test_excludes_other_organizers(self):
+        self.assertEqual(self.covering(organizer=EventOrganizerFactory()), [])
@@ -16,7 +16,8 @@ from django.test import TestCase
 
 from parameterized import parameterized
 
-from championship.models import Player
+from championship.factories import PlayerFactory
+from championship.models import Player, PlayerAlias
 
 
 class PlayerNameTestCase(TestCase):
@@ -32,3 +33,46 @@ class PlayerNameTestCase(TestCase):
     def test_shows_initials_for_hidden_players(self, name, want):
         got = Player(name=name, hidden_from_leaderboard=True).get_name_display()
         self.assertEqual(got, want)
+
+
+class PlayerBulkNameResolutionTestCase(TestCase):
+    def test_resolves_aliases(self):
+        player = PlayerFactory()
+        PlayerAlias.objects.create(name="Darth Vader", true_player=player)
+
+        self.assertEqual(
+            [player], Player.objects.get_or_create_by_names(["Darth Vader"])
+        )
+
+    def test_reuses_existing_players(self):
+        player = PlayerFactory(name="Antoine Albertelli")
+
+        got = Player.objects.get_or_create_by_names(["antoine  albertelli"])
+
+        self.assertEqual([player], got)
+        self.assertEqual(1, Player.objects.count())
+
+    def test_creates_missing_players(self):
+        got = Player.objects.get_or_create_by_names(["Jari Rentsch", "Leon Kouba"])
+
+        self.assertEqual(["Jari Rentsch", "Leon Kouba"], [p.name for p in got])
+        self.assertTrue(all(p.pk for p in got))
+        self.assertEqual(2, Player.objects.count())
+
+    def test_keeps_order_and_duplicates(self):
+        player = PlayerFactory(name="Antoine Albertelli")
+
+        got = Player.objects.get_or_create_by_names(
+            ["Jari Rentsch", "Antoine Albertelli", "jari rentsch"]
+        )
+
+        self.assertEqual(got[0], got[2])
+        self.assertEqual(player, got[1])
+        self.assertEqual(2, Player.objects.count())
+
+    def test_number_of_queries_does_not_depend_on_names(self):
+        PlayerFactory(name="Antoine Albertelli")
+        names = ["Antoine Albertelli"] + [f"Player {i}" for i in range(50)]
+
+        with self.assertNumQueries(3):
+            Player.objects.get_or_create_by_names(names)
@@ -0,0 +1,159 @@
+# Copyright 2026 Leonin League
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+
+from django.test import SimpleTestCase, TestCase
+
+from championship.factories import Event2025Factory, PlayerFactory
+from championship.models import Event
+from championship.score import get_leaderboard_page, get_top_n
+from championship.score.generic import combine_scores_with_players
+from championship.score.types import Leaderboard, LeaderboardScore, QualificationType
+from championship.seasons.definitions import SEASON_2025
+
+
+class LeaderboardTestCase(SimpleTestCase):
+    def setUp(self):
+        self.scores = {
+            12: LeaderboardScore(total_score=20, rank=2, byes=1),
+            7: LeaderboardScore(
+                total_score=30,
+                rank=1,
+                byes=2,
+                qualification_type=QualificationType.DIRECT,
+                qualification_reason="Direct qualification for 1st place",
+            ),
+            3: LeaderboardScore(
+                total_score=10,
+                rank=3,
+                qualification_type=QualificationType.LEADERBOARD,
+                qualification_reason="Qualified for SUL Championship",
+            ),
+            5: LeaderboardScore(
+                total_score=5,
+                rank=4,
+                qualification_type=QualificationType.LEADERBOARD,
+                qualification_reason="Qualified for SUL Championship",
+            ),
+        }
+        self.leaderboard = Leaderboard.from_scores(self.scores)
+
+    def test_behaves_like_a_dict(self):
+        self.assertEqual(self.scores, dict(self.leaderboard))
+        self.assertEqual(4, len(self.leaderboard))
+        self.assertIn(12, self.leaderboard)
+        self.assertNotIn(13, self.leaderboard)
+        self.assertIsNone(self.leaderboard.get(13))
+
+    def test_ordered_by_rank(self):
+        self.assertEqual([7, 12, 3, 5], list(self.leaderboard))
+
+    def test_reasons_are_stored_once(self):
+        self.assertEqual(
+            [
+                "Direct qualification for 1st place",
+                "",
+                "Qualified for SUL Championship",
+            ],
+            self.leaderboard.reasons,
+        )
+
+    def test_serialization(self):
+        got = Leaderboard.from_bytes(self.leaderboard.to_bytes())
+        self.assertEqual(self.scores, dict(got))
+
+    def test_pickle(self):
+        got = pickle.loads(pickle.dumps(self.leaderboard))
+        self.assertEqual(self.scores, dict(got))
+
+    def test_empty(self):
+        got = pickle.loads(pickle.dumps(Leaderboard.from_scores({})))
+        self.assertEqual({}, dict(got))
+
+    def test_scores_are_read_only(self):
+        self.leaderboard[7].total_score = 0
+        self.assertEqual(30, self.leaderboard[7].total_score)
+
+
+class CombineScoresWithPlayersTestCase(TestCase):
+    def setUp(self):
+        self.players = PlayerFactory.create_batch(5)
+        # Scores are given in reverse order of creation of the players.
+        self.leaderboard = Leaderboard.from_scores(
+            {
+                player.id: LeaderboardScore(total_score=10 - rank, rank=rank)
+                for rank, player in enumerate(reversed(self.players), 1)
+            }
+        )
+        # Not on the leaderboard.
+        PlayerFactory.create_batch(3)
+
+    def test_ordered_by_rank(self):
+        got = combine_scores_with_players(self.leaderboard)
+        self.assertEqual(list(reversed(self.players)), got)
+        self.assertEqual([1, 2, 3, 4, 5], [p.score.rank for p in got])
+
+    def test_top(self):
+        with self.assertNumQueries(1):
+            got = combine_scores_with_players(self.leaderboard, top=2)
+        self.assertEqual([self.players[4], self.players[3]], got)
+
+    def test_skips_hidden_players(self):
+        self.players[4].hidden_from_leaderboard = True
+        self.players[4].save()
+
+        got = combine_scores_with_players(self.leaderboard, top=2)
+
+        self.assertEqual([self.players[3], self.players[2]], got)
+        self.assertEqual([2, 3], [p.score.rank for p in got])
+
+    def test_top_larger_than_leaderboard(self):
+        self.assertEqual(5, len(combine_scores_with_players(self.leaderboard, top=10)))
+
+
+class LeaderboardPageTestCase(TestCase):
+    def setUp(self):
+        event = Event2025Factory(category=Event.Category.REGULAR, players=5)
+        self.ranked_players = [r.player for r in event.result_set.order_by("ranking")]
+
+    def test_top_n(self):
+        self.assertEqual(self.ranked_players[:2], get_top_n(SEASON_2025, n=2))
+
+    def test_page(self):
+        page = get_leaderboard_page(SEASON_2025, number=2, per_page=2)
+
+        self.assertEqual(self.ranked_players[2:4], page.object_list)
+        self.assertEqual(3, page.paginator.num_pages)
+
+    def test_last_page(self):
+        self.assertEqual(
+            self.ranked_players[4:],
+            get_leaderboard_page(SEASON_2025, number=3, per_page=2).object_list,
+        )
+        self.assertEqual(
+            self.ranked_players[4:],
+            get_leaderboard_page(SEASON_2025, number=4, per_page=2).object_list,
+        )
+
+    def test_search(self):
+        player = self.ranked_players[3]
+        player.name = "Jace Beleren"
+        player.save()
+
+        page = get_leaderboard_page(SEASON_2025, per_page=2, search="beleren")
+
+        self.assertEqual([player], page.object_list)
+        self.assertEqual(4, page.object_list[0].score.rank)
+        self.assertEqual(1, page.paginator.num_pages)
@@ -0,0 +1,134 @@
+# Copyright 2026 Leonin League
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from championship.factories import (
+    Event2025Factory,
+    PlayerFactory,
+    ResultFactory,
+    SpecialRewardFactory,
+)
+from championship.models import Event, Result
+from championship.score.qualifications import (
+    DIRECT_QUALIFICATION_VARIANTS,
+    DirectQualification,
+    _premier_candidates,
+    resolve_direct_qualifications,
+)
+from championship.score.season_2024 import ScoreMethod2024
+from championship.seasons.definitions import SEASON_2025
+
+
+class DirectQualificationsTestCase(TestCase):
+    def create_premier(self, players, date=datetime.date(2025, 3, 1), name="Premier"):
+        event = Event2025Factory(category=Event.Category.PREMIER, date=date, name=name)
+        for i, player in enumerate(players):
+            ResultFactory(event=event, player=player, ranking=i + 1)
+        return event
+
+    def test_winner_is_qualified(self):
+        players = PlayerFactory.create_batch(5)
+        self.create_premier(players)
+
+        self.assertEqual(
+            {players[0].id: DirectQualification(ranking="1st", event_name="Premier")},
+            resolve_direct_qualifications(SEASON_2025),
+        )
+
+    def test_playoffs_come_before_swiss_ranking(self):
+        players = PlayerFactory.create_batch(5)
+        event = self.create_premier(players)
+        Result.objects.filter(event=event, player=players[2]).update(
+            playoff_result=Result.PlayoffResult.WINNER
+        )
+
+        self.assertEqual(
+            [players[2].id], list(resolve_direct_qualifications(SEASON_2025))
+        )
+
+    def test_invite_is_passed_down(self):
+        players = PlayerFactory.create_batch(5)
+        self.create_premier(players, date=datetime.date(2025, 3, 1))
+        self.create_premier(players, date=datetime.date(2025, 4, 1), name="Second")
+
+        qualifications = resolve_direct_qualifications(SEASON_2025)
+
+        self.assertEqual([players[0].id, players[1].id], list(qualifications))
+        self.assertEqual(
+            DirectQualification(ranking="2nd", event_name="Second"),
+            qualifications[players[1].id],
+        )
+
+    def test_special_rewards_come_first(self):
+        players = PlayerFactory.create_batch(5)
+        event = self.create_premier(players)
+        SpecialRewardFactory(
+            direct_invite=True, result=event.result_set.get(player=players[0])
+        )
+
+        self.assertEqual(
+            [players[0].id, players[1].id],
+            list(resolve_direct_qualifications(SEASON_2025)),
+        )
+        self.assertEqual(
+            [players[0].id],
+            list(resolve_direct_qualifications(SEASON_2025, rewards_first=False)),
+        )
+
+    def test_small_events_are_ignored(self):
+        self.create_premier(PlayerFactory.create_batch(5))
+
+        self.assertEqual({}, resolve_direct_qualifications(SEASON_2025, min_players=6))
+
+    def test_only_top_results_are_loaded(self):
+        players = PlayerFactory.create_batch(10)
+        first = self.create_premier(players, date=datetime.date(2025, 3, 1))
+        second = self.create_premier(players, date=datetime.date(2025, 4, 1))
+
+        candidates = [
+            (r.event_id, r.ranking)
+            for r in _premier_candidates(
+                SEASON_2025, already_qualified=0, min_players=0
+            )
+        ]
+
+        self.assertEqual([(first.id, 1), (second.id, 1), (second.id, 2)], candidates)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class DirectQualificationsCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_arguments_are_cached_separately(self):
+        event = Event2025Factory(
+            category=Event.Category.PREMIER, date=datetime.date(2025, 3, 1)
+        )
+        player = ResultFactory(event=event, ranking=1).player
+
+        self.assertEqual([player.id], list(resolve_direct_qualifications(SEASON_2025)))
+        self.assertEqual({}, resolve_direct_qualifications(SEASON_2025, min_players=6))
+
+    def test_score_method_arguments_are_listed(self):
+        self.assertIn((0, True), DIRECT_QUALIFICATION_VARIANTS)
+        self.assertIn(
+            (ScoreMethod2024.MIN_PLAYERS_FOR_DIRECT_QUALIFICATION, False),
+            DIRECT_QUALIFICATION_VARIANTS,
+        )
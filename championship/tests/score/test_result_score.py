@@ -0,0 +1,141 @@
+# Copyright 2026 Leonin League
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from championship.factories import Event2025Factory
+from championship.models import Event, ResultScore
+from championship.score import compute_scores
+from championship.score.generic import refresh_result_scores, score_cache_invalidator
+from championship.seasons.definitions import SEASON_2025
+
+
+class ResultScoreTestCase(TestCase):
+    def setUp(self):
+        self.event = Event2025Factory(category=Event.Category.REGULAR, players=4)
+        self.other_event = Event2025Factory(category=Event.Category.REGULAR, players=4)
+        # Drops what the factories recorded, as TestCase never commits
+        score_cache_invalidator.flush()
+
+    def test_scores_are_materialized(self):
+        compute_scores(SEASON_2025)
+        self.assertEqual(8, ResultScore.objects.filter(season_slug="2025").count())
+
+    def test_refresh_only_touches_stale_events(self):
+        refresh_result_scores(SEASON_2025)
+        untouched = set(
+            ResultScore.objects.filter(result__event=self.other_event).values_list(
+                "id", flat=True
+            )
+        )
+
+        result = self.event.result_set.first()
+        result.points += 3
+        result.win_count += 1
+        with self.captureOnCommitCallbacks(execute=True):
+            result.save()
+        self.assertFalse(ResultScore.objects.filter(result__event=self.event).exists())
+
+        refresh_result_scores(SEASON_2025)
+        self.assertEqual(
+            4, ResultScore.objects.filter(result__event=self.event).count()
+        )
+        self.assertEqual(
+            untouched,
+            set(
+                ResultScore.objects.filter(result__event=self.other_event).values_list(
+                    "id", flat=True
+                )
+            ),
+        )
+
+    def test_score_follows_result_edits(self):
+        result = self.event.result_set.get(ranking=1)
+        before = compute_scores(SEASON_2025)[result.player_id].total_score
+
+        result.points += 3
+        with self.captureOnCommitCallbacks(execute=True):
+            result.save()
+
+        after = compute_scores(SEASON_2025)[result.player_id].total_score
+        self.assertEqual(before + 3, after)
+
+    def test_result_moved_to_another_event(self):
+        refresh_result_scores(SEASON_2025)
+        result = self.event.result_set.first()
+
+        result.event = self.other_event
+        with self.captureOnCommitCallbacks(execute=True):
+            result.save()
+
+        self.assertFalse(ResultScore.objects.filter(result__event=self.event).exists())
+        self.assertFalse(
+            ResultScore.objects.filter(result__event=self.other_event).exists()
+        )
+
+    def test_result_scores_are_dropped_on_commit(self):
+        refresh_result_scores(SEASON_2025)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            for result in self.event.result_set.all():
+                result.points += 3
+                result.save()
+        self.assertEqual(
+            4, ResultScore.objects.filter(result__event=self.event).count()
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            for callback in callbacks:
+                callback()
+        deletes = [
+            q
+            for q in queries
+            if q["sql"].startswith('DELETE FROM "championship_resultscore"')
+        ]
+        self.assertEqual(1, len(deletes))
+        self.assertFalse(ResultScore.objects.filter(result__event=self.event).exists())
+
+    def test_deleted_results_stop_scoring(self):
+        result = self.event.result_set.get(ranking=1)
+        compute_scores(SEASON_2025)
+
+        result.delete()
+
+        self.assertNotIn(result.player_id, compute_scores(SEASON_2025))
+
+    def test_category_change_rescores_event(self):
+        compute_scores(SEASON_2025)
+
+        Event.objects.filter(pk=self.event.pk).update(category=Event.Category.REGIONAL)
+
+        refresh_result_scores(SEASON_2025)
+        self.assertEqual(
+            {Event.Category.REGIONAL},
+            set(
+                ResultScore.objects.filter(result__event=self.event).values_list(
+                    "category", flat=True
+                )
+            ),
+        )
+
+    def test_event_moved_out_of_season(self):
+        result = self.event.result_set.get(ranking=1)
+        compute_scores(SEASON_2025)
+
+        self.event.date = SEASON_2025.end_date.replace(year=2026)
+        self.event.save()
+
+        self.assertNotIn(result.player_id, compute_scores(SEASON_2025))
@@ -0,0 +1,49 @@
+# Copyright 2026 Leonin League
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from championship.factories import (
+    Event2024Factory,
+    Event2025Factory,
+    SpecialRewardFactory,
+)
+from championship.score.season_2024 import ScoreMethod2024
+from championship.score.season_2025 import ScoreMethod2025
+
+
+class RewardByesQueriesTestCase(TestCase):
+    def test_queries_do_not_depend_on_rewards(self):
+        for score_method, event_factory in [
+            (ScoreMethod2024, Event2024Factory),
+            (ScoreMethod2025, Event2025Factory),
+        ]:
+            with self.subTest(score_method.__name__):
+                results = list(event_factory(players=20).result_set.all())
+                scores_by_player = {
+                    r.player_id: score_method.Score(qps=r.points, byes=0)
+                    for r in results
+                }
+                with CaptureQueriesContext(connection) as without_rewards:
+                    score_method.finalize_scores(scores_by_player)
+
+                for result in results:
+                    SpecialRewardFactory(byes=1, result=result)
+                with CaptureQueriesContext(connection) as with_rewards:
+                    scores = score_method.finalize_scores(scores_by_player)
+
+                self.assertEqual(len(without_rewards), len(with_rewards))
+                self.assertEqual([1] * 16, [s.byes for s in scores.values()][4:])
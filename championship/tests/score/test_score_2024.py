@@ -283,6 +283,35 @@ class ScoresWithMatchPointRateTestCase(TestCase):
                 got_score = self.score(match_points - 1, total_rounds)
                 self.assertEqual(want_score, got_score)
 
+    def test_event_without_rounds_gives_no_mpr_points(self):
+        # e.g. results uploaded with their points but without their record
+        self.event.category = Event.Category.PREMIER
+        self.event.save()
+        ResultFactory(
+            event=self.event,
+            ranking=1,
+            points=9,
+            win_count=0,
+            loss_count=0,
+            draw_count=0,
+            playoff_result=Result.PlayoffResult.WINNER,
+        )
+        result = ResultFactory(
+            event=self.event,
+            ranking=2,
+            points=9,
+            win_count=0,
+            loss_count=0,
+            draw_count=0,
+        )
+
+        score = compute_scores(SEASON_2024)[result.player_id]
+
+        want_score = (9 + ScoreMethod2024.PARTICIPATION_POINTS) * ScoreMethod2024.MULT[
+            Event.Category.PREMIER
+        ]
+        self.assertEqual(want_score, score.total_score)
+
 
 class TestSortResults(TestCase):
     def test_can_order_basic_player_results(self):
@@ -0,0 +1,294 @@
+# Copyright 2026 Leonin League
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from championship.factories import (
+    Event2025Factory,
+    EventFactory,
+    OrganizerLeagueFactory,
+    ResultFactory,
+    SpecialRewardFactory,
+)
+from championship.models import Event
+from championship.score.generic import (
+    _organizer_score_cache_key,
+    _score_cache_key,
+    invalidate_event_scores,
+    score_cache_invalidator,
+)
+from championship.score.player_stats import _player_season_stats_cache_key
+from championship.score.qualifications import direct_qualifications_cache_keys
+from championship.seasons.definitions import (
+    EU_SEASON_2025,
+    SEASON_2024,
+    SEASON_2025,
+    SWISS_SEASON_ALL,
+)
+from multisite.tests.utils import with_site
+
+
+@patch("championship.score.generic.compute_scores.invalidate")
+class ScoreCacheInvalidationTestCase(TestCase):
+    def setUp(self):
+        self.event = Event2025Factory(players=4, date=SEASON_2025.end_date)
+        # The transaction of the test case is never committed, drop what the
+        # factories recorded.
+        score_cache_invalidator.flush()
+        self.swiss_keys = {
+            _score_cache_key(SEASON_2025),
+            _score_cache_key(SWISS_SEASON_ALL),
+        }
+
+    def test_caches_are_dropped_on_commit(self, invalidate):
+        with self.captureOnCommitCallbacks(execute=True):
+            result = self.event.result_set.first()
+            result.points += 3
+            result.save()
+            invalidate.assert_not_called()
+
+        invalidate.assert_called_once_with(self.swiss_keys)
+
+    def test_caches_are_dropped_once_per_transaction(self, invalidate):
+        with self.captureOnCommitCallbacks(execute=True):
+            for result in self.event.result_set.all():
+                result.points += 3
+                result.save()
+            self.event.result_set.first().delete()
+
+        invalidate.assert_called_once_with(self.swiss_keys)
+
+    def test_caches_are_dropped_after_bulk_changes(self, invalidate):
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_event_scores(self.event)
+
+        invalidate.assert_called_once_with(self.swiss_keys)
+
+    def test_caches_are_dropped_on_category_change(self, invalidate):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.event.category = Event.Category.PREMIER
+            self.event.save()
+
+        invalidate.assert_called_once_with(self.swiss_keys)
+
+    def test_caches_of_both_seasons_are_dropped_on_date_change(self, invalidate):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.event.date = SEASON_2024.end_date
+            self.event.save()
+
+        invalidate.assert_called_once_with(
+            self.swiss_keys | {_score_cache_key(SEASON_2024)}
+        )
+
+    def test_caches_of_the_previous_event_are_dropped(self, invalidate):
+        other_event = Event2025Factory(date=SEASON_2024.end_date)
+        score_cache_invalidator.flush()
+        invalidate.reset_mock()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            result = self.event.result_set.first()
+            result.event = other_event
+            result.save()
+
+        invalidate.assert_called_once_with(
+            self.swiss_keys | {_score_cache_key(SEASON_2024)}
+        )
+
+    def test_caches_are_kept_on_rollback(self, invalidate):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            result = self.event.result_set.first()
+            result.save()
+
+        invalidate.assert_not_called()
+        self.assertTrue(callbacks)
+
+    @with_site(EU_SEASON_2025.domain)
+    def test_drops_caches_of_the_countries_of_the_players(self, invalidate):
+        event = EventFactory(season=EU_SEASON_2025)
+        ResultFactory(event=event, player_country="IT")
+        ResultFactory(event=event, player_country="IT")
+        ResultFactory(event=event, player_country="FR")
+        ResultFactory(event=event, player_country="DE")
+        # Drops what the factories recorded, as TestCase never commits
+        score_cache_invalidator.flush()
+        invalidate.reset_mock()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_event_scores(event)
+
+        invalidate.assert_called_once_with(
+            {
+                _score_cache_key(EU_SEASON_2025, "IT"),
+                _score_cache_key(EU_SEASON_2025, "FR"),
+                _score_cache_key(EU_SEASON_2025, "DE"),
+            }
+        )
+
+
+@patch("championship.score.generic.compute_organizer_scores.invalidate")
+class OrganizerScoreCacheInvalidationTestCase(TestCase):
+    def setUp(self):
+        self.event = Event2025Factory(
+            players=4,
+            date=SEASON_2025.end_date,
+            format=Event.Format.MODERN,
+            category=Event.Category.REGULAR,
+        )
+        self.league = OrganizerLeagueFactory(
+            organizer=self.event.organizer,
+            start_date=SEASON_2025.start_date,
+            end_date=SEASON_2025.end_date,
+            format=Event.Format.MODERN,
+            category=Event.Category.REGIONAL,
+        )
+        score_cache_invalidator.player_ids_by_event.clear()
+        score_cache_invalidator.organizer_keys.clear()
+
+    def deleted_keys(self, invalidate):
+        return set().union(*(c.args[0] for c in invalidate.call_args_list))
+
+    def test_result_change_drops_league(self, invalidate):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.event.result_set.first().save()
+
+        self.assertIn(
+            _organizer_score_cache_key(self.league), self.deleted_keys(invalidate)
+        )
+
+    def test_unrelated_league_is_kept(self, invalidate):
+        other_league = OrganizerLeagueFactory(
+            organizer=self.event.organizer,
+            start_date=SEASON_2025.start_date,
+            end_date=SEASON_2025.end_date,
+            format=Event.Format.STANDARD,
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.event.result_set.first().save()
+
+        self.assertNotIn(
+            _organizer_score_cache_key(other_league), self.deleted_keys(invalidate)
+        )
+
+    def test_event_leaving_league_drops_league(self, invalidate):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.event.format = Event.Format.STANDARD
+            self.event.save()
+
+        self.assertIn(
+            _organizer_score_cache_key(self.league), self.deleted_keys(invalidate)
+        )
+
+
+@patch("championship.score.generic.resolve_direct_qualifications.invalidate")
+class DirectQualificationCacheInvalidationTestCase(TestCase):
+    def setUp(self):
+        self.premier = Event2025Factory(
+            players=4, date=SEASON_2025.end_date, category=Event.Category.PREMIER
+        )
+        self.regular = Event2025Factory(
+            players=4, date=SEASON_2025.end_date, category=Event.Category.REGULAR
+        )
+        score_cache_invalidator.player_ids_by_event.clear()
+        score_cache_invalidator.organizer_keys.clear()
+        score_cache_invalidator.direct_qualification_keys.clear()
+
+    def test_premier_result_change_drops_qualifications(self, invalidate):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.premier.result_set.first().save()
+
+        invalidate.assert_called_once()
+        self.assertLessEqual(
+            direct_qualifications_cache_keys(SEASON_2025),
+            set(invalidate.call_args.args[0]),
+        )
+
+    def test_regular_result_change_keeps_qualifications(self, invalidate):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.regular.result_set.first().save()
+
+        invalidate.assert_not_called()
+
+    def test_event_becoming_premier_drops_qualifications(self, invalidate):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.regular.category = Event.Category.PREMIER
+            self.regular.save()
+
+        invalidate.assert_called_once()
+        self.assertLessEqual(
+            direct_qualifications_cache_keys(SEASON_2025),
+            set(invalidate.call_args.args[0]),
+        )
+
+    def test_special_reward_drops_qualifications(self, invalidate):
+        with self.captureOnCommitCallbacks(execute=True):
+            SpecialRewardFactory(
+                direct_invite=True, result=self.regular.result_set.first()
+            )
+
+        invalidate.assert_called_once()
+        self.assertLessEqual(
+            direct_qualifications_cache_keys(SEASON_2025),
+            set(invalidate.call_args.args[0]),
+        )
+
+
+@patch("championship.score.generic.compute_player_season_stats.invalidate")
+class PlayerSeasonStatsCacheInvalidationTestCase(TestCase):
+    def setUp(self):
+        self.event = Event2025Factory(players=2, date=SEASON_2025.end_date)
+        self.player_ids = list(
+            self.event.result_set.values_list("player_id", flat=True)
+        )
+        score_cache_invalidator.player_ids_by_event.clear()
+        score_cache_invalidator.player_stats_events.clear()
+
+    def keys(self, player_ids):
+        return {
+            _player_season_stats_cache_key(player_id, season)
+            for player_id in player_ids
+            for season in [SEASON_2025, SWISS_SEASON_ALL]
+        }
+
+    def test_result_change_drops_stats_of_its_player(self, invalidate):
+        result = self.event.result_set.first()
+        with self.captureOnCommitCallbacks(execute=True):
+            result.save()
+
+        invalidate.assert_called_once_with(self.keys([result.player_id]))
+
+    def test_event_change_drops_stats_of_all_its_players(self, invalidate):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.event.format = Event.Format.LEGACY
+            self.event.save()
+
+        invalidate.assert_called_once_with(self.keys(self.player_ids))
+
+    def test_organizer_rename_drops_stats_of_its_players(self, invalidate):
+        organizer = self.event.organizer
+        with self.captureOnCommitCallbacks(execute=True):
+            organizer.name = "Renamed"
+            organizer.save()
+
+        invalidate.assert_called_once_with(self.keys(self.player_ids))
+
+    def test_organizer_change_keeps_stats(self, invalidate):
+        organizer = self.event.organizer
+        with self.captureOnCommitCallbacks(execute=True):
+            organizer.description = "New description"
+            organizer.save()
+
+        invalidate.assert_not_called()
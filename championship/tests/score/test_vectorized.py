@@ -0,0 +1,56 @@
+# Copyright 2026 Leonin League
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Runs the score test suites again with the vectorized score methods.
+
+The vectorized score methods must give exactly the same leaderboards as the
+score methods they are derived from.
+"""
+
+import inspect
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from championship.score.generic import SCOREMETHOD_PER_SEASON
+from championship.score.vectorized import (
+    VectorizedScoreMethod2024,
+    VectorizedScoreMethod2025,
+    VectorizedScoreMethodInvitationalSpring2025,
+)
+from championship.seasons.definitions import (
+    INVITATIONAL_SPRING_2025,
+    SEASON_2024,
+    SEASON_2025,
+)
+from championship.tests.score import (
+    test_score_2024,
+    test_score_2025,
+    test_score_invitational_2025,
+)
+
+VECTORIZED_SCOREMETHOD_PER_SEASON = {
+    SEASON_2024: VectorizedScoreMethod2024,
+    SEASON_2025: VectorizedScoreMethod2025,
+    INVITATIONAL_SPRING_2025: VectorizedScoreMethodInvitationalSpring2025,
+}
+
+for module in [test_score_2024, test_score_2025, test_score_invitational_2025]:
+    for name, test_case in inspect.getmembers(module, inspect.isclass):
+        if issubclass(test_case, TestCase) and test_case.__module__ == module.__name__:
+            suite = module.__name__.rsplit(".", 1)[-1].removeprefix("test_")
+            vectorized_name = f"Vectorized_{suite}_{name}"
+            globals()[vectorized_name] = patch.dict(
+                SCOREMETHOD_PER_SEASON, VECTORIZED_SCOREMETHOD_PER_SEASON
+            )(type(vectorized_name, (test_case,), {"__module__": __name__}))
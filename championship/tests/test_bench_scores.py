@@ -0,0 +1,69 @@
+# Copyright 2026 Leonin League
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from championship.models import Result, SpecialReward
+from championship.seasons.definitions import SEASON_2025
+
+
+class BenchScoresTest(TestCase):
+    def bench(self, *args):
+        stdout = StringIO()
+        call_command(
+            "bench_scores",
+            "--results=320",
+            "--repeat=1",
+            *args,
+            stdout=stdout,
+            stderr=StringIO(),
+        )
+        return json.loads(stdout.getvalue())
+
+    def test_times_each_step(self):
+        rows = self.bench("--season", SEASON_2025.slug, "--label", "abc")
+
+        self.assertEqual(
+            [
+                "compute_scores_cold",
+                "compute_scores_warm",
+                "get_results_with_qps",
+                "finalize_scores",
+            ],
+            [row["step"] for row in rows],
+        )
+        for row in rows:
+            self.assertEqual("abc", row["label"])
+            self.assertEqual(SEASON_2025.slug, row["season"])
+            self.assertEqual(320, row["results"])
+            self.assertEqual(3, row["rewards"])
+            self.assertGreater(row["queries"], 0)
+
+    def test_synthetic_data_is_rolled_back(self):
+        self.bench("--season", SEASON_2025.slug)
+        self.assertFalse(Result.objects.exists())
+        self.assertFalse(SpecialReward.objects.exists())
+
+    def test_finalize_scores_is_timed_at_each_size(self):
+        rows = self.bench(
+            "--season", SEASON_2025.slug, "--results=640", "--rewards-per-thousand=50"
+        )
+
+        finalize = [row for row in rows if row["step"] == "finalize_scores"]
+        self.assertEqual([320, 640], [row["results"] for row in finalize])
+        self.assertEqual([16, 32], [row["rewards"] for row in finalize])
@@ -0,0 +1,144 @@
+# Copyright 2026 Leonin League
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import tempfile
+from unittest.mock import patch
+
+from django.core.cache.backends.filebased import FileBasedCache
+from django.test import SimpleTestCase
+
+from championship.cache_backend import TwoTierCache
+
+
+class Unpickled:
+    """Counts how many times instances are read from a file."""
+
+    count = 0
+
+    def __init__(self):
+        self.value = 42
+
+    def __setstate__(self, state):
+        Unpickled.count += 1
+        self.__dict__.update(state)
+
+
+class TwoTierCacheTestCase(SimpleTestCase):
+    def setUp(self):
+        Unpickled.count = 0
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        # Two caches sharing the same directory behave like two workers.
+        self.worker = self.make_cache()
+        self.other_worker = self.make_cache()
+
+    def make_cache(self, max_entries=128):
+        return TwoTierCache(
+            self.dir.name, {"OPTIONS": {"LOCAL_MAX_ENTRIES": max_entries}}
+        )
+
+    def test_values_are_shared(self):
+        self.worker.set("key", {"a": 1})
+        self.assertEqual({"a": 1}, self.other_worker.get("key"))
+
+    def test_hot_keys_are_served_from_memory(self):
+        self.worker.set("key", Unpickled())
+        self.assertIsInstance(self.other_worker.get("key"), Unpickled)
+        self.assertEqual(1, Unpickled.count)
+
+        self.assertIsInstance(self.other_worker.get("key"), Unpickled)
+        self.assertEqual(1, Unpickled.count)
+
+    def test_hot_keys_do_not_read_files(self):
+        self.worker.set("key", 42)
+        # The version of the value is checked once
+        self.assertEqual(42, self.other_worker.get("key"))
+        self.assertEqual(42, self.other_worker.get("key"))
+
+        with patch.object(FileBasedCache, "get") as get:
+            self.assertEqual(42, self.other_worker.get("key"))
+
+        get.assert_not_called()
+
+    def test_entries_of_the_file_based_cache_are_ignored(self):
+        # e.g. entries written before switching to this backend
+        FileBasedCache(self.dir.name, {}).set("geocode", (46.5, 6.6))
+
+        self.assertIsNone(self.worker.get("geocode"))
+
+    def test_writes_keep_other_keys_in_memory(self):
+        self.worker.set("key", Unpickled())
+        self.other_worker.get("key")
+
+        # Like cache_function, which writes and deletes its lock and markers
+        self.worker.add("key:refreshing", True)
+        self.worker.set("other", 1)
+        self.worker.delete("key:refreshing")
+
+        self.assertIsInstance(self.other_worker.get("key"), Unpickled)
+        self.assertEqual(1, Unpickled.count)
+
+    def test_deletes_are_seen_by_other_workers(self):
+        self.worker.set("key", 42)
+        self.assertEqual(42, self.other_worker.get("key"))
+
+        self.worker.delete("key")
+
+        self.assertIsNone(self.other_worker.get("key"))
+
+    def test_updates_are_seen_by_other_workers(self):
+        self.worker.set("key", 42)
+        self.assertEqual(42, self.other_worker.get("key"))
+
+        self.worker.set("key", 43)
+
+        self.assertEqual(43, self.other_worker.get("key"))
+
+    def test_add_is_seen_by_other_workers(self):
+        self.worker.set("lock", 1)
+        self.assertEqual(1, self.other_worker.get("lock"))
+        self.worker.delete("lock")
+        self.assertTrue(self.worker.add("lock", 2))
+
+        self.assertEqual(2, self.other_worker.get("lock"))
+
+    def test_clear(self):
+        self.worker.set("key", 42)
+        self.assertEqual(42, self.other_worker.get("key"))
+
+        self.worker.clear()
+
+        self.assertIsNone(self.worker.get("key"))
+        self.assertIsNone(self.other_worker.get("key"))
+
+    def test_add_ignores_memory(self):
+        self.worker.set("lock", True)
+        self.assertFalse(self.other_worker.add("lock", True))
+        self.worker.delete("lock")
+        self.assertTrue(self.other_worker.add("lock", True))
+
+    def test_expired_values_are_dropped(self):
+        self.worker.set("key", 42, timeout=-1)
+        self.assertIsNone(self.worker.get("key"))
+        self.assertIsNone(self.other_worker.get("key"))
+
+    def test_memory_is_bounded(self):
+        worker = self.make_cache(max_entries=2)
+        for i in range(5):
+            self.other_worker.set(f"key{i}", i)
+        for i in range(5):
+            self.assertEqual(i, worker.get(f"key{i}"))
+
+        self.assertEqual(2, len(worker._local))
+        self.assertEqual(0, worker.get("key0"))
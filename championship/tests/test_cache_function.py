@@ -14,9 +14,10 @@
 
 from unittest.mock import ANY, patch
 
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 
-from championship.cache_function import cache_function
+from championship.cache_function import _expiry_key, _refresh_lock_key, cache_function
 
 
 @cache_function(cache_key="expensive")
@@ -66,3 +67,105 @@ class FunctionCacheTestCase(TestCase):
     def test_get_cache_custom_lookup_key(self, cache_get):
         cache_get.return_value = 42
         self.assertEqual(42, expensive_but_with_args(10))
+
+
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+    def count(self):
+        self.calls += 1
+        return self.calls
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class StaleWhileRevalidateTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.counter = Counter()
+        self.cached = cache_function(cache_key="swr", cache_ttl=60, stale_ttl=3600)(
+            self.counter.count
+        )
+
+    def test_value_is_cached(self):
+        self.assertEqual(1, self.cached())
+        self.assertEqual(1, self.cached())
+
+    def test_invalidated_value_is_computed_again(self):
+        self.cached()
+        self.cached.invalidate(["swr"])
+        self.assertEqual(2, self.cached())
+        self.assertEqual(2, self.cached())
+
+    def test_stale_value_is_served_during_refresh(self):
+        self.cached()
+        self.cached.invalidate(["swr"])
+        cache.set(_refresh_lock_key("swr"), True)
+
+        self.assertEqual(1, self.cached())
+        self.assertEqual(1, self.counter.calls)
+
+    def test_refresh_computes_fresh_value(self):
+        self.cached()
+        self.assertEqual(2, self.cached.refresh())
+        self.assertEqual(2, self.cached())
+        self.assertIsNone(cache.get(_refresh_lock_key("swr")))
+
+    def test_expired_value_is_computed_again(self):
+        self.cached()
+        cache.clear()
+        self.assertEqual(2, self.cached())
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class SingleFlightTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.counter = Counter()
+        self.cached = cache_function(cache_key="sf", single_flight=True)(
+            self.counter.count
+        )
+
+    def test_computes_when_nobody_else_does(self):
+        self.assertEqual(1, self.cached())
+        self.assertIsNone(cache.get(_refresh_lock_key("sf")))
+
+    @patch("championship.cache_function.SINGLE_FLIGHT_POLL_INTERVAL", 0)
+    def test_waits_for_value_computed_elsewhere(self):
+        cache.set(_refresh_lock_key("sf"), True)
+        with patch(
+            "championship.cache_function.cache.get", side_effect=[None, None, 42]
+        ):
+            self.assertEqual(42, self.cached())
+        self.assertEqual(0, self.counter.calls)
+
+    @patch("championship.cache_function.SINGLE_FLIGHT_WAIT", 0)
+    def test_computes_when_waiting_too_long(self):
+        cache.set(_refresh_lock_key("sf"), True)
+        self.assertEqual(1, self.cached())
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class EarlyExpirationTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.counter = Counter()
+        self.cached = cache_function(cache_key="ee", cache_ttl=60, early_expiration=1)(
+            self.counter.count
+        )
+
+    def test_fresh_value_is_served(self):
+        self.cached()
+        self.assertEqual(1, self.cached())
+
+    def test_value_close_to_expiry_is_computed_again(self):
+        self.cached()
+        # Pretend the value expires now and took a long time to compute.
+        cache.set(_expiry_key("ee"), (0, 3600))
+        self.assertEqual(2, self.cached())
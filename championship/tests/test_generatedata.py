@@ -12,13 +12,61 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from django.core.management import call_command
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.db import transaction
 from django.test import TestCase
 
-from championship.models import Player
+from championship.factories import PlayerFactory
+from championship.models import Event, EventOrganizer, Player, Result
 
 
 class GenerateFakeDataTest(TestCase):
     def test_generate_data(self):
         call_command("generatedata", players_count=4, events_count=2)
         self.assertEqual(4, Player.objects.all().count())
+
+
+class GenerateBulkDataTest(TestCase):
+    def generate(self, **kwargs):
+        call_command(
+            "generatedata",
+            bulk=True,
+            players_count=40,
+            organizers_count=2,
+            events_count=5,
+            seasons_count=2,
+            stderr=StringIO(),
+            **kwargs,
+        )
+
+    def test_generate_data(self):
+        self.generate()
+
+        self.assertEqual(40, Player.objects.count())
+        self.assertEqual(
+            2, EventOrganizer.objects.exclude(default_address=None).count()
+        )
+        self.assertEqual(10, Event.objects.exclude(address=None).count())
+        self.assertTrue(Result.objects.exists())
+
+    def test_is_seeded(self):
+        with transaction.atomic():
+            self.generate(seed=3)
+            first = list(
+                Result.objects.order_by("pk").values_list("player__name", "points")
+            )
+            transaction.set_rollback(True)
+
+        self.generate(seed=3)
+
+        self.assertEqual(
+            first,
+            list(Result.objects.order_by("pk").values_list("player__name", "points")),
+        )
+
+    def test_needs_empty_database(self):
+        PlayerFactory()
+        with self.assertRaises(CommandError):
+            self.generate()
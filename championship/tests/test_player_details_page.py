@@ -15,7 +15,10 @@
 import datetime
 
 from django.contrib.auth.models import User
-from django.test import Client, TestCase
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework.status import HTTP_404_NOT_FOUND
 
@@ -30,17 +33,17 @@ from championship.factories import (
 )
 from championship.models import Event, PlayerProfile, Result
 from championship.score.generic import SCOREMETHOD_PER_SEASON
-from championship.views import (
+from championship.score.player_stats import (
+    CATEGORY_ORDER,
     EVENTS,
-    LAST_RESULTS,
-    QP_TABLE,
     QPS,
     TABLE,
     TBODY,
     THEAD,
     Performance,
 )
-from championship.views.players import CATEGORY_ORDER, sorted_most_accomplished_results
+from championship.views import LAST_RESULTS, QP_TABLE
+from championship.views.players import sorted_most_accomplished_results
 from decklists.factories import DecklistFactory
 from multisite.tests.utils import with_site
 
@@ -419,6 +422,43 @@ class PlayerDetailsProfileTest(TestCase):
         )
         self.assertContains(response, expected_name)
 
+    def test_queries_do_not_depend_on_results(self):
+        profile = PlayerProfileFactory()
+        ResultFactory(player=profile.player, playoff_result=1)
+        # The first request fills caches that are not specific to the page
+        self.get_player_details_2023(profile.player)
+        with CaptureQueriesContext(connection) as queries:
+            self.get_player_details_2023(profile.player)
+
+        for _ in range(5):
+            ResultFactory(player=profile.player, playoff_result=2)
+        with self.assertNumQueries(len(queries)):
+            self.get_player_details_2023(profile.player)
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    )
+    def test_cached_page_does_not_query_results(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        profile = PlayerProfileFactory()
+        for playoff_result in [1, 2, None]:
+            ResultFactory(player=profile.player, playoff_result=playoff_result)
+        first = self.get_player_details_2023(profile.player)
+
+        with CaptureQueriesContext(connection) as queries:
+            second = self.get_player_details_2023(profile.player)
+
+        score_tables = ['"championship_result"', '"championship_resultscore"']
+        self.assertEqual(
+            [],
+            [q["sql"] for q in queries if any(t in q["sql"] for t in score_tables)],
+        )
+        self.assertEqual(first.context[LAST_RESULTS], second.context[LAST_RESULTS])
+        self.assertEqual(
+            first.context["accomplishments"], second.context["accomplishments"]
+        )
+
 
 class AccomplishmentsSortTesCase(TestCase):
     def setUp(self):
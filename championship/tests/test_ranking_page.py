@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import datetime
+from unittest.mock import patch
 
 from django.contrib.sites.models import Site
 from django.shortcuts import reverse
@@ -79,6 +80,55 @@ class RankingTestCase(TestCase):
         response = self.client.get("/ranking/2022/")
         self.assertEqual(404, response.status_code)
 
+    @patch("championship.views.ranking.PLAYERS_PER_PAGE", 2)
+    def test_ranking_is_paginated(self):
+        event = OldCategoryRankedEventFactory(date=datetime.date(2023, 4, 1))
+        for points in [9, 6, 3]:
+            ResultFactory(event=event, points=points)
+
+        first_page = self.get_by_slug("2023").context["players"]
+        second_page = self.client.get(
+            reverse("ranking_by_season", kwargs={"slug": "2023"}), {"page": 2}
+        ).context["players"]
+
+        self.assertEqual([1, 2], [p.score.rank for p in first_page])
+        self.assertEqual([3], [p.score.rank for p in second_page])
+
+    @patch("championship.views.ranking.PLAYERS_PER_PAGE", 1)
+    def test_search_is_applied_before_pagination(self):
+        event = OldCategoryRankedEventFactory(date=datetime.date(2023, 4, 1))
+        for points, name in [
+            (9, "Jace Beleren"),
+            (6, "Liliana Vess"),
+            (3, "Gideon Jura"),
+        ]:
+            ResultFactory(event=event, points=points, player__name=name)
+
+        response = self.client.get(
+            reverse("ranking_by_season", kwargs={"slug": "2023"}), {"q": "vess"}
+        )
+
+        self.assertEqual(
+            ["Liliana Vess"], [p.name for p in response.context["players"]]
+        )
+        self.assertEqual(2, response.context["players"][0].score.rank)
+        self.assertEqual(1, response.context["page_obj"].paginator.num_pages)
+
+    @patch("championship.views.ranking.PLAYERS_PER_PAGE", 1)
+    def test_page_links_are_elided_and_keep_search(self):
+        event = OldCategoryRankedEventFactory(date=datetime.date(2023, 4, 1))
+        for i in range(20):
+            ResultFactory(event=event, points=20 - i, player__name=f"Player {i}")
+
+        response = self.client.get(
+            reverse("ranking_by_season", kwargs={"slug": "2023"}), {"q": "Player"}
+        )
+
+        self.assertContains(response, "?q=Player&amp;page=2")
+        self.assertContains(response, "?q=Player&amp;page=20")
+        self.assertNotContains(response, "?q=Player&amp;page=10")
+        self.assertContains(response, "…")
+
     @parameterized.expand(SCOREMETHOD_PER_SEASON.keys())
     def test_all_ranking(self, season):
         with with_site(domain=season.domain):
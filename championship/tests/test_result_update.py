@@ -24,7 +24,7 @@ from championship.factories import (
     PlayerFactory,
     ResultFactory,
 )
-from championship.models import Player, PlayerAlias, Result
+from championship.models import Player, PlayerAlias, Result, ResultScore
 from championship.views import update_ranking_order
 
 
@@ -157,6 +157,23 @@ class UpdateRankingTest(TestCase):
         results = Result.objects.filter(event=self.event).order_by("ranking")
         self.assertEqual(self.results[6].ranking, 7)
 
+    def test_update_ranking_invalidates_scores(self):
+        result = self.results[9]
+        ResultScore.objects.create(
+            result=result, season_slug="2025", category=self.event.category, qps=3
+        )
+        Result.objects.filter(pk=result.pk).update(win_count=5)
+
+        update_ranking_order(self.event)
+
+        result.refresh_from_db()
+        self.assertEqual(result.ranking, 1)
+        self.assertFalse(ResultScore.objects.filter(result__event=self.event).exists())
+
+    def test_unchanged_ranking_is_not_written(self):
+        with self.assertNumQueries(1):
+            update_ranking_order(self.event)
+
 
 class DeleteResultTest(TestCase):
     def setUp(self):
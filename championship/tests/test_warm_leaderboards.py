@@ -0,0 +1,60 @@
+# Copyright 2026 Leonin League
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from io import StringIO
+from unittest.mock import call, patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from championship.factories import PlayerFactory
+from championship.models import PlayerSeasonData
+from championship.seasons.definitions import EU_SEASON_2025, SEASON_2025
+from championship.seasons.helpers import get_seasons_with_scores
+from multisite.tests.utils import with_site
+
+
+@patch("championship.score.generic.compute_scores.refresh")
+class WarmLeaderboardsTest(TestCase):
+    def warm(self, *args):
+        call_command("warm_leaderboards", *args, stdout=StringIO())
+
+    def test_warms_all_seasons(self, refresh):
+        self.warm()
+        self.assertEqual(
+            [call(season, "CH") for season in get_seasons_with_scores()],
+            refresh.call_args_list,
+        )
+
+    def test_warms_selected_season(self, refresh):
+        self.warm("--season", SEASON_2025.slug)
+        refresh.assert_called_once_with(SEASON_2025, "CH")
+
+    @with_site(EU_SEASON_2025.domain)
+    def test_warms_all_countries(self, refresh):
+        for country in ["IT", "FR"]:
+            PlayerSeasonData.objects.create(
+                player=PlayerFactory(), season_slug=EU_SEASON_2025.slug, country=country
+            )
+
+        self.warm("--season", EU_SEASON_2025.slug)
+
+        self.assertEqual(
+            [
+                call(EU_SEASON_2025, "CH"),
+                call(EU_SEASON_2025, "FR"),
+                call(EU_SEASON_2025, "IT"),
+            ],
+            refresh.call_args_list,
+        )
@@ -22,7 +22,7 @@ from django.views.generic.base import TemplateView
 
 from articles.models import Article
 from championship.models import Event, EventOrganizer
-from championship.score import get_leaderboard
+from championship.score import get_top_n
 from championship.seasons.helpers import get_default_season
 from invoicing.models import Invoice
 
@@ -36,9 +36,9 @@ class IndexView(TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["players"] = get_leaderboard(
-            get_default_season(), settings.DEFAULT_COUNTRY
-        )[:PLAYERS_TOP]
+        context["players"] = get_top_n(
+            get_default_season(), settings.DEFAULT_COUNTRY, n=PLAYERS_TOP
+        )
         context["future_events"] = self._future_events()
         context["organizers"] = self._organizers_with_image()
         context["has_open_invoices"] = self._has_open_invoices()
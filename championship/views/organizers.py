@@ -63,10 +63,7 @@ class EventOrganizerDetailView(DetailView):
             Event.objects.future_events().filter(organizer=organizer).order_by("date")
         )
         past_events = (
-            Event.objects.past_events()
-            .filter(organizer=organizer)
-            .annotate(num_players=Count("result"))
-            .order_by("-date")
+            Event.objects.past_events().filter(organizer=organizer).order_by("-date")
         )
 
         all_events = []
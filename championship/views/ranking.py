@@ -18,13 +18,15 @@ from django.urls import reverse
 from django.views.generic.base import TemplateView
 
 from championship.models import NationalLeaderboard
-from championship.score import get_leaderboard
+from championship.score import compute_scores, paginate_leaderboard
 from championship.score.types import QualificationType
 from championship.seasons.definitions import Season
 from championship.seasons.helpers import get_seasons_with_scores
 from championship.views.base import PerSeasonMixin
 from multisite.constants import SWISS_DOMAIN
 
+PLAYERS_PER_PAGE = 100
+
 
 class CompleteRankingView(PerSeasonMixin, TemplateView):
     template_path = "championship/ranking/{slug}/ranking.html"
@@ -49,18 +51,22 @@ class CompleteRankingView(PerSeasonMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context["country_code"] = self.get_country_code()
-        context["players"] = get_leaderboard(
-            self.current_season, context["country_code"]
+        context["search"] = self.request.GET.get("q", "").strip()
+        leaderboard = compute_scores(self.current_season, context["country_code"])
+        page = paginate_leaderboard(
+            leaderboard,
+            number=self.request.GET.get("page"),
+            per_page=PLAYERS_PER_PAGE,
+            search=context["search"],
         )
+        context["page_obj"] = page
+        context["players"] = page.object_list
         if Site.objects.get_current().domain != SWISS_DOMAIN:
             context["national_leaderboard"] = NationalLeaderboard.objects.filter(
                 country=context["country_code"], season_slug=self.current_season.slug
             ).first()
-            context["has_direct_invites"] = any(
-                [
-                    p.score.qualification_type == QualificationType.DIRECT
-                    for p in context["players"]
-                ]
+            context["has_direct_invites"] = leaderboard.has_qualification_type(
+                QualificationType.DIRECT
             )
 
         return context
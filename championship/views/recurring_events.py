@@ -17,7 +17,6 @@ import datetime
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.db import transaction
-from django.db.models import Count
 from django.http import HttpResponseForbidden, HttpResponseRedirect
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
@@ -124,12 +123,10 @@ def reschedule(recurring_event: RecurringEvent):
     Events rescheduled in the same week keep their primary key (and thus also their URL).
     """
 
-    events: list[Event] = list(
-        recurring_event.event_set.annotate(result_cnt=Count("result")).all()
-    )
+    events: list[Event] = list(recurring_event.event_set.all())
 
-    events_to_reschedule = [event for event in events if event.result_cnt == 0]
-    dates_of_events_to_keep = [event.date for event in events if event.result_cnt > 0]
+    events_to_reschedule = [event for event in events if event.size == 0]
+    dates_of_events_to_keep = [event.date for event in events if event.size > 0]
 
     if events_to_reschedule:
         default_event = events_to_reschedule[-1]
@@ -320,9 +317,7 @@ class RecurringEventDeleteView(CustomDeleteView):
 
     def form_valid(self, form):
         # Delete all events linked to the recurring event without results
-        self.object.event_set.annotate(result_cnt=Count("result")).filter(
-            result_cnt=0
-        ).delete()
+        self.object.event_set.filter(size=0).delete()
         return super().form_valid(form)
 
 
@@ -347,9 +342,7 @@ class RecurringEventUpdateAllEventView(LoginRequiredMixin, UpdateView):
     @transaction.atomic
     def form_valid(self, form):
         update = form.save(commit=False)
-        events = update.recurring_event.event_set.annotate(
-            result_cnt=Count("result")
-        ).filter(result_cnt=0)
+        events = update.recurring_event.event_set.filter(size=0)
         for event in events:
             event.copy_values_from(update, excluded_fields=["date", "category"]).save()
         messages.success(self.request, "Successfully updated all events")
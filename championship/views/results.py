@@ -55,6 +55,7 @@ from championship.parsers import (
 )
 from championship.parsers.general_parser_functions import parse_record, record_to_points
 from championship.parsers.parse_result import ParseResult
+from championship.score.generic import invalidate_event_scores
 from championship.tournament_valid import (
     TooManyPointsForPlayerError,
     TooManyPointsForTop8Error,
@@ -154,10 +155,13 @@ class CreateResultsView(FormView):
         ):
             return self.form_invalid(form)
 
+        players = Player.objects.get_or_create_by_names(
+            [parse_result.name for parse_result in standings]
+        )
+
         results_to_create = []
-        for i, parse_result in enumerate(standings):
+        for i, (parse_result, player) in enumerate(zip(standings, players)):
             (w, l, d) = parse_result.record
-            player, created = Player.objects.get_or_create_by_name(parse_result.name)
 
             results_to_create.append(
                 Result(
@@ -174,6 +178,7 @@ class CreateResultsView(FormView):
             )
 
         Result.objects.bulk_create(results_to_create)
+        invalidate_event_scores(self.event)
 
         return super().form_valid(form)
 
@@ -545,7 +550,10 @@ class AddTop8ResultsView(LoginRequiredMixin, FormView):
         self.event.result_set.update(playoff_result=None)
         for event_player_result, single_elim_result in playoff_results_filled:
             event_player_result.playoff_result = single_elim_result
-            event_player_result.save()
+        Result.objects.bulk_update(
+            [epr for epr, _ in playoff_results_filled], ["playoff_result"]
+        )
+        invalidate_event_scores(self.event)
 
         return super().form_valid(form)
 
@@ -584,13 +592,26 @@ class ClearEventResultsView(LoginRequiredMixin, FormView):
 
 def update_ranking_order(event):
     """Updates the order of the ranking after a result has been updated."""
-    results = Result.objects.filter(event=event)
+    results = Result.objects.filter(event=event).only(
+        "id", "ranking", "win_count", "draw_count"
+    )
     results = sorted(
         results, key=lambda r: (r.win_count, r.draw_count, -r.ranking), reverse=True
     )
+    changed_results = []
     for i, result in enumerate(results):
-        result.ranking = i + 1
-        result.save()
+        if result.ranking != i + 1:
+            result.ranking = i + 1
+            changed_results.append(result)
+
+    if not changed_results:
+        return
+
+    # bulk_update does not send signals, so scores are invalidated once for
+    # the whole event instead of for every result.
+    with transaction.atomic():
+        Result.objects.bulk_update(changed_results, ["ranking"])
+        invalidate_event_scores(event)
 
 
 class ResultUpdatePermissionMixin:
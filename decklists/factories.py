@@ -13,7 +13,6 @@
 # limitations under the License.
 
 import datetime
-import random
 
 from django.utils import timezone
 
@@ -26,28 +25,28 @@ import decklists.models
 
 
 class MagicProvider(BaseProvider):
+    ARCHETYPES = [
+        "Cascade Crash",
+        "4/5c Aggro",
+        "UR Aggro",
+        "Rakdos Aggro",
+        "Hardened Scales",
+        "Merfolk",
+        "The Underworld Cookbook",
+        "Red Deck Wins",
+        "Jund",
+        "Mono Black Aggro",
+        "Martyr Life",
+        "Temur Aggro",
+        "Elementals",
+        "The Rock",
+        "Boros Aggro",
+        "Gruul Aggro",
+        "Orzhov Midrange",
+    ]
+
     def deck_archetype(self):
-        return random.choice(
-            [
-                "Cascade Crash",
-                "4/5c Aggro",
-                "UR Aggro",
-                "Rakdos Aggro",
-                "Hardened Scales",
-                "Merfolk",
-                "The Underworld Cookbook",
-                "Red Deck Wins",
-                "Jund",
-                "Mono Black Aggro",
-                "Martyr Life",
-                "Temur Aggro",
-                "Elementals",
-                "The Rock",
-                "Boros Aggro",
-                "Gruul Aggro",
-                "Orzhov Midrange",
-            ]
-        )
+        return self.random_element(self.ARCHETYPES)
 
 
 factory.Faker.add_provider(MagicProvider)
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import dataclasses
+import functools
 import secrets
 from collections import defaultdict
 from collections.abc import Iterable
@@ -31,7 +32,7 @@ from championship.views.base import CustomDeleteView
 from decklists.forms import CollectionForm, DecklistForm
 from decklists.models import Collection, Decklist
 from decklists.parser import DecklistParser
-from oracle.models import Card, get_card_by_name
+from oracle.models import Card, get_cards_by_names
 
 ORDERED_CARD_TYPES = [
     "Creature",
@@ -71,20 +72,31 @@ def normalize_decklist(entries: Iterable[DecklistEntry]) -> FilterOutput:
     return [DecklistEntry(v, k) for k, v in qty_by_cards.items()], []
 
 
-def annotate_card_attributes(entries: Iterable[DecklistEntry]) -> FilterOutput:
+def annotate_card_attributes(
+    entries: Iterable[DecklistEntry], cards_by_name: dict[str, Card] | None = None
+) -> FilterOutput:
+    """Fills in the attributes of the cards of the entries.
+
+    Cards are looked up in cards_by_name (see get_cards_by_names), or all at
+    once in the oracle database if it is not given.
+    """
+    entries = list(entries)
+    if cards_by_name is None:
+        cards_by_name = get_cards_by_names(e.name for e in entries)
+
     result = []
     errors = []
     for e in entries:
-        try:
-            card = get_card_by_name(e.name)
+        card = cards_by_name.get(e.name)
+        if card is None:
+            errors.append(f"Unknown card '{e.name}'")
+        else:
             e.name = card.name
             e.mana_cost = card.mana_cost
             e.mana_value = card.mana_value
             e.type_line = card.type_line
             e.scryfall_uri = card.scryfall_uri
             e.image_uri = card.image_uri
-        except Card.DoesNotExist:
-            errors.append(f"Unknown card '{e.name}'")
 
         result.append(e)
     return result, errors
@@ -111,21 +123,41 @@ def pipe_filters(filters, entries) -> FilterOutput:
     return result, errors
 
 
-def parse_section(section_text) -> FilterOutput:
+def parse_section(
+    section_text, cards_by_name: dict[str, Card] | None = None
+) -> FilterOutput:
 
     all_filters = [
         parse_decklist,
         normalize_decklist,
-        annotate_card_attributes,
+        functools.partial(annotate_card_attributes, cards_by_name=cards_by_name),
         sort_decklist_by_mana_value,
     ]
 
     return pipe_filters(all_filters, section_text)
 
 
-def get_decklist_table_context(decklist: Decklist, split_decklist_by_type: bool = True):
+def get_cards_for_decklists(decklists: Iterable[Decklist]) -> dict[str, Card]:
+    """Returns the cards of all the given decklists, resolved at once.
+
+    The result can be passed to get_decklist_table_context, to render many
+    decklists without querying the oracle database for each of them.
     """
-    Returns a context object used to render a decklist table. It containts:
+    names = set()
+    for decklist in decklists:
+        parsed = DecklistParser.deck.parse(decklist.content).unwrap()
+        names.update(e.name for e in parsed.mainboard + parsed.sideboard)
+    return get_cards_by_names(names)
+
+
+def get_decklist_table_context(
+    decklist: Decklist,
+    split_decklist_by_type: bool = True,
+    cards_by_name: dict[str, Card] | None = None,
+):
+    """
+    Returns a context object used to render a decklist table. Cards are looked
+    up in cards_by_name if given (see get_cards_for_decklists). It containts:
 
     - decklist: The decklist object
 
@@ -138,8 +170,12 @@ def get_decklist_table_context(decklist: Decklist, split_decklist_by_type: bool
     """
     context = {"decklist": decklist}
     parsed = DecklistParser.deck.parse(decklist.content).unwrap()
-    mainboard, errors_main = parse_section(parsed.mainboard)
-    sideboard, errors_side = parse_section(parsed.sideboard)
+    if cards_by_name is None:
+        cards_by_name = get_cards_by_names(
+            e.name for e in parsed.mainboard + parsed.sideboard
+        )
+    mainboard, errors_main = parse_section(parsed.mainboard, cards_by_name)
+    sideboard, errors_side = parse_section(parsed.sideboard, cards_by_name)
 
     cards_by_section = {}
     if split_decklist_by_type:
@@ -58,6 +58,9 @@ def _make_geocoder() -> Geocoder:
     # Geocoding results are expensive and unlikely to change, keep them for
     # long.
     cache_ttl=timedelta(days=31).total_seconds(),
+    # Addresses are often geocoded several times in a row, and concurrent
+    # requests should not hit the geocoding service for the same address.
+    single_flight=True,
 )
 @geocode_duration.time()  # measure geocoding latency, including retries
 @retry(
@@ -62,20 +62,9 @@ def fee_for_event(event: Event) -> int:
     if season is None:
         raise ValueError(f"Unknown season for date {event.date}")
 
-    results = event.result_set
+    fee = event.size * FEE_PER_PLAYER[season][event.category]
 
-    # This could be done in the DB but results in one query per event. Doing
-    # this like this with a prefetch_related in the parent is faster.
-    for r in results.all():
-        if r.playoff_result:
-            has_top8 = True
-            break
-    else:
-        has_top8 = False
-
-    fee = results.count() * FEE_PER_PLAYER[season][event.category]
-
-    if has_top8:
+    if event.has_top8:
         fee += TOP8_FEE[season][event.category]
 
     return fee
@@ -176,10 +165,7 @@ class Invoice(models.Model):
     @property
     def total_amount(self) -> int:
         """Returns total amount of the invoice, in Swiss francs."""
-        return (
-            sum(fee_for_event(e) for e in self.events.prefetch_related("result_set"))
-            - self.discount
-        )
+        return sum(fee_for_event(e) for e in self.events.all()) - self.discount
 
     @property
     def is_paid(self) -> bool:
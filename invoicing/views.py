@@ -19,7 +19,6 @@ from collections.abc import Iterator
 
 from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
-from django.db.models import Count, Q
 from django.http import Http404
 from django.shortcuts import redirect
 from django.template.defaultfilters import date
@@ -46,13 +45,7 @@ INVOICE_TEMPLATE = "invoicing/invoice.tex"
 def get_invoice_pdf_context(invoice: Invoice):
     """Returns the context dict needed for rendering the invoice."""
     context = {}
-    events = invoice.events.annotate(
-        top8_cnt=Count(
-            "result",
-            filter=Q(result__playoff_result__gt=0),
-        ),
-        event_size=Count("result"),
-    ).order_by("date")[:]
+    events = invoice.events.order_by("date")[:]
 
     for e in events:
         e.fees = fee_for_event(e)
@@ -113,10 +106,8 @@ class Report(PermissionRequiredMixin, TemplateView):
                 date__gte=season.start_date,
                 date__lte=season.end_date,
             )
-            .annotate(result_cnt=Count("result"))
-            .exclude(result_cnt=0)
+            .exclude(size=0)
             .order_by("date")
-            .prefetch_related("result_set")
         )
 
         discounts = dict(self.map_discounts_to_event(season))
@@ -0,0 +1,113 @@
+# Copyright 2026 Leonin League
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""In-memory index of the oracle cards.
+
+The oracle database is read-only and ships with the Docker image, so all the
+cards can be loaded once and looked up in dicts rather than queried. The index
+is built on first use, or before gunicorn forks its workers (see wsgi.py) so
+that they all start with it.
+
+If scryfall_import wrote a snapshot of the cards (see snapshot.py), it is
+memory-mapped instead, which avoids loading all the cards in every worker.
+"""
+
+import dataclasses
+import logging
+import os
+import threading
+import time
+from types import MappingProxyType
+from typing import Mapping
+
+from django.conf import settings
+from django.db import DatabaseError, connections
+
+from oracle.models import AlternateName, Card, index_card_names
+from oracle.snapshot import CardSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True)
+class CardIndex:
+    by_name: Mapping[str, Card]
+    by_folded_name: Mapping[str, Card]
+
+    @classmethod
+    def build(cls) -> "CardIndex":
+        by_name, by_folded_name = index_card_names(
+            Card.objects.all(), AlternateName.objects.values_list("name", "card_id")
+        )
+        return cls(
+            by_name=MappingProxyType(by_name),
+            by_folded_name=MappingProxyType(by_folded_name),
+        )
+
+    def get(self, name: str, exact_match=False) -> Card | None:
+        if exact_match:
+            return self.by_name.get(name)
+        return self.by_name.get(name) or self.by_folded_name.get(name.casefold())
+
+
+_index: CardIndex | CardSnapshot | None = None
+_lock = threading.Lock()
+
+
+def _load_card_index() -> CardIndex | CardSnapshot:
+    path = settings.ORACLE_CARD_SNAPSHOT
+    if path and os.path.exists(path):
+        snapshot = CardSnapshot.open(path)
+        logger.info("Opened the oracle card snapshot with %d cards", len(snapshot))
+        return snapshot
+
+    start = time.perf_counter()
+    index = CardIndex.build()
+    logger.info(
+        "Built the oracle card index with %d names in %.3fs",
+        len(index.by_folded_name),
+        time.perf_counter() - start,
+    )
+    return index
+
+
+def get_card_index() -> CardIndex | CardSnapshot:
+    """Returns the card index, loading it on first use."""
+    global _index
+    if _index is None:
+        with _lock:
+            if _index is None:
+                _index = _load_card_index()
+    return _index
+
+
+def reset_card_index():
+    """Drops the card index, it is rebuilt on next use."""
+    global _index
+    with _lock:
+        _index = None
+
+
+def preload_card_index():
+    """Builds the card index before the workers are forked.
+
+    The connection used to build it is closed, as it must not be shared with
+    the workers.
+    """
+    try:
+        get_card_index()
+    except DatabaseError:
+        # e.g. in development, before the cards were imported
+        logger.warning("Could not build the oracle card index", exc_info=True)
+    connections[Card.objects.db].close()
@@ -13,15 +13,93 @@
 # limitations under the License.
 
 import argparse
+import contextlib
+import dataclasses
+import io
+import itertools
 import json
 import logging
+import re
+import time
+import uuid
+from typing import Any, Iterator, TextIO
 
+from django.conf import settings
 from django.core.management.base import BaseCommand
+from django.db import transaction
 
 import requests
 
 from decklists.parser import parse_mana
+from oracle.index import reset_card_index
 from oracle.models import AlternateName, Card
+from oracle.snapshot import write_card_snapshot
+
+# Number of cards inserted at once
+BATCH_SIZE = 1000
+
+_WHITESPACE_RE = re.compile(r"\s*")
+
+
+def iter_json_array(stream: TextIO, chunk_size=1 << 20) -> Iterator[Any]:
+    """Yields the elements of the JSON array read from stream, one at a time.
+
+    The array is parsed incrementally, so that only the chunk being read and
+    the element being parsed are held in memory, whatever the size of the
+    array.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def read_more():
+        nonlocal buffer, pos, eof
+        chunk = stream.read(chunk_size)
+        eof = not chunk
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+    def peek() -> str:
+        """Skips whitespace and returns the next character, or "" at the end."""
+        nonlocal pos
+        while True:
+            pos = _WHITESPACE_RE.match(buffer, pos).end()
+            if pos < len(buffer) or eof:
+                return buffer[pos : pos + 1]
+            read_more()
+
+    if peek() != "[":
+        raise ValueError("Expected a JSON array")
+    pos += 1
+    if peek() == "]":
+        return
+
+    while True:
+        peek()
+        while True:
+            try:
+                element, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                read_more()
+                continue
+            # Unless the element is followed by a separator, it could continue
+            # in the next chunk (e.g. a number).
+            next_pos = _WHITESPACE_RE.match(buffer, end).end()
+            if eof or buffer[next_pos : next_pos + 1] in (",", "]"):
+                break
+            read_more()
+        pos = end
+        yield element
+
+        separator = peek()
+        pos += 1
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError(f"Expected ',' or ']' in JSON array, got {separator!r}")
 
 
 def is_valid(entry):
@@ -35,6 +113,12 @@ def is_valid(entry):
     return True
 
 
+@dataclasses.dataclass
+class Phase:
+    name: str
+    rows: int = 0
+
+
 class Command(BaseCommand):
     help = "Import all cards from a Scryfall bulk data dump."
 
@@ -51,13 +135,22 @@ class Command(BaseCommand):
             choices=["small", "normal", "large", "png", "art_crop", "border_crop"],
             default="png",
         )
+        parser.add_argument(
+            "--snapshot",
+            help="Where to write the compact snapshot of the cards (see oracle/snapshot.py).",
+            default=settings.ORACLE_CARD_SNAPSHOT,
+        )
 
-    def load_data(self, path):
+    @contextlib.contextmanager
+    def open_data(self, path) -> Iterator[TextIO]:
         if path:
             # Unit tests require this to be a string
             if isinstance(path, str):
-                path = open(path)
-            return json.load(path)
+                with open(path) as f:
+                    yield f
+            else:
+                yield path
+            return
 
         # if no path was provided, instead fetch it from Scryfall directly
         logging.info("No local path provided, querying Scryfall")
@@ -67,10 +160,11 @@ class Command(BaseCommand):
         data = resp.json()["data"]
 
         url = [s["download_uri"] for s in data if s["type"] == "oracle_cards"][0]
-        data = requests.get(url)
-        data.raise_for_status()
-
-        return data.json()
+        with requests.get(url, stream=True) as resp:
+            resp.raise_for_status()
+            # Lets urllib3 decompress the dump if it is sent gzipped
+            resp.raw.decode_content = True
+            yield io.TextIOWrapper(resp.raw, encoding="utf-8")
 
     def _image_uri(self, entry, image_quality: str):
         try:
@@ -80,50 +174,97 @@ class Command(BaseCommand):
             # cards themselves.
             return entry["card_faces"][0]["image_uris"][image_quality]
 
-    def handle(self, scryfall_dump, image_quality, *args, **kwargs):
-        data = self.load_data(scryfall_dump)
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[Phase]:
+        """Times the phase of the import, and reports it with its row count."""
+        phase = Phase(name)
+        start = time.perf_counter()
+        yield phase
+        self.stdout.write(
+            f"{phase.name}: {phase.rows} rows in {time.perf_counter() - start:.2f}s"
+        )
+
+    def handle(self, scryfall_dump, image_quality, snapshot, *args, **kwargs):
+        start = time.perf_counter()
+        with self.open_data(scryfall_dump) as f, transaction.atomic(
+            using=Card.objects.db
+        ):
+            with self.phase("Delete cards") as phase:
+                phase.rows, _ = Card.objects.all().delete()
+            # Includes downloading and parsing the dump, which are streamed
+            with self.phase("Import cards") as phase:
+                phase.rows, faces = self.import_cards(iter_json_array(f), image_quality)
+            with self.phase("Create alternate names") as phase:
+                phase.rows = self.register_alternate_names(faces)
+
+        with self.phase("Validate mana costs") as phase:
+            phase.rows = self.validate_mana_parsing()
+        if snapshot:
+            with self.phase("Write snapshot") as phase:
+                phase.rows = self.write_snapshot(snapshot)
+        reset_card_index()
+        self.stdout.write(f"Import done in {time.perf_counter() - start:.2f}s")
 
-        Card.objects.all().delete()
+    def import_cards(
+        self, entries, image_quality
+    ) -> tuple[int, list[tuple[uuid.UUID, str]]]:
+        """Inserts the valid cards in batches, as they are read.
 
-        cards = [
-            Card(
-                oracle_id=entry["oracle_id"],
-                name=entry["name"],
-                mana_cost=entry.get("mana_cost", ""),
-                scryfall_uri=entry["scryfall_uri"],
-                image_uri=self._image_uri(entry, image_quality),
-                mana_value=int(entry.get("cmc", 0)),
-                type_line=entry["type_line"],
+        Returns the number of cards, and the (oracle id, face name) pairs of the
+        cards having multiple faces, which are much fewer than the cards.
+        """
+        faces = []
+        count = 0
+        valid_entries = (entry for entry in entries if is_valid(entry))
+        while batch := list(itertools.islice(valid_entries, BATCH_SIZE)):
+            cards = Card.objects.bulk_create(
+                [
+                    Card(
+                        oracle_id=entry["oracle_id"],
+                        name=entry["name"],
+                        mana_cost=entry.get("mana_cost", ""),
+                        scryfall_uri=entry["scryfall_uri"],
+                        image_uri=self._image_uri(entry, image_quality),
+                        mana_value=int(entry.get("cmc", 0)),
+                        type_line=entry["type_line"],
+                    )
+                    for entry in batch
+                ]
             )
-            for entry in data
-            if is_valid(entry)
-        ]
-        Card.objects.bulk_create(cards)
-        logging.info("Imported %d cards", len(cards))
-        self.register_alternate_names(data)
-        self.validate_mana_parsing()
-
-    def register_alternate_names(self, data):
-        to_create = []
-        logging.info("Creating alternate names")
-        for entry in data:
-            if not is_valid(entry):
-                continue
+            count += len(cards)
+            for card, entry in zip(cards, batch):
+                for face in entry.get("card_faces", []):
+                    faces.append((card.oracle_id, face["name"]))
 
-            if "card_faces" not in entry:
-                continue
+        return count, faces
 
-            card = Card.objects.get(name=entry["name"])
+    def write_snapshot(self, path) -> int:
+        cards = list(Card.objects.all())
+        write_card_snapshot(
+            path, cards, AlternateName.objects.values_list("name", "card_id")
+        )
+        logging.info("Wrote the card snapshot to %s", path)
+        return len(cards)
 
-            for face in entry["card_faces"]:
-                to_create.append(AlternateName(name=face["name"], card=card))
+    def register_alternate_names(self, faces: list[tuple[uuid.UUID, str]]) -> int:
+        """Creates the alternate names of the cards just imported.
 
-        AlternateName.objects.bulk_create(to_create)
-        logging.info("Created %d alternate names", len(to_create))
+        The cards are referenced by their oracle id, so that no card needs to be
+        queried.
+        """
+        alternate_names = AlternateName.objects.bulk_create(
+            [
+                AlternateName(name=face_name, card_id=card_id)
+                for card_id, face_name in faces
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        return len(alternate_names)
 
-    def validate_mana_parsing(self):
+    def validate_mana_parsing(self) -> int:
         invalid_mana_costs = set()
-        for (mana_cost,) in Card.objects.all().values_list("mana_cost"):
+        mana_costs = Card.objects.all().values_list("mana_cost")
+        for (mana_cost,) in mana_costs:
             if not mana_cost:
                 continue
             try:
@@ -135,3 +276,4 @@ class Command(BaseCommand):
             logging.warning("The following mana cost did not parse succesfully:")
             for c in sorted(invalid_mana_costs):
                 logging.warning(c)
+        return len(mana_costs)
@@ -12,9 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import string
 import uuid
+from collections.abc import Iterable
 
+from django.conf import settings
 from django.db import models
+from django.db.models.functions import Lower
 
 
 class Card(models.Model):
@@ -41,7 +45,36 @@ class AlternateName(models.Model):
     card = models.ForeignKey(Card, on_delete=models.CASCADE)
 
 
+def index_card_names(
+    cards: Iterable[Card], alternate_names: Iterable[tuple[str, uuid.UUID]]
+) -> tuple[dict[str, Card], dict[str, Card]]:
+    """Returns the cards by exact and by casefolded name, for the card indexes.
+
+    alternate_names are (name, oracle_id) pairs. Card names take precedence
+    over alternate names, as in get_card_by_name.
+    """
+    by_name = {}
+    by_folded_name = {}
+    cards = {card.oracle_id: card for card in cards}
+    for name, card_id in alternate_names:
+        by_name.setdefault(name, cards[card_id])
+        by_folded_name.setdefault(name.casefold(), cards[card_id])
+    for card in cards.values():
+        by_name[card.name] = card
+        by_folded_name[card.name.casefold()] = card
+    return by_name, by_folded_name
+
+
 def get_card_by_name(name: str, exact_match=False) -> Card:
+    if settings.ORACLE_CARD_INDEX:
+        # Avoids a circular import, as the index is built from these models.
+        from oracle.index import get_card_index
+
+        card = get_card_index().get(name, exact_match=exact_match)
+        if card is None:
+            raise Card.DoesNotExist(f"No card named {name!r}")
+        return card
+
     if exact_match:
         filter = {"name": name}
     else:
@@ -53,3 +86,61 @@ def get_card_by_name(name: str, exact_match=False) -> Card:
             return AlternateName.objects.get(**filter).card
         except AlternateName.DoesNotExist:
             raise e
+
+
+# The oracle database is SQLite, whose LOWER() and LIKE only fold the case of
+# ASCII letters.
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def _lower(name: str) -> str:
+    return name.translate(_ASCII_LOWER)
+
+
+def _resolve_names(queryset, names: set[str], card_of) -> dict[str, Card]:
+    """Resolves the given names with at most two queries on the queryset.
+
+    Names are first looked up as they are, which can use the index on name,
+    then the remaining ones case-insensitively.
+    """
+    found = {}
+    for entry in queryset.filter(name__in=names):
+        found[entry.name] = card_of(entry)
+
+    by_lower_name = {}
+    for name in names - found.keys():
+        by_lower_name.setdefault(_lower(name), []).append(name)
+    if by_lower_name:
+        for entry in queryset.annotate(lower_name=Lower("name")).filter(
+            lower_name__in=by_lower_name
+        ):
+            for name in by_lower_name.get(entry.lower_name, []):
+                found.setdefault(name, card_of(entry))
+    return found
+
+
+def get_cards_by_names(names: Iterable[str]) -> dict[str, Card]:
+    """Returns the cards with the given names, case-insensitively.
+
+    This is the bulk version of get_card_by_name: all the names are resolved
+    with a handful of queries, falling back to the alternate names (e.g. the
+    faces of double-faced cards). The returned dict is keyed by the names as
+    given, and names that are not found are left out.
+    """
+    if settings.ORACLE_CARD_INDEX:
+        from oracle.index import get_card_index
+
+        index = get_card_index()
+        return {name: card for name in names if (card := index.get(name))}
+
+    names = set(names)
+    cards = _resolve_names(Card.objects.all(), names, lambda card: card)
+    if remaining := names - cards.keys():
+        cards.update(
+            _resolve_names(
+                AlternateName.objects.select_related("card"),
+                remaining,
+                lambda alternate_name: alternate_name.card,
+            )
+        )
+    return cards
@@ -0,0 +1,172 @@
+# Copyright 2026 Leonin League
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compact binary snapshot of the oracle cards, read through mmap.
+
+The snapshot is written by scryfall_import next to the oracle database. As it
+is memory-mapped read-only, all the gunicorn workers share the same physical
+pages, and only the cards that are looked up become Python objects.
+
+All integers are little-endian. The file is made of, in order:
+
+- a header: magic, format version, number of cards, of exact names and of
+  casefolded names;
+- the card records, fixed-width: oracle id, mana value, and an (offset,
+  length) reference in the string pool for each string field;
+- the exact names table, then the casefolded names table: (offset, length)
+  of the name in the string pool and index of the card record, sorted by the
+  UTF-8 encoding of the name so that names can be binary searched;
+- the string pool, UTF-8 encoded.
+"""
+
+import io
+import mmap
+import os
+import struct
+import uuid
+from typing import Iterable
+
+from oracle.models import Card, index_card_names
+
+MAGIC = b"ORCS"
+VERSION = 1
+
+STRING_FIELDS = ["name", "mana_cost", "scryfall_uri", "type_line", "image_uri"]
+
+_HEADER = struct.Struct("<4s4I")
+_CARD = struct.Struct(f"<16si{2 * len(STRING_FIELDS)}I")
+_NAME = struct.Struct("<3I")
+
+
+class _StringPool:
+    def __init__(self):
+        self.data = bytearray()
+        self.refs: dict[str, tuple[int, int]] = {}
+
+    def add(self, value: str) -> tuple[int, int]:
+        if value not in self.refs:
+            encoded = value.encode()
+            self.refs[value] = (len(self.data), len(encoded))
+            self.data += encoded
+        return self.refs[value]
+
+
+def write_card_snapshot(
+    path: str,
+    cards: Iterable[Card],
+    alternate_names: Iterable[tuple[str, uuid.UUID]],
+):
+    """Writes the snapshot of the cards to path, replacing it atomically.
+
+    alternate_names are (name, oracle_id) pairs.
+    """
+    cards = list(cards)
+    by_name, by_folded_name = index_card_names(cards, alternate_names)
+    position = {card.oracle_id: i for i, card in enumerate(cards)}
+    pool = _StringPool()
+
+    out = io.BytesIO()
+    out.write(
+        _HEADER.pack(MAGIC, VERSION, len(cards), len(by_name), len(by_folded_name))
+    )
+    for card in cards:
+        refs = [x for field in STRING_FIELDS for x in pool.add(getattr(card, field))]
+        out.write(_CARD.pack(card.oracle_id.bytes, card.mana_value, *refs))
+    for names in [by_name, by_folded_name]:
+        for name, card in sorted(names.items(), key=lambda item: item[0].encode()):
+            offset, length = pool.add(name)
+            out.write(_NAME.pack(offset, length, position[card.oracle_id]))
+    out.write(pool.data)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(out.getbuffer())
+    # Workers that already mapped the previous snapshot keep reading it
+    os.replace(tmp_path, path)
+
+
+class CardSnapshot:
+    """Looks cards up by name in a snapshot written by write_card_snapshot."""
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        if buffer[: len(MAGIC)] != MAGIC or len(buffer) < _HEADER.size:
+            raise ValueError("Not a card snapshot")
+        _, version, self._card_count, exact_count, folded_count = _HEADER.unpack_from(
+            buffer
+        )
+        if version != VERSION:
+            raise ValueError(f"Unsupported card snapshot version {version}")
+        self._cards = _HEADER.size
+        self._exact_names = (
+            self._cards + self._card_count * _CARD.size,
+            exact_count,
+        )
+        self._folded_names = (
+            self._exact_names[0] + exact_count * _NAME.size,
+            folded_count,
+        )
+        self._pool = self._folded_names[0] + folded_count * _NAME.size
+
+    @classmethod
+    def open(cls, path: str) -> "CardSnapshot":
+        with open(path, "rb") as f:
+            # The mapping stays valid once the file is closed
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __len__(self):
+        return self._card_count
+
+    def _bytes(self, offset: int, length: int) -> bytes:
+        start = self._pool + offset
+        return self._buffer[start : start + length]
+
+    def _find(self, table: tuple[int, int], key: bytes) -> int | None:
+        start, count = table
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset, length, card = _NAME.unpack_from(
+                self._buffer, start + mid * _NAME.size
+            )
+            name = self._bytes(offset, length)
+            if name == key:
+                return card
+            if name < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def _card(self, i: int) -> Card:
+        oracle_id, mana_value, *refs = _CARD.unpack_from(
+            self._buffer, self._cards + i * _CARD.size
+        )
+        values = {
+            field: self._bytes(offset, length).decode()
+            for field, offset, length in zip(STRING_FIELDS, refs[::2], refs[1::2])
+        }
+        values["oracle_id"] = uuid.UUID(bytes=oracle_id)
+        values["mana_value"] = mana_value
+        return Card.from_db(
+            Card.objects.db,
+            None,
+            [values[field.attname] for field in Card._meta.concrete_fields],
+        )
+
+    def get(self, name: str, exact_match=False) -> Card | None:
+        i = self._find(self._exact_names, name.encode())
+        if i is None and not exact_match:
+            i = self._find(self._folded_names, name.casefold().encode())
+        return None if i is None else self._card(i)
@@ -12,12 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
+import json
 import os.path
+import tempfile
+from unittest import mock
 
 from django.core.management import call_command
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
-from oracle.models import AlternateName, Card, get_card_by_name
+from oracle.factories import CardFactory
+from oracle.index import get_card_index, reset_card_index
+from oracle.management.commands import scryfall_import
+from oracle.management.commands.scryfall_import import iter_json_array
+from oracle.models import AlternateName, Card, get_card_by_name, get_cards_by_names
+from oracle.snapshot import CardSnapshot, write_card_snapshot
 
 
 class CardTestCase(TestCase):
@@ -31,7 +40,12 @@ class LoadTestCase(TestCase):
 
     def test_load_data(self):
         f = os.path.join(os.path.dirname(__file__), "testdata.json")
-        call_command("scryfall_import", scryfall_dump=f, image_quality="normal")
+        call_command(
+            "scryfall_import",
+            stdout=io.StringIO(),
+            scryfall_dump=f,
+            image_quality="normal",
+        )
         card = Card.objects.get(oracle_id="0004ebd0-dfd6-4276-b4a6-de0003e94237")
         self.assertEqual(card.name, "Static Orb")
         self.assertEqual(card.mana_cost, "{3}")
@@ -48,7 +62,7 @@ class LoadTestCase(TestCase):
         name for each face.
         """
         f = os.path.join(os.path.dirname(__file__), "testdata.json")
-        call_command("scryfall_import", scryfall_dump=f)
+        call_command("scryfall_import", stdout=io.StringIO(), scryfall_dump=f)
         card = Card.objects.get(oracle_id="c0957e5e-c71b-439c-931c-9f55d2f76ace")
         face = AlternateName.objects.get(name="Fable of the Mirror-Breaker")
 
@@ -56,7 +70,7 @@ class LoadTestCase(TestCase):
 
     def test_load_data_case_insensitive(self):
         f = os.path.join(os.path.dirname(__file__), "testdata.json")
-        call_command("scryfall_import", scryfall_dump=f)
+        call_command("scryfall_import", stdout=io.StringIO(), scryfall_dump=f)
         # All lower case, will not raise any errors
         get_card_by_name("fable of the mirror-breaker")
         get_card_by_name("static orb")
@@ -64,3 +78,250 @@ class LoadTestCase(TestCase):
     def test_get_card(self):
         with self.assertRaises(Card.DoesNotExist):
             get_card_by_name("Foobar")
+
+    @mock.patch.object(scryfall_import, "BATCH_SIZE", 1)
+    def test_load_data_in_batches(self):
+        f = os.path.join(os.path.dirname(__file__), "testdata.json")
+        call_command("scryfall_import", stdout=io.StringIO(), scryfall_dump=f)
+
+        self.assertEqual(2, Card.objects.count())
+        self.assertEqual(2, AlternateName.objects.count())
+
+    def test_alternate_names_do_not_query_cards(self):
+        card = CardFactory()
+        faces = [(card.oracle_id, "Front"), (card.oracle_id, "Back")]
+
+        with self.assertNumQueries(1, using="oracle"):
+            count = scryfall_import.Command().register_alternate_names(faces)
+
+        self.assertEqual(2, count)
+        self.assertEqual(card, AlternateName.objects.get(name="Back").card)
+
+    def test_phases_are_reported(self):
+        f = os.path.join(os.path.dirname(__file__), "testdata.json")
+        out = io.StringIO()
+        call_command("scryfall_import", stdout=out, scryfall_dump=f)
+
+        output = out.getvalue()
+        self.assertRegex(output, r"Import cards: 2 rows in \d+\.\d\ds")
+        self.assertRegex(output, r"Create alternate names: 2 rows in")
+        self.assertRegex(output, r"Validate mana costs: 2 rows in")
+        self.assertRegex(output, r"Import done in")
+
+    def test_failed_import_keeps_cards(self):
+        card = CardFactory()
+        dump = io.StringIO('[{"name": "Incomplete"')
+
+        with self.assertRaises(ValueError):
+            call_command("scryfall_import", stdout=io.StringIO(), scryfall_dump=dump)
+
+        self.assertQuerySetEqual(Card.objects.all(), [card])
+
+
+class IterJsonArrayTestCase(TestCase):
+    def test_chunk_sizes(self):
+        text = ' [ 1, {"a": [2, "x]"]} ,\n3.25 , "" ] '
+        for chunk_size in [1, 2, 3, 7, 1024]:
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(
+                    json.loads(text),
+                    list(iter_json_array(io.StringIO(text), chunk_size)),
+                )
+
+    def test_dump(self):
+        with open(os.path.join(os.path.dirname(__file__), "testdata.json")) as f:
+            want = json.load(f)
+            f.seek(0)
+            self.assertEqual(want, list(iter_json_array(f, chunk_size=100)))
+
+    def test_empty_array(self):
+        self.assertEqual([], list(iter_json_array(io.StringIO(" [ ] "))))
+
+    def test_invalid(self):
+        for text in ["", "{}", "[1 2]", "[1,", "[1,]", "[1"]:
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                list(iter_json_array(io.StringIO(text), chunk_size=1))
+
+
+class GetCardsByNamesTestCase(TestCase):
+    databases = ["oracle"]
+
+    def setUp(self):
+        self.orb = CardFactory(name="Static Orb")
+        self.fable = CardFactory(
+            name="Fable of the Mirror-Breaker // Reflection of Kiki-Jiki"
+        )
+        AlternateName.objects.create(
+            name="Fable of the Mirror-Breaker", card=self.fable
+        )
+
+    def test_exact_names(self):
+        with self.assertNumQueries(1, using="oracle"):
+            cards = get_cards_by_names(["Static Orb"])
+
+        self.assertEqual({"Static Orb": self.orb}, cards)
+
+    def test_names_are_case_insensitive(self):
+        cards = get_cards_by_names(["static orb", "STATIC ORB"])
+
+        self.assertEqual({"static orb": self.orb, "STATIC ORB": self.orb}, cards)
+
+    def test_alternate_names(self):
+        cards = get_cards_by_names(["Static Orb", "fable of the mirror-breaker"])
+
+        self.assertEqual(self.fable, cards["fable of the mirror-breaker"])
+
+    def test_unknown_names_are_left_out(self):
+        self.assertEqual({}, get_cards_by_names(["Foobar"]))
+
+    def test_number_of_queries_does_not_depend_on_names(self):
+        names = [CardFactory(name=f"Card {i}").name.upper() for i in range(10)]
+
+        with self.assertNumQueries(4, using="oracle"):
+            cards = get_cards_by_names(
+                names + ["Fable of the Mirror-Breaker", "Foobar"]
+            )
+
+        self.assertEqual(11, len(cards))
+
+
+@override_settings(ORACLE_CARD_INDEX=True)
+class CardIndexTestCase(TestCase):
+    databases = ["oracle"]
+
+    def setUp(self):
+        reset_card_index()
+        self.addCleanup(reset_card_index)
+        self.orb = CardFactory(name="Static Orb")
+        self.fable = CardFactory(
+            name="Fable of the Mirror-Breaker // Reflection of Kiki-Jiki"
+        )
+        AlternateName.objects.create(
+            name="Fable of the Mirror-Breaker", card=self.fable
+        )
+        AlternateName.objects.create(name="Static Orb", card=self.fable)
+
+    def test_get_card_by_name(self):
+        self.assertEqual(self.orb, get_card_by_name("Static Orb"))
+        self.assertEqual(self.orb, get_card_by_name("sTATIC oRB"))
+        self.assertEqual(self.fable, get_card_by_name("fable of the mirror-breaker"))
+
+    def test_exact_match(self):
+        self.assertEqual(self.orb, get_card_by_name("Static Orb", exact_match=True))
+        with self.assertRaises(Card.DoesNotExist):
+            get_card_by_name("static orb", exact_match=True)
+
+    def test_unknown_card(self):
+        with self.assertRaises(Card.DoesNotExist):
+            get_card_by_name("Foobar")
+
+    def test_get_cards_by_names(self):
+        cards = get_cards_by_names(["static orb", "Fable of the Mirror-Breaker", "Foo"])
+
+        self.assertEqual(
+            {"static orb": self.orb, "Fable of the Mirror-Breaker": self.fable}, cards
+        )
+
+    def test_index_is_built_once(self):
+        get_card_index()
+        with self.assertNumQueries(0, using="oracle"):
+            get_card_by_name("Static Orb")
+            get_cards_by_names(["Static Orb", "Foo"])
+
+    def test_non_ascii_names_are_case_insensitive(self):
+        lorien = CardFactory(name="Lórien Revealed")
+        reset_card_index()
+
+        self.assertEqual(lorien, get_card_by_name("LÓRIEN REVEALED"))
+
+
+class CardSnapshotTestCase(TestCase):
+    databases = ["oracle"]
+
+    def setUp(self):
+        self.orb = CardFactory(name="Static Orb", mana_cost="{3}", mana_value=3)
+        self.fable = CardFactory(
+            name="Fable of the Mirror-Breaker // Reflection of Kiki-Jiki"
+        )
+        self.lorien = CardFactory(name="Lórien Revealed")
+        AlternateName.objects.create(
+            name="Fable of the Mirror-Breaker", card=self.fable
+        )
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "oracle.snapshot")
+
+    def write_snapshot(self):
+        write_card_snapshot(
+            self.path,
+            Card.objects.all(),
+            AlternateName.objects.values_list("name", "card_id"),
+        )
+        return CardSnapshot.open(self.path)
+
+    def test_get_card(self):
+        snapshot = self.write_snapshot()
+
+        card = snapshot.get("Static Orb")
+        self.assertEqual(self.orb, card)
+        for field in Card._meta.concrete_fields:
+            self.assertEqual(
+                getattr(self.orb, field.attname), getattr(card, field.attname)
+            )
+        self.assertEqual(3, len(snapshot))
+
+    def test_names_are_case_insensitive(self):
+        snapshot = self.write_snapshot()
+
+        self.assertEqual(self.orb, snapshot.get("static ORB"))
+        self.assertEqual(self.lorien, snapshot.get("LÓRIEN REVEALED"))
+        self.assertEqual(self.fable, snapshot.get("fable of the mirror-breaker"))
+
+    def test_exact_match(self):
+        snapshot = self.write_snapshot()
+
+        self.assertEqual(self.orb, snapshot.get("Static Orb", exact_match=True))
+        self.assertIsNone(snapshot.get("static orb", exact_match=True))
+
+    def test_unknown_card(self):
+        snapshot = self.write_snapshot()
+
+        self.assertIsNone(snapshot.get("Foobar"))
+        self.assertIsNone(snapshot.get(""))
+
+    def test_empty_snapshot(self):
+        Card.objects.all().delete()
+
+        self.assertIsNone(self.write_snapshot().get("Static Orb"))
+
+    def test_invalid_file(self):
+        with open(self.path, "wb") as f:
+            f.write(b"SQLite format 3\x00")
+
+        with self.assertRaises(ValueError):
+            CardSnapshot.open(self.path)
+
+    def test_scryfall_import_writes_snapshot(self):
+        f = os.path.join(os.path.dirname(__file__), "testdata.json")
+        call_command(
+            "scryfall_import", stdout=io.StringIO(), scryfall_dump=f, snapshot=self.path
+        )
+
+        snapshot = CardSnapshot.open(self.path)
+        card = snapshot.get("static orb")
+        self.assertEqual("0004ebd0-dfd6-4276-b4a6-de0003e94237", str(card.oracle_id))
+        self.assertEqual("{3}", card.mana_cost)
+        self.assertEqual(
+            "c0957e5e-c71b-439c-931c-9f55d2f76ace",
+            str(snapshot.get("Fable of the Mirror-Breaker").oracle_id),
+        )
+
+    def test_card_index_uses_snapshot(self):
+        self.write_snapshot()
+        reset_card_index()
+        self.addCleanup(reset_card_index)
+
+        with self.settings(ORACLE_CARD_INDEX=True, ORACLE_CARD_SNAPSHOT=self.path):
+            with self.assertNumQueries(0, using="oracle"):
+                self.assertIsInstance(get_card_index(), CardSnapshot)
+                self.assertEqual(self.orb, get_card_by_name("static orb"))
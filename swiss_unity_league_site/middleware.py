@@ -0,0 +1,140 @@
+# Copyright 2026 Leonin League
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import contextlib
+import logging
+import re
+import time
+
+from django.conf import settings
+from django.db import connections
+from django.http.request import HttpRequest
+
+from prometheus_client import Histogram
+
+logger = logging.getLogger(__name__)
+
+view_queries = Histogram(
+    "django_view_db_queries",
+    "Number of database queries issued by a request, by view",
+    ["view"],
+    buckets=[1, 2, 5, 10, 20, 50, 100, 200, 500, 1000],
+)
+
+view_db_duration = Histogram(
+    "django_view_db_duration_seconds",
+    "Total duration of the database queries issued by a request, by view",
+    ["view"],
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5],
+)
+
+UNRESOLVED_VIEW = "<unresolved>"
+
+# Number of repeated queries that are logged when a request exceeds its budget
+TOP_FINGERPRINTS = 5
+
+_PLACEHOLDER_LIST_RE = re.compile(r"\(\s*%s(?:\s*,\s*%s)*\s*\)")
+_NUMBER_RE = re.compile(r"\b\d+\b")
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+
+
+def sql_fingerprint(sql: str) -> str:
+    """Returns the SQL with its literals and parameters replaced by "?".
+
+    Queries that only differ by their parameters, including the length of
+    "IN (...)" lists, share the same fingerprint.
+
+    >>> sql_fingerprint("SELECT * FROM a WHERE id IN (%s, %s) AND b = 'x' LIMIT 21")
+    'SELECT * FROM a WHERE id IN (...) AND b = ? LIMIT ?'
+    """
+    sql = _PLACEHOLDER_LIST_RE.sub("(...)", sql)
+    sql = _STRING_RE.sub("?", sql)
+    return _NUMBER_RE.sub("?", sql).replace("%s", "?")
+
+
+class QueryRecorder:
+    """Database execute wrapper counting and timing the queries it sees."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.queries = collections.Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            self.queries[sql] += 1
+
+    def top_fingerprints(self, n: int) -> list[tuple[str, int]]:
+        # Fingerprints are only computed here, to keep the wrapper cheap
+        fingerprints = collections.Counter()
+        for sql, count in self.queries.items():
+            fingerprints[sql_fingerprint(sql)] += count
+        return fingerprints.most_common(n)
+
+
+def _view_name(request: HttpRequest) -> str:
+    resolver_match = getattr(request, "resolver_match", None)
+    if resolver_match is None:
+        return UNRESOLVED_VIEW
+    return resolver_match.view_name
+
+
+class QueryCountMiddleware:
+    """Exports the number of queries and the DB time of each request, by view.
+
+    Requests issuing more than settings.QUERY_BUDGET queries are logged along
+    with their most repeated queries, which usually point at an N+1 problem.
+    """
+
+    def __init__(self, get_response, query_budget=None):
+        self.get_response = get_response
+        if query_budget is None:
+            query_budget = settings.QUERY_BUDGET
+        self.query_budget = query_budget
+
+    def __call__(self, request: HttpRequest):
+        recorder = QueryRecorder()
+        with contextlib.ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            response = self.get_response(request)
+
+        view = _view_name(request)
+        view_queries.labels(view).observe(recorder.count)
+        view_db_duration.labels(view).observe(recorder.duration)
+
+        if recorder.count > self.query_budget:
+            top = "\n".join(
+                f"  {count} x {fingerprint}"
+                for fingerprint, count in recorder.top_fingerprints(TOP_FINGERPRINTS)
+            )
+            logger.warning(
+                "%s %s (%s) issued %d queries, above the budget of %d, in %.3fs. "
+                "Most repeated queries:\n%s",
+                request.method,
+                request.path,
+                view,
+                recorder.count,
+                self.query_budget,
+                recorder.duration,
+                top,
+            )
+
+        return response
@@ -130,6 +130,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django_prometheus.middleware.PrometheusBeforeMiddleware",
+    "swiss_unity_league_site.middleware.QueryCountMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -146,6 +147,10 @@ MIDDLEWARE = [
     "hijack.middleware.HijackUserMiddleware",
 ]
 
+# Requests issuing more queries than this are logged by QueryCountMiddleware,
+# with their most repeated queries.
+QUERY_BUDGET = int(os.environ.get("QUERY_BUDGET", 50))
+
 ROOT_URLCONF = "swiss_unity_league_site.urls"
 
 TEMPLATES = [
@@ -201,6 +206,14 @@ DATABASES = {
 }
 DATABASE_ROUTERS = ["oracle.db_routers.OracleRouter"]
 
+# Serve the card lookups from an in-memory index of the (read-only) oracle
+# database, see oracle/index.py.
+ORACLE_CARD_INDEX = True
+
+# Compact snapshot of the oracle database written by scryfall_import, which the
+# card index memory-maps when it exists (see oracle/snapshot.py).
+ORACLE_CARD_SNAPSHOT = os.path.join(BASE_DIR, "oracle.snapshot")
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
@@ -329,7 +342,9 @@ CACHES = {
 if cache_location := os.getenv("CACHE_LOCATION"):
     CACHES = {
         "default": {
-            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            # File based cache, with the hot keys also kept in the memory of
+            # each worker.
+            "BACKEND": "championship.cache_backend.TwoTierCache",
             "LOCATION": cache_location,
         }
     }
@@ -385,6 +400,10 @@ if "test" in sys.argv or "pytest" in sys.modules:
         "BACKEND": "geo.tests.utils.FakeGeocoder",
     }
 
+    # Tests create their own cards, which the card index would not see
+    ORACLE_CARD_INDEX = False
+    ORACLE_CARD_SNAPSHOT = None
+
     # Use a fast, insecure password hasher
     PASSWORD_HASHERS = [
         "django.contrib.auth.hashers.MD5PasswordHasher",
@@ -393,6 +412,7 @@ if "test" in sys.argv or "pytest" in sys.modules:
     # Those middleware are not needed in tests but slow down everything
     middleware_to_remove = [
         "django_prometheus.middleware.PrometheusBeforeMiddleware",
+        "swiss_unity_league_site.middleware.QueryCountMiddleware",
         "django.middleware.security.SecurityMiddleware",
         "whitenoise.middleware.WhiteNoiseMiddleware",
         "auditlog.middleware.AuditlogMiddleware",
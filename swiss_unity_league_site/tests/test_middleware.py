@@ -0,0 +1,107 @@
+# Copyright 2026 Leonin League
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+
+from django.contrib.auth.models import User
+from django.test import RequestFactory, TestCase
+from django.urls import resolve
+
+from prometheus_client import REGISTRY
+
+from swiss_unity_league_site.middleware import (
+    UNRESOLVED_VIEW,
+    QueryCountMiddleware,
+    sql_fingerprint,
+)
+
+
+def issue_queries(count):
+    def get_response(request):
+        for i in range(count):
+            User.objects.filter(pk=i).exists()
+        return "response"
+
+    return get_response
+
+
+class QueryCountMiddlewareTestCase(TestCase):
+    def setUp(self):
+        # Logging is disabled in tests, but we want to check the budget warnings
+        logging.disable(logging.NOTSET)
+        self.addCleanup(logging.disable, logging.CRITICAL)
+
+    def get_request(self, path="/"):
+        request = RequestFactory().get(path)
+        request.resolver_match = resolve(path)
+        return request
+
+    def sample(self, name, view):
+        return REGISTRY.get_sample_value(name, {"view": view}) or 0
+
+    def test_counts_queries_per_view(self):
+        request = self.get_request()
+        view = request.resolver_match.view_name
+        count_before = self.sample("django_view_db_queries_count", view)
+        sum_before = self.sample("django_view_db_queries_sum", view)
+
+        response = QueryCountMiddleware(issue_queries(3), query_budget=10)(request)
+
+        self.assertEqual("response", response)
+        self.assertEqual(
+            count_before + 1, self.sample("django_view_db_queries_count", view)
+        )
+        self.assertEqual(
+            sum_before + 3, self.sample("django_view_db_queries_sum", view)
+        )
+        self.assertEqual(
+            count_before + 1, self.sample("django_view_db_duration_seconds_count", view)
+        )
+
+    def test_unresolved_requests(self):
+        request = RequestFactory().get("/not-found")
+        count_before = self.sample("django_view_db_queries_count", UNRESOLVED_VIEW)
+
+        QueryCountMiddleware(issue_queries(0), query_budget=10)(request)
+
+        self.assertEqual(
+            count_before + 1,
+            self.sample("django_view_db_queries_count", UNRESOLVED_VIEW),
+        )
+
+    def test_requests_within_budget_are_not_logged(self):
+        with self.assertNoLogs("swiss_unity_league_site.middleware"):
+            QueryCountMiddleware(issue_queries(3), query_budget=3)(self.get_request())
+
+    def test_requests_above_budget_are_logged(self):
+        with self.assertLogs("swiss_unity_league_site.middleware", "WARNING") as logs:
+            QueryCountMiddleware(issue_queries(4), query_budget=3)(self.get_request())
+
+        [message] = logs.output
+        self.assertIn("issued 4 queries, above the budget of 3", message)
+        self.assertIn('4 x SELECT ? AS "a" FROM "auth_user"', message)
+
+
+class SqlFingerprintTestCase(TestCase):
+    def test_literals_are_removed(self):
+        self.assertEqual(
+            "SELECT * FROM a WHERE b = ? AND c = ? LIMIT ?",
+            sql_fingerprint("SELECT * FROM a WHERE b = 'it''s' AND c = 12 LIMIT 21"),
+        )
+
+    def test_in_lists_of_any_length_match(self):
+        self.assertEqual(
+            sql_fingerprint("SELECT * FROM a WHERE id IN (%s)"),
+            sql_fingerprint("SELECT * FROM a WHERE id IN (%s, %s, %s)"),
+        )
@@ -37,3 +37,12 @@ if d := os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
         pass
 
 application = get_wsgi_application()
+
+# With gunicorn --preload, the card index is built once in the master process
+# and inherited by the workers.
+from django.conf import settings  # noqa: E402
+
+if settings.ORACLE_CARD_INDEX:
+    from oracle.index import preload_card_index
+
+    preload_card_index()